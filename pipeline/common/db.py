@@ -2,13 +2,18 @@
 """
 
 # Standard library imports
+import io
 import logging
+import struct
 from datetime import datetime, timedelta
 from itertools import islice
 from math import ceil
-from typing import Generator
+from typing import Generator, Iterator, List, Tuple
 
 # Third-party imports
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from django.conf import settings
 from django.db import connections, models
 from django.db.utils import ProgrammingError, IntegrityError
@@ -119,6 +124,142 @@ def dynamic_bulk_insert(
     return num_inserted
 
 
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+"""The signature, flags and header extension length of a binary COPY stream."""
+
+PGCOPY_TRAILER = struct.pack("!h", -1)
+"""The trailer marking the end of a binary COPY stream."""
+
+
+def to_fixed_width_binary(values: np.ndarray) -> pa.BinaryArray:
+    """Reinterprets each element of a fixed-width NumPy
+    array as the raw bytes of a binary array element.
+
+    Args:
+        values (`np.ndarray`): The values, already in the
+            byte order expected by the consumer.
+
+    Returns:
+        (`pa.BinaryArray`): The binary array.
+    """
+    values = np.ascontiguousarray(values)
+    fixed = pa.FixedSizeBinaryArray.from_buffers(
+        pa.binary(values.itemsize), len(values), [None, pa.py_buffer(values)]
+    )
+    return fixed.cast(pa.binary())
+
+
+def encode_binary_copy(columns: List[pa.Array]) -> bytes:
+    """Encodes columns of equal length as rows in the PostgreSQL binary
+    COPY format without creating a Python object per row or field.
+
+    References:
+    - ["COPY | PostgreSQL Documentation"\
+        ](https://www.postgresql.org/docs/current/sql-copy.html#id-1.9.3.55.9.4)
+
+    Args:
+        columns (`list` of `pa.Array`): The columns. Each must be a
+            binary array whose elements are already encoded in the
+            binary representation of the column type, with nulls
+            representing SQL NULLs.
+
+    Returns:
+        (`bytes`): The encoded rows, excluding the stream header and trailer.
+    """
+    # Prefix each row with its field count
+    num_rows = len(columns[0])
+    parts = [to_fixed_width_binary(np.full(num_rows, len(columns), dtype=">i2"))]
+
+    # Prefix each field with its length, or -1 if null
+    for column in columns:
+        lengths = pc.fill_null(pc.binary_length(column), -1).to_numpy()
+        parts.append(to_fixed_width_binary(lengths.astype(">i4")))
+        parts.append(pc.fill_null(column, b""))
+
+    # Join fields of each row and return contiguous data buffer
+    rows = pc.binary_join_element_wise(*parts, b"")
+    _, offsets_buf, data_buf = rows.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int32)
+    start, end = offsets[rows.offset], offsets[rows.offset + len(rows)]
+    return data_buf[start:end].to_pybytes()
+
+
+def copy_insert(
+    chunks: Iterator[List[pa.Array]],
+    manager: models.Manager,
+    columns: List[Tuple[str, str, str]],
+    logger: logging.Logger,
+    db_alias: str = "default",
+) -> int:
+    """Bulk inserts records into a database table by streaming
+    them into a temporary staging table with a binary `COPY` and
+    then moving them into the destination table with a single
+    `INSERT ... ON CONFLICT DO NOTHING` per chunk. Avoids the
+    creation of a Django model instance per record.
+
+    Args:
+        chunks (`iterator` of `list` of `pa.Array`): The chunks of
+            records, as binary arrays ordered as in `columns` and
+            encoded as expected by `encode_binary_copy`.
+
+        manager (`models.Manager`): The Django Manager for the table (i.e.,
+            the interface through which database query operations for the
+            table are exposed).
+
+        columns (`list` of (`str`, `str`, `str`)): The destination column
+            name, staging column type and SQL expression used to select the
+            destination value from the staging table for each column.
+
+        logger (`logging.Logger`): A standard logger instance.
+
+        db_alias (`str`): The alias of the database to use for inserts.
+            Defaults to "default".
+
+    Returns:
+        (`int`): The number of rows inserted, excluding conflicts.
+    """
+    # Define staging table and statements
+    table_name = manager.model._meta.db_table
+    staging_name = f"{table_name}_staging"
+    staging_cols = ", ".join(f"{name} {type}" for name, type, _ in columns)
+    dest_cols = ", ".join(name for name, _, _ in columns)
+    select_exprs = ", ".join(expr for _, _, expr in columns)
+    insert_sql = (
+        f"INSERT INTO {table_name} ({dest_cols}) "
+        f"SELECT {select_exprs} FROM {staging_name} "
+        "ON CONFLICT DO NOTHING;"
+    )
+
+    # Copy and insert rows in chunks
+    num_inserted = 0
+    try:
+        with connections[db_alias].cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {staging_name};")
+            cursor.execute(f"CREATE TEMPORARY TABLE {staging_name} ({staging_cols});")
+            for chunk_ct, chunk in enumerate(chunks, start=1):
+                if not len(chunk[0]):
+                    continue
+                start_time = datetime.now()
+                stream = PGCOPY_HEADER + encode_binary_copy(chunk) + PGCOPY_TRAILER
+                cursor.copy_expert(
+                    f"COPY {staging_name} FROM STDIN (FORMAT binary);",
+                    io.BytesIO(stream),
+                )
+                cursor.execute(insert_sql)
+                num_inserted += cursor.rowcount
+                cursor.execute(f"TRUNCATE {staging_name};")
+                logger.info(
+                    f"Chunk {chunk_ct:,}, Size {len(chunk[0]):,} - Copied "
+                    f"and inserted in {datetime.now() - start_time}."
+                )
+            cursor.execute(f"DROP TABLE {staging_name};")
+    except (ProgrammingError, IntegrityError):
+        logger.error("Database copy failed.")
+        raise
+
+    return num_inserted
+
+
 def get_db_size(db_alias: str) -> str:
     """Reports the size of the given PostgreSQL database in megabytes (MB).
 
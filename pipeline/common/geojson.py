@@ -0,0 +1,181 @@
+"""Utilities for serializing GeoDataFrames as line-delimited GeoJSON.
+"""
+
+# Standard library imports
+import json
+from typing import Iterator, List, Optional, Tuple
+
+# Third-party imports
+import geopandas as gpd
+import numpy as np
+import shapely
+from shapely.geometry import mapping
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: object) -> str:
+    """Serializes an object as compact JSON, using the `orjson`
+    encoder when installed and the standard library otherwise.
+
+    Args:
+        obj (`object`): The object.
+
+    Returns:
+        (`str`): The JSON string.
+    """
+    if orjson is not None:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(obj, option=options).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def round_coordinates(geoms: np.ndarray, precision: int) -> np.ndarray:
+    """Rounds the coordinates of an array of geometries.
+
+    Args:
+        geoms (`np.ndarray` of `shapely.Geometry`): The geometries.
+
+        precision (`int`): The number of decimal places to keep.
+
+    Returns:
+        (`np.ndarray` of `shapely.Geometry`): The rounded geometries.
+    """
+    return shapely.transform(geoms, lambda coords: np.round(coords, precision))
+
+
+def tile_resolution(max_zoom: int, extent: int = 4096) -> Tuple[float, int]:
+    """Computes the width of one vector tile unit at the given
+    zoom level, in degrees of longitude, and the number of decimal
+    places needed to keep coordinates at or below that resolution.
+
+    References:
+    - ["Vector tiles standards"](https://docs.mapbox.com/data/tilesets/guides/vector-tiles-standards/)
+
+    Args:
+        max_zoom (`int`): The zoom level.
+
+        extent (`int`): The number of units across each tile.
+            Defaults to 4,096, the extent used by Mapbox.
+
+    Returns:
+        (`tuple` of `float`, `int`): The resolution and
+            number of decimal places.
+    """
+    resolution = 360 / (2**max_zoom * extent)
+    return resolution, int(np.ceil(-np.log10(resolution)))
+
+
+def simplify_for_zoom(geoms: np.ndarray, max_zoom: int) -> Tuple[np.ndarray, int]:
+    """Simplifies geometries to the resolution of vector tiles at the
+    given maximum zoom level and then snaps their coordinates to a
+    grid of matching precision. When the polygons form a valid coverage
+    (i.e., they do not overlap), the coverage is simplified as a whole,
+    so that shared boundaries remain shared. Otherwise, each geometry
+    is simplified separately with its own topology preserved. Geometries
+    that would collapse when snapped are simplified but not snapped.
+
+    Args:
+        geoms (`np.ndarray` of `shapely.Geometry`): The geometries,
+            in geographic coordinates.
+
+        max_zoom (`int`): The maximum zoom level.
+
+    Returns:
+        (`tuple` of `np.ndarray`, `int`): The simplified geometries and
+            the number of decimal places kept in their coordinates.
+    """
+    # Determine tolerance and exclude missing geometries
+    resolution, decimals = tile_resolution(max_zoom)
+    simplified = np.asarray(geoms, dtype=object).copy()
+    has_geom = ~shapely.is_missing(simplified) & ~shapely.is_empty(simplified)
+    present = simplified[has_geom]
+
+    # Simplify the coverage as a whole if possible, and each geometry otherwise
+    if shapely.coverage_is_valid(present):
+        present = shapely.coverage_simplify(present, resolution)
+    else:
+        present = shapely.simplify(present, resolution, preserve_topology=True)
+
+    # Snap coordinates to grid, unless doing so collapses the geometry
+    snapped = shapely.set_precision(present, 10.0**-decimals)
+    simplified[has_geom] = np.where(shapely.is_empty(snapped), present, snapped)
+
+    return simplified, decimals
+
+
+def iter_geojson_lines(
+    data: gpd.GeoDataFrame,
+    index: bool = False,
+    precision: Optional[int] = None,
+    exact: bool = False,
+    chunk_size: int = 10_000,
+) -> Iterator[str]:
+    """Serializes a GeoDataFrame as line-delimited GeoJSON features,
+    yielding the lines of one chunk of rows at a time. Geometries are
+    serialized in bulk by GEOS and properties are read from column
+    arrays, with missing values written as `null`. Empty geometries
+    are written as `null`, as by `gpd.GeoDataFrame.iterfeatures`.
+
+    Args:
+        data (`gpd.GeoDataFrame`): The data.
+
+        index (`bool`): Whether to write the index as each
+            feature's "id". Defaults to `False`.
+
+        precision (`int`): The number of decimal places to which
+            coordinates are rounded. Defaults to `None`, in which
+            case coordinates are written at full precision.
+
+        exact (`bool`): Whether to write features byte-for-byte as
+            `json.dumps` writes the features of
+            `gpd.GeoDataFrame.iterfeatures`, rather than as compact
+            JSON. Much slower. Defaults to `False`.
+
+        chunk_size (`int`): The number of rows serialized at a
+            time. Defaults to 10,000.
+
+    Yields:
+        (`str`): The newline-delimited features of each chunk,
+            without a trailing newline.
+    """
+    # Determine property columns
+    prop_cols = [c for c in data.columns if c != data.geometry.name]
+
+    for start in range(0, len(data), chunk_size):
+        chunk = data.iloc[start : start + chunk_size]
+
+        # Convert properties to Python scalars, with missing values as `None`
+        props = chunk[prop_cols].astype(object)
+        props = props.where(~chunk[prop_cols].isna().to_numpy(), None)
+        records = [dict(zip(prop_cols, row)) for row in props.to_numpy()]
+
+        # Drop empty geometries and round coordinates if requested
+        geoms = chunk.geometry.to_numpy()
+        geoms = np.where(shapely.is_empty(geoms), None, geoms)
+        if precision is not None:
+            geoms = round_coordinates(geoms, precision)
+
+        # Assemble features, starting with the feature ids if requested
+        ids = chunk.index.astype(str).tolist() if index else [None] * len(chunk)
+        lines: List[str] = []
+        if exact:
+            for fid, record, geom in zip(ids, records, geoms):
+                feature = {} if fid is None else {"id": fid}
+                feature["type"] = "Feature"
+                feature["properties"] = record
+                feature["geometry"] = None if geom is None else mapping(geom)
+                lines.append(json.dumps(feature))
+        else:
+            geojsons = shapely.to_geojson(geoms)
+            for fid, record, geojson in zip(ids, records, geojsons):
+                prefix = "{" if fid is None else f'{{"id":{_dumps(fid)},'
+                lines.append(
+                    f'{prefix}"type":"Feature","properties":{_dumps(record)},'
+                    f'"geometry":{geojson or "null"}}}'
+                )
+
+        yield "\n".join(lines)
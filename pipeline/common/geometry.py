@@ -0,0 +1,52 @@
+"""Utilities for normalizing arrays of geometries.
+"""
+
+# Third-party imports
+import numpy as np
+import shapely
+
+_AREA_TOLERANCE = 1e-9
+"""The largest share of a geometry's area that a buffer may remove."""
+
+
+def normalize_polygons(geoms: np.ndarray, buffer_distance: float = 0) -> np.ndarray:
+    """Normalizes an array of polygonal geometries in bulk. Invalid
+    geometries are repaired, keeping their polygonal parts; all
+    geometries are then buffered by the given distance, if any;
+    and finally, Polygons are promoted to MultiPolygons. Where a
+    buffer would remove more than a negligible share of a geometry's
+    area, as GEOS may do for very small distances because of floating
+    point precision, the unbuffered geometry is kept instead. Missing
+    geometries remain missing.
+
+    Args:
+        geoms (`np.ndarray` of `shapely.Geometry`): The geometries.
+
+        buffer_distance (`float`): The distance by which to buffer
+            each geometry, in the units of its coordinates. Defaults
+            to 0, in which case geometries are not buffered.
+
+    Returns:
+        (`np.ndarray` of `shapely.Geometry`): The normalized geometries.
+    """
+    # Copy geometries to avoid modifying the input
+    geoms = np.array(geoms, dtype=object)
+
+    # Repair invalid geometries
+    invalid = ~shapely.is_valid(geoms) & ~shapely.is_missing(geoms)
+    geoms[invalid] = shapely.make_valid(
+        geoms[invalid], method="structure", keep_collapsed=False
+    )
+
+    # Buffer geometries, unless doing so removes part of their area
+    if buffer_distance:
+        buffered = shapely.buffer(geoms, buffer_distance)
+        area = shapely.area(geoms)
+        collapsed = shapely.area(buffered) < area - area * _AREA_TOLERANCE
+        geoms = np.where(collapsed, geoms, buffered)
+
+    # Promote Polygons to MultiPolygons
+    is_polygon = shapely.get_type_id(geoms) == shapely.GeometryType.POLYGON
+    geoms[is_polygon] = shapely.multipolygons(geoms[is_polygon][:, np.newaxis])
+
+    return geoms
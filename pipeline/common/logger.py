@@ -3,6 +3,7 @@
 
 # Standard library imports
 import logging
+from typing import List
 
 
 class LoggerFactory:
@@ -39,3 +40,35 @@ class LoggerFactory:
         logger.addHandler(ch)
 
         return logger
+
+
+class RecordCollector(logging.Handler):
+    """Collects log records in memory so they can be
+    replayed by another process once work has finished.
+    """
+
+    def __init__(self) -> None:
+        """Initializes a new instance of a `RecordCollector`.
+
+        Args:
+            `None`
+
+        Returns:
+            `None`
+        """
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Stores the log record after resolving its message.
+
+        Args:
+            record (`logging.LogRecord`): The log record.
+
+        Returns:
+            `None`
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
@@ -2,26 +2,47 @@
 """
 
 # Standard library imports
+import base64
 import csv
 import glob
+import hashlib
 import io
 import json
 import os
 import tempfile
+import uuid
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 from zipfile import BadZipFile, ZipFile
 
 # Third-party imports
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from django.conf import settings
 from google.api_core.exceptions import NotFound
 from google.cloud import storage
+from pyarrow import dataset as ds
+from pyarrow import feather
 from pyarrow import parquet as pq
 
+# Application imports
+from common.geojson import iter_geojson_lines
+
 
 class IFileStrategy(ABC):
     """An abstract strategy for yielding the contents of a file."""
@@ -185,6 +206,32 @@ class FileSystemHelper(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def checksum(
+        self,
+        file_name: str,
+        root_dir: Union[Path, str] = settings.DATA_DIR,
+    ) -> str:
+        """Computes a checksum of the file's contents.
+
+        Args:
+            file_name (`str`): The file name, representing the
+                relative path to the file within the root directory.
+
+            root_dir (`pathlib.Path` | `str`): The designated
+                parent/top-most directory of the file system.
+                Defaults to the data directory defined in the
+                Django settings module that corresponds to
+                the current development environment.
+
+        Raises:
+            (`FileNotFoundError`) if the file does not exist.
+
+        Returns:
+            (`str`): The hexadecimal MD5 digest of the file.
+        """
+        raise NotImplementedError
+
 
 class LocalFileSystemHelper(FileSystemHelper):
     """Concrete class for accessing local file systems."""
@@ -234,7 +281,10 @@ class LocalFileSystemHelper(FileSystemHelper):
         mode: str = "r",
         zip_file_path: Optional[str] = None,
     ) -> Iterator[io.IOBase]:
-        """Opens a file with the given name and mode.
+        """Opens a file with the given name and mode. Unzipped files
+        opened for writing are written to a temporary file in the same
+        directory, which replaces the destination only once the write
+        completes, so that concurrent readers never see a partial file.
 
         Args:
             file_name (`str`): The file name, representing the
@@ -265,30 +315,79 @@ class LocalFileSystemHelper(FileSystemHelper):
         if not fpath.exists():
             Path(fpath).parent.mkdir(parents=True, exist_ok=True)
 
-        # Determine strategy necessary to yield file contents
+        # Write unzipped files atomically through a temporary sibling file
+        if zip_file_path is None and mode.startswith("w"):
+            tmp_fpath = fpath.with_name(f".{fpath.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                yield from UnzippedFileStrategy().execute(tmp_fpath, mode)
+                os.replace(tmp_fpath, fpath)
+            finally:
+                tmp_fpath.unlink(missing_ok=True)
+            return
+
+        # Otherwise, determine strategy necessary to yield file contents
         file_strategy: IFileStrategy = (
             ZippedFileStrategy()
             if zip_file_path is not None
             else UnzippedFileStrategy()
         )
 
-        # Execute strategy, returning file iterator
-        return file_strategy.execute(fpath, mode, zip_file_path=zip_file_path)
+        # Execute strategy, yielding file
+        yield from file_strategy.execute(fpath, mode, zip_file_path=zip_file_path)
+
+    def checksum(
+        self,
+        file_name: str,
+        root_dir: Union[Path, str] = settings.DATA_DIR,
+    ) -> str:
+        """Computes a checksum of the file's contents by
+        streaming the file from disk in chunks.
+
+        Args:
+            file_name (`str`): The file name, representing the
+                relative path to the file within the root directory.
+
+            root_dir (`pathlib.Path` | `str`): The absolute path to
+                the parent/top-most directory of the file
+                system. Defaults to the data directory
+                defined in the Django settings module that
+                corresponds to the current development environment.
+
+        Raises:
+            (`FileNotFoundError`) if the file does not exist.
+
+        Returns:
+            (`str`): The hexadecimal MD5 digest of the file.
+        """
+        with open(Path(root_dir) / file_name, "rb") as f:
+            return hashlib.file_digest(f, "md5").hexdigest()
 
 
 class GoogleCloudStorageHelper(FileSystemHelper):
     """Concrete class for accessing Google Cloud Storage."""
 
-    def __init__(self) -> None:
+    _CHUNK_SIZE = 8 * 1024 * 1024
+    """The number of bytes fetched or uploaded per request when
+    streaming blobs. Must be a multiple of 256 KiB.
+    """
+
+    _STREAMING_MODES = ("r", "rt", "rb", "w", "wt", "wb")
+    """The file opening methods supported when streaming blobs."""
+
+    def __init__(self, storage_client: Optional[storage.Client] = None) -> None:
         """Initializes a new instance of a `GoogleCloudStorageHelper`.
 
         Args:
-            `None`
+            storage_client (`storage.Client`): The Cloud Storage client.
+                Defaults to `None`, in which case a client is created
+                from the environment. Setting the `STORAGE_EMULATOR_HOST`
+                environment variable points the default client to a
+                local fake Cloud Storage server for testing.
 
         Returns:
             `None`
         """
-        self.storage_client = storage.Client()
+        self.storage_client = storage_client or storage.Client()
 
     def list_contents(
         self,
@@ -341,7 +440,12 @@ class GoogleCloudStorageHelper(FileSystemHelper):
         mode: str = "r",
         zip_file_path: Optional[str] = None,
     ) -> Iterator[io.IOBase]:
-        """Opens a file with the given name and mode.
+        """Opens a file with the given name and mode. Unzipped blobs
+        are streamed: reads fetch only the byte ranges requested, in
+        chunks, while writes are uploaded in resumable chunks as the
+        file is written. ZIP files, and modes unsupported by the Cloud
+        Storage file objects (e.g., appending), are instead downloaded
+        to and uploaded from a temporary file on disk.
 
         References:
         - [Cloud Storage Documentation | "Module fileio (2.14.0)"](https://cloud.google.com/python/docs/reference/storage/latest/google.cloud.storage.fileio)
@@ -369,6 +473,11 @@ class GoogleCloudStorageHelper(FileSystemHelper):
         bucket = self.storage_client.bucket(root_dir)
         blob = bucket.blob(file_name)
 
+        # Stream blob directly if possible
+        if zip_file_path is None and mode in self._STREAMING_MODES:
+            yield from self._stream_blob(blob, mode)
+            return
+
         # Determine strategy necessary to yield file contents
         file_strategy: IFileStrategy = (
             ZippedFileStrategy()
@@ -395,6 +504,66 @@ class GoogleCloudStorageHelper(FileSystemHelper):
             tf.close()
             os.remove(tf.name)
 
+    def _stream_blob(self, blob: storage.Blob, mode: str) -> Iterator[io.IOBase]:
+        """Opens a file object that streams the blob's contents.
+
+        Args:
+            blob (`storage.Blob`): The blob.
+
+            mode (`str`): The file opening method.
+
+        Raises:
+            (`FileNotFoundError`) if reading a blob that does not exist.
+
+        Yields:
+            (`io.IOBase`): A file object.
+        """
+        # Confirm blob exists if reading, decoding text with any UTF-8 BOM removed
+        if mode.startswith("r"):
+            try:
+                blob.reload()
+            except NotFound:
+                raise FileNotFoundError from None
+            kwargs = {} if mode == "rb" else {"encoding": "utf-8-sig"}
+
+        # Otherwise, permit binary writers to be flushed by callers (e.g., PyArrow)
+        else:
+            kwargs = {"ignore_flush": True} if mode == "wb" else {}
+
+        # Yield file object, completing any upload on exit
+        with blob.open(mode, chunk_size=self._CHUNK_SIZE, **kwargs) as f:
+            yield f
+
+    def checksum(
+        self,
+        file_name: str,
+        root_dir: Union[Path, str] = settings.DATA_DIR,
+    ) -> str:
+        """Fetches the checksum of the blob's contents from its
+        metadata, without downloading the blob itself.
+
+        Args:
+            file_name (`str`): The file/blob name, representing the
+                the relative path to the blob within the bucket.
+
+            root_dir (`pathlib.Path` | `str`): The cloud
+                storage bucket name. Defaults to the bucket
+                defined in the Django settings module.
+
+        Raises:
+            (`FileNotFoundError`) if the blob does not exist.
+
+        Returns:
+            (`str`): The hexadecimal MD5 digest of the blob, or of its
+                CRC32C checksum for composite blobs, which lack an MD5 hash.
+        """
+        blob = self.storage_client.bucket(root_dir).get_blob(file_name)
+        if blob is None:
+            raise FileNotFoundError
+        if blob.md5_hash:
+            return base64.b64decode(blob.md5_hash).hex()
+        return hashlib.md5(base64.b64decode(blob.crc32c)).hexdigest()
+
 
 class FileSystemHelperFactory:
     """Factory for fetching Singleton instance
@@ -561,49 +730,158 @@ class CsvDataReader(IterativeDataReader):
 class ParquetDataReader(IterativeDataReader):
     """An iterative reader for Parquet files. For more information, please see the
     [PyArrow documentation](https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile.html).
+
+    Files are read through seekable file objects, so only the footer
+    metadata and the column chunks of the row groups needed are fetched,
+    including from Cloud Storage.
     """
 
     def col_names(self, file_name: str, **kwargs) -> List[str]:
-        """Reads the Parquet file and then returns its columns.
+        """Reads the Parquet file's schema from its footer
+        and then returns its columns.
 
         Args:
             file_name (`str`): The relative path to the file
                 within the root directory.
 
-            **kwargs: Additional keywords passed to the underlying
-                pyarrow `ParquetFile` constructor.
+            **kwargs: Accepted for compatibility with other
+                `IterativeDataReader` instances and ignored.
 
         Returns:
             (`list` of `str`): The column names.
         """
         with self._file_helper.open_file(file_name, self._root_dir, mode="rb") as f:
-            pf: pq.ParquetFile = pq.ParquetFile(f)
-            try:
-                return [c.name for c in pf.schema]
-            finally:
-                pf.close()
+            return pq.read_schema(f).names
 
-    def iterate(self, file_name: str, **kwargs) -> Iterator[Dict[str, Any]]:
+    def iterate(
+        self,
+        file_name: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Any]] = None,
+        **kwargs,
+    ) -> Iterator[Dict[str, Any]]:
         """Reads the Parquet file and then returns a
         generator yielding one row at a time.
 
-         Args:
+        Args:
             file_name (`str`): The relative path to the file
                 within the root directory.
 
-            **kwargs: Additional keywords passed to the underlying
-                pyarrow `ParquetFile` constructor.
+            columns (`list` of `str`): The columns to read. Defaults
+                to `None`, in which case all columns are read.
+
+            filters (`list`): Row filters in the disjunctive normal
+                form accepted by `pyarrow.parquet.read_table` (e.g.,
+                `[("geography_type", "=", "county")]`). Defaults to
+                `None`, in which case all rows are read.
+
+            **kwargs: Accepted for compatibility with other
+                `IterativeDataReader` instances and ignored.
+
+        Yields:
+            (`dict`): The rows, keyed by column name.
+        """
+        for batch in self.iter_batches(
+            file_name, settings.PQ_CHUNK_SIZE, columns=columns, filters=filters
+        ):
+            yield from batch.to_pylist()
+
+    def iter_batches(
+        self,
+        file_name: str,
+        batch_size: int = settings.PQ_CHUNK_SIZE,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Any]] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Reads the Parquet file and then returns a
+        generator yielding one record batch at a time.
+        When filtering, row groups whose column statistics
+        exclude every matching row are skipped without
+        being fetched.
+
+        Args:
+            file_name (`str`): The relative path to the file
+                within the root directory.
+
+            batch_size (`int`): The maximum number of rows in each
+                batch. Defaults to the value defined in configuration
+                settings.
+
+            columns (`list` of `str`): The columns to read. Defaults
+                to `None`, in which case all columns are read.
+
+            filters (`list`): Row filters in the disjunctive normal
+                form accepted by `pyarrow.parquet.read_table` (e.g.,
+                `[("geography_type", "=", "county")]`). Defaults to
+                `None`, in which case all rows are read.
+
+        Yields:
+            (`pa.RecordBatch`): The record batches.
+        """
+        with self._file_helper.open_file(file_name, self._root_dir, mode="rb") as f:
+            # Read all rows if no filters given
+            if not filters:
+                pf = pq.ParquetFile(f)
+                yield from pf.iter_batches(batch_size, columns=columns)
+                return
+
+            # Otherwise, read matching rows from row groups that may contain them
+            fragment = ds.ParquetFileFormat().make_fragment(pa.PythonFile(f, mode="r"))
+            yield from fragment.to_batches(
+                columns=columns,
+                filter=pq.filters_to_expression(filters),
+                batch_size=batch_size,
+            )
+
+    def num_rows(self, file_name: str) -> int:
+        """Reports the number of rows in the Parquet
+        file using only the file's metadata.
+
+        Args:
+            file_name (`str`): The relative path to the file
+                within the root directory.
+
+        Returns:
+            (`int`): The number of rows.
+        """
+        with self._file_helper.open_file(file_name, self._root_dir, mode="rb") as f:
+            return pq.ParquetFile(f).metadata.num_rows
+
+    def take_rows(
+        self,
+        file_name: str,
+        indices: Sequence[int],
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Reads the rows at the given positions from the Parquet file,
+        decoding only the row groups that contain at least one of them.
+
+        Args:
+            file_name (`str`): The relative path to the file
+                within the root directory.
+
+            indices (`list` of `int`): The row positions
+                within the file as a whole.
+
+            columns (`list` of `str`): The columns to read. Defaults
+                to `None`, in which case all columns are read.
 
         Yields:
-            (`list` of `dict`): The GeoJSON features.
+            (`pa.RecordBatch`): The selected rows of each
+                row group, in the order of the file.
         """
+        indices = np.sort(np.asarray(indices, dtype=np.int64))
         with self._file_helper.open_file(file_name, self._root_dir, mode="rb") as f:
             pf = pq.ParquetFile(f)
-            pf_iter = pf.iter_batches(settings.PQ_CHUNK_SIZE)
-            for batch in pf_iter:
-                row_list = batch.to_pylist()
-                for row in row_list:
-                    yield row
+            offset = 0
+            for i in range(pf.metadata.num_row_groups):
+                group_size = pf.metadata.row_group(i).num_rows
+                start, end = np.searchsorted(indices, [offset, offset + group_size])
+                if end > start:
+                    table = pf.read_row_group(i, columns=columns)
+                    subset = table.take(pa.array(indices[start:end] - offset))
+                    yield from subset.to_batches()
+                offset += group_size
 
 
 class IterativeDataReaderFactory:
@@ -651,7 +929,11 @@ class IterativeDataReaderFactory:
 class DataLoader:
     """Loads entire file contents from data stores into Python objects."""
 
-    def __init__(self, root_dir: Union[Path, str] = settings.DATA_DIR) -> None:
+    def __init__(
+        self,
+        root_dir: Union[Path, str] = settings.DATA_DIR,
+        cache_dir: Optional[str] = settings.RAW_CACHE_DIRECTORY,
+    ) -> None:
         """Initializes a new instance of a `DataLoader`.
         Maintains a reference to a `FileSystemHelper` that
         reads from either Google Cloud or the local file
@@ -664,12 +946,91 @@ class DataLoader:
                 defined in the Django settings module that
                 corresponds to the current development environment.
 
+            cache_dir (`str`): The relative path within the root
+                directory at which Shapefiles and Excel files are
+                cached as (Geo)Parquet files once first read. Defaults
+                to the directory defined in the Django settings module.
+                Caching is disabled when `None`.
+
         Returns:
             `None`
         """
         self._root_dir = root_dir
+        self._cache_dir = cache_dir
         self._file_helper = FileSystemHelperFactory.get()
 
+    def _read_through_cache(
+        self,
+        file_name: str,
+        read_source: Callable[[], pd.DataFrame],
+        read_cache: Callable[[io.IOBase], pd.DataFrame],
+        **key_kwargs,
+    ) -> pd.DataFrame:
+        """Reads a file from its (Geo)Parquet cache, which is keyed by
+        the checksum of the file's contents and the options used to read
+        it. Because the key changes with the file contents, stale caches
+        are never read. On a cache miss, the file is read from the source
+        and the result is cached for subsequent reads. Results that cannot
+        be represented in Parquet (e.g., columns of mixed types) are
+        returned without being cached.
+
+        Any column selection and filters should be applied when reading
+        the source file and included in the options, so that each
+        distinct read is cached separately and never decodes more of
+        the source file than it needs.
+
+        Args:
+            file_name (`str`): The relative path to the source file
+                within the root directory.
+
+            read_source (`Callable`): A function reading the source file.
+
+            read_cache (`Callable`): A function reading the cached file
+                from a file-like object.
+
+            **key_kwargs: The options used to read the source file.
+
+        Returns:
+            (`pd.DataFrame`): The data.
+        """
+        # Read from source if caching disabled
+        if self._cache_dir is None:
+            return read_source()
+
+        # Resolve cache path from source file checksum and read options
+        key = json.dumps(
+            [self.checksum(file_name), key_kwargs], sort_keys=True, default=str
+        )
+        digest = hashlib.md5(key.encode()).hexdigest()
+        stem = Path(file_name).name.split(".")[0]
+        cache_fpath = f"{self._cache_dir}/{stem}_{digest}.parquet"
+
+        # Load cached file if it exists
+        try:
+            with self._file_helper.open_file(
+                cache_fpath, self._root_dir, mode="rb"
+            ) as f:
+                return read_cache(f)
+        except FileNotFoundError:
+            pass
+
+        # Otherwise, read source file and serialize to Parquet in memory,
+        # so that a failed conversion never leaves a partial cache behind
+        data = read_source()
+        try:
+            buffer = io.BytesIO()
+            data.to_parquet(buffer)
+        except (pa.ArrowException, TypeError, ValueError):
+            return data
+
+        # Write cache
+        with self._file_helper.open_file(cache_fpath, self._root_dir, mode="wb") as f:
+            f.write(buffer.getvalue())
+
+        # Read back from memory so that cache misses and hits yield the same result
+        buffer.seek(0)
+        return read_cache(buffer)
+
     def list_directory_contents(self, glob_pattern: str = "**/**?") -> List[str]:
         """Recursively lists all files within the root directory.
 
@@ -687,6 +1048,21 @@ class DataLoader:
         """
         return self._file_helper.list_contents(self._root_dir, glob_pattern)
 
+    def checksum(self, file_name: str) -> str:
+        """Computes a checksum of the file's contents.
+
+        Args:
+            file_name (`str`): The relative path to the file
+                within the root directory.
+
+        Raises:
+            (`FileNotFoundError`) if the file does not exist.
+
+        Returns:
+            (`str`): The hexadecimal MD5 digest of the file.
+        """
+        return self._file_helper.checksum(file_name, self._root_dir)
+
     def read_csv(
         self,
         file_name: str,
@@ -725,6 +1101,8 @@ class DataLoader:
         **kwargs,
     ) -> pd.DataFrame:
         """Loads a Microsoft Excel file into a Pandas DataFrame.
+        The parsed sheet is cached as a Parquet file for subsequent
+        reads of the same file contents with the same options.
 
         References:
         - https://pandas.pydata.org/docs/reference/api/pandas.read_excel.html
@@ -743,11 +1121,28 @@ class DataLoader:
         Returns:
             (`pd.DataFrame`): The `DataFrame`.
         """
-        mode = "r" if zip_file_path else "rb"
-        with self._file_helper.open_file(
-            file_name, self._root_dir, mode, zip_file_path
-        ) as f:
-            return pd.read_excel(f, **kwargs)
+        # Define function to parse source file
+        def read_source() -> pd.DataFrame:
+            mode = "r" if zip_file_path else "rb"
+            with self._file_helper.open_file(
+                file_name, self._root_dir, mode, zip_file_path
+            ) as f:
+                return pd.read_excel(f, **kwargs)
+
+        # Parse workbooks rather than individual sheets without caching
+        if kwargs.get("sheet_name", 0) is None or isinstance(
+            kwargs.get("sheet_name"), list
+        ):
+            return read_source()
+
+        return self._read_through_cache(
+            file_name,
+            read_source,
+            pd.read_parquet,
+            reader="excel",
+            zip_file_path=zip_file_path,
+            **kwargs,
+        )
 
     def read_json(
         self,
@@ -777,6 +1172,39 @@ class DataLoader:
         ) as f:
             return json.load(f, **kwargs)
 
+    def read_feather(
+        self, file_name: str, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Loads an Apache Arrow IPC (Feather) file into a Pandas DataFrame.
+        Local files are memory-mapped, so that uncompressed columns are
+        read directly from the operating system's page cache and shared
+        by every process reading the same file.
+
+        References:
+        - https://arrow.apache.org/docs/python/generated/pyarrow.feather.read_table.html
+
+        Args:
+            file_name (`str`): The relative path to the file
+                within the root directory.
+
+            columns (`list` of `str`): The columns to read. Defaults
+                to `None`, in which case all columns are read.
+
+        Raises:
+            (`FileNotFoundError`) if the file does not exist.
+
+        Returns:
+            (`pd.DataFrame`): The `DataFrame`.
+        """
+        # Memory-map local files
+        if isinstance(self._file_helper, LocalFileSystemHelper):
+            fpath = str(Path(self._root_dir) / file_name)
+            return feather.read_table(fpath, columns, memory_map=True).to_pandas()
+
+        # Otherwise, read through a file object
+        with self._file_helper.open_file(file_name, self._root_dir, "rb") as f:
+            return feather.read_table(f, columns).to_pandas()
+
     def read_parquet(
         self,
         file_name: str,
@@ -808,16 +1236,63 @@ class DataLoader:
         ) as f:
             return gpd.read_parquet(f, **kwargs)
 
+    @contextmanager
+    def _open_vector_source(
+        self, file_name: str, zip_file_path: Optional[str] = None
+    ) -> Iterator[Callable[[], Union[io.BytesIO, str]]]:
+        """Fetches a vector dataset (e.g., a Shapefile) so that it may
+        be read one or more times without fetching it again.
+
+        Args:
+            file_name (`str`): The relative path to the file
+                within the root directory.
+
+            zip_file_path (`str`): The path to the dataset
+                within a zip folder, if applicable. Defaults
+                to `None`.
+
+        Yields:
+            (`Callable`): A function returning a new source (i.e.,
+                a file-like object or path) from which to read the
+                dataset each time it is called.
+        """
+        # Hold file contents in memory if there is
+        # no need to reference subdirectories of a zipfile
+        if not zip_file_path:
+            with self._file_helper.open_file(file_name, self._root_dir, mode="rb") as f:
+                contents = f.read()
+            yield lambda: io.BytesIO(contents)
+            return
+
+        # Otherwise, create temp directory
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Open new file in directory and transfer contents of remote zipfile
+            tmp_fpath = f"{temp_dir}/tmp.zip"
+            with open(tmp_fpath, "wb") as tmp:
+                with self._file_helper.open_file(
+                    file_name, self._root_dir, mode="rb"
+                ) as f:
+                    tmp.write(f.read())
+
+            # Reference the zipped dataset
+            data_fpath = f"{tmp_fpath}!{zip_file_path}"
+            yield lambda: data_fpath
+
     def read_shapefile(
         self,
         file_name: str,
         zip_file_path: Optional[str] = None,
+        where: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        filter_values: Optional[Dict[str, Collection[Any]]] = None,
         **kwargs,
     ) -> gpd.GeoDataFrame:
         """Loads a Shapefile into a Geopandas GeoDataFrame.
 
         References:
         - https://geopandas.org/en/stable/docs/reference/api/geopandas.read_file.html
+        - https://pyogrio.readthedocs.io/en/latest/introduction.html#filter-records-by-attribute-value
+        - https://pyogrio.readthedocs.io/en/latest/introduction.html#read-a-subset-of-features
 
         Args:
             file_name (`str`): The relative path to the file
@@ -827,31 +1302,168 @@ class DataLoader:
                 within a zip folder, if applicable. Defaults
                 to `None`.
 
+            where (`str`): An OGR SQL `WHERE` clause used to filter
+                records as they are read (e.g., "STATEFP = '01'").
+                Defaults to `None`, in which case all records are read.
+
+            columns (`list` of `str`): The attribute columns to read,
+                in addition to the geometry. Defaults to `None`, in
+                which case all columns are read.
+
+            filter_values (`dict` of `str`, `Collection`): The values
+                permitted for one or more columns, for filters too large
+                to express as a `WHERE` clause (e.g., thousands of ids).
+                When provided, only those columns are read first, without
+                geometries, to find the matching features, and then only
+                the matching features are decoded. Defaults to `None`.
+
             **kwargs: Additional keywords to pass to the
                 underlying `geopandas.read_file` method.
 
+        The result is cached as a GeoParquet file for subsequent reads
+        of the same file contents with the same columns and filters.
+
         Returns:
             (`gpd.DataFrame`): The `GeoDataFrame`.
         """
-        # Instantiate GeoDataFrame directly from file-like object
-        # if there is no need to reference subdirectories of a zipfile
-        if not zip_file_path:
-            with self._file_helper.open_file(file_name, self._root_dir, mode="rb") as f:
-                return gpd.read_file(f, engine="pyogrio")
+        # Read through a cache keyed by the filters, so that a cache miss
+        # still decodes only the selected columns and matching features
+        return self._read_through_cache(
+            file_name,
+            lambda: self._decode_shapefile(
+                file_name, zip_file_path, where, columns, filter_values
+            ),
+            gpd.read_parquet,
+            reader="shapefile",
+            zip_file_path=zip_file_path,
+            where=where,
+            columns=columns,
+            filter_values={
+                col: sorted(map(str, values))
+                for col, values in (filter_values or {}).items()
+            },
+        )
 
-        # Otherwise, create temp directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Open new file in directory and transfer contents of remote zipfile
-            tmp_fpath = f"{temp_dir}/tmp.zip"
-            with open(tmp_fpath, "wb") as tmp:
-                with self._file_helper.open_file(
-                    file_name, self._root_dir, mode="rb"
-                ) as f:
-                    tmp.write(f.read())
+    def _decode_shapefile(
+        self,
+        file_name: str,
+        zip_file_path: Optional[str] = None,
+        where: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        filter_values: Optional[Dict[str, Collection[Any]]] = None,
+    ) -> gpd.GeoDataFrame:
+        """Decodes a Shapefile into a Geopandas GeoDataFrame,
+        pushing filters and column selection down to the reader.
 
-            # Read the zipped dataset as GeoDataFrame
-            data_fpath = f"{tmp_fpath}!{zip_file_path}"
-            return gpd.read_file(data_fpath, engine="pyogrio")
+        Args:
+            file_name (`str`): The relative path to the file
+                within the root directory.
+
+            zip_file_path (`str`): The path to the Shapefile
+                within a zip folder, if applicable. Defaults
+                to `None`.
+
+            where (`str`): An OGR SQL `WHERE` clause used to filter
+                records as they are read. Defaults to `None`.
+
+            columns (`list` of `str`): The attribute columns to read,
+                in addition to the geometry. Defaults to `None`, in
+                which case all columns are read.
+
+            filter_values (`dict` of `str`, `Collection`): The values
+                permitted for one or more columns. Defaults to `None`.
+
+        Returns:
+            (`gpd.DataFrame`): The `GeoDataFrame`.
+        """
+        with self._open_vector_source(file_name, zip_file_path) as source:
+            # Read all matching records if no values given to filter by
+            if not filter_values:
+                return gpd.read_file(
+                    source(), engine="pyogrio", where=where, columns=columns
+                )
+
+            # Otherwise, read filter columns alone to find matching features
+            attrs = gpd.read_file(
+                source(),
+                engine="pyogrio",
+                where=where,
+                columns=list(filter_values),
+                read_geometry=False,
+                fid_as_index=True,
+            )
+            is_match = np.ones(len(attrs), dtype=bool)
+            for col, values in filter_values.items():
+                is_match &= attrs[col].isin(values).to_numpy()
+
+            # Then decode the matching features only
+            return gpd.read_file(
+                source(),
+                engine="pyogrio",
+                fids=np.sort(attrs.index.to_numpy()[is_match]),
+                columns=columns,
+            )
+
+    def read_shapefiles(
+        self,
+        glob_pattern: str,
+        where: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        filter_values: Optional[Dict[str, Collection[Any]]] = None,
+        max_workers: Optional[int] = None,
+    ) -> gpd.GeoDataFrame:
+        """Loads all Shapefiles matching a glob pattern (e.g., one per
+        U.S. state) into a single Geopandas GeoDataFrame. The files
+        are read concurrently by a pool of threads, which is effective
+        because the underlying reader releases the GIL during I/O and
+        parsing, and are concatenated once all have been read.
+
+        Args:
+            glob_pattern (`str`): A relative path used to find the
+                files within the root directory. May contain
+                shell-like wildcards.
+
+            where (`str`): An OGR SQL `WHERE` clause used to filter
+                records as they are read. Defaults to `None`, in
+                which case all records are read.
+
+            columns (`list` of `str`): The attribute columns to read,
+                in addition to the geometry. Defaults to `None`, in
+                which case all columns are read.
+
+            filter_values (`dict` of `str`, `Collection`): The values
+                permitted for one or more columns. Only matching features
+                are decoded. Defaults to `None`, in which case all
+                records are read.
+
+            max_workers (`int`): The maximum number of threads used
+                to read the files. Defaults to `None`, in which case
+                the `ThreadPoolExecutor` default is used.
+
+        Raises:
+            (`FileNotFoundError`) if no files match the pattern.
+
+        Returns:
+            (`gpd.GeoDataFrame`): The `GeoDataFrame`, with records
+                ordered by file name in the order listed.
+        """
+        # Find files
+        file_names = self.list_directory_contents(glob_pattern)
+        if not file_names:
+            raise FileNotFoundError(f'No files found matching "{glob_pattern}".')
+
+        # Read files concurrently, preserving the order in which they were listed
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            gdfs = list(
+                executor.map(
+                    lambda f: self.read_shapefile(
+                        f, where=where, columns=columns, filter_values=filter_values
+                    ),
+                    file_names,
+                )
+            )
+
+        return pd.concat(gdfs)
 
 
 class DataWriter:
@@ -882,9 +1494,13 @@ class DataWriter:
         data: gpd.GeoDataFrame,
         zip_file_path: Optional[str] = None,
         index: bool = False,
+        precision: Optional[int] = None,
+        exact: bool = False,
     ) -> None:
         """Writes a line-delimited GeoJSON file to the
         designated file path within the root directory.
+        Features are serialized and written in chunks
+        of rows rather than one at a time.
 
         Args:
             file_name (`str`): The relative path to the file
@@ -900,23 +1516,42 @@ class DataWriter:
                 should be kept in the output GeoJSON lines.
                 Defaults to `False`.
 
+            precision (`int`): The number of decimal places to which
+                coordinates are rounded. Defaults to `None`, in which
+                case coordinates are written at full precision.
+
+            exact (`bool`): Whether to write features byte-for-byte
+                as the standard library's `json.dumps` would write them,
+                rather than as compact JSON. Defaults to `False`.
+
         Returns:
             `None`
         """
-        counter = 0
-        num_features = len(data)
         mode = "w"
-        parse_row = lambda r: (
-            json.dumps(r).encode() if zip_file_path else json.dumps(r)
-        )
+        chunks = iter_geojson_lines(data, index, precision, exact)
         with self._file_helper.open_file(
             file_name, self._root_dir, mode, zip_file_path
         ) as f:
-            for row in data.iterfeatures(drop_id=True):
-                f.write(parse_row(row))
-                counter += 1
-                if counter != num_features:
-                    f.write("\n")
+            for i, chunk in enumerate(chunks):
+                text = chunk if i == 0 else "\n" + chunk
+                f.write(text.encode() if zip_file_path else text)
+
+    def write_feather(self, file_name: str, data: pd.DataFrame) -> None:
+        """Writes an uncompressed Apache Arrow IPC (Feather) file to
+        the designated file path within the root directory. Leaving the
+        file uncompressed allows its columns to be memory-mapped.
+
+        Args:
+            file_name (`str`): The relative path to the file
+                within the root directory.
+
+            data (`pd.DataFrame`): The data.
+
+        Returns:
+            `None`
+        """
+        with self._file_helper.open_file(file_name, self._root_dir, "wb") as f:
+            data.reset_index(drop=True).to_feather(f, compression="uncompressed")
 
     def write_geoparquet(
         self,
@@ -25,6 +25,7 @@ class BaseConfig(Configuration):
 
     # Define default settings for batching and bulk operations
     PQ_CHUNK_SIZE = 1_000
+    COPY_CHUNK_SIZE = 25_000
     DB_REPLICATION_CHUNK_SIZE = 10_000
     EXPONENTIAL_SMOOTHING_FACTOR = 0.1
     TARGET_SECONDS_PER_BATCH = 5
@@ -46,6 +47,8 @@ class BaseConfig(Configuration):
         "place_populations_fpath": "raw/census/places/us_place_population_2020.csv",
         "county_subdivision_populations_fpath": "raw/census/county_subdivisions/us_county_subdivision_population_2020.csv",
     }
+    POPULATION_CACHE_DIRECTORY = "cache/population"
+    RAW_CACHE_DIRECTORY = "cache/raw"
 
     # Define settings to process raw datasets
     BUFFER_DEG = -10e-20
@@ -191,6 +194,8 @@ class BaseConfig(Configuration):
 
     # Define settings to load geographies and associations into database
     INTERSECTION_AREA_THRESHOLD_DEG = 0.02
+    SUBDIVIDE_MAX_VERTICES = 256
+    SUBDIVIDED_TARGET_TYPES = ["municipal utility", "rural cooperative", "state"]
     CLEAN_DATASETS = [
         {"name": "counties", "file": "clean/geoparquet/counties.geoparquet"},
         {
@@ -19,3 +19,6 @@ class TestConfig(BaseConfig):
 
     # Define file paths
     DATA_DIR = BaseConfig.BASE_DIR / "data"
+
+    # Disable caching of raw inputs so that test runs leave no artifacts
+    RAW_CACHE_DIRECTORY = None
@@ -2,18 +2,452 @@
 """
 
 # Standard library imports
-from typing import Dict, List
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
 
 # Third-party imports
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import shapely
 from django.conf import settings
 from django.db import connection
 
 # Application imports
+from common.storage import DataLoader
 from tax_credit.models import Geography
-from tax_credit.population import PopulationService
+from tax_credit.population import CentroidOverlapEngine, PopulationService
+
+
+class IntersectionEngine(ABC):
+    """An abstract engine for finding spatial intersections between
+    target and bonus geographies while excluding cases where the
+    borders touch or barely overlap due to geometry imprecisions.
+    """
+
+    INTERSECTION_COLUMNS = [
+        "target_id",
+        "target_population",
+        "bonus_id",
+        "bonus_population",
+    ]
+    """The columns of the DataFrame returned by `find_intersections`."""
+
+    def __init__(self) -> None:
+        """Initializes a new instance of an `IntersectionEngine`.
+
+        Args:
+            `None`
+
+        Returns:
+            `None`
+        """
+        self._geographies: Dict[str, gpd.GeoDataFrame] = {}
+
+    @abstractmethod
+    def _load_geographies(self, geography_type: str) -> gpd.GeoDataFrame:
+        """Loads all geographies of the given type.
+
+        Args:
+            geography_type (`str`): The geography type.
+
+        Returns:
+            (`gpd.GeoDataFrame`): The geographies, with at least
+                the columns "id" and "geometry".
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_intersections(self, target_type: str, bonus_type: str) -> pd.DataFrame:
+        """Finds spatial intersections between geographies
+        of the target type and geographies of the bonus type.
+
+        Args:
+            target_type (`str`): The type of target geographies to search.
+
+            bonus_type (`str`): The type of bonus geographies to search.
+
+        Returns:
+            (`pd.DataFrame`): The intersecting pairs, with the
+                columns given by `INTERSECTION_COLUMNS`.
+        """
+        raise NotImplementedError
+
+    def get_geographies(self, geography_type: str) -> gpd.GeoDataFrame:
+        """Fetches all geographies of the given type,
+        loading them only on the first request.
+
+        Args:
+            geography_type (`str`): The geography type.
+
+        Returns:
+            (`gpd.GeoDataFrame`): The geographies, with at least
+                the columns "id" and "geometry".
+        """
+        if geography_type not in self._geographies:
+            self._geographies[geography_type] = self._load_geographies(geography_type)
+        return self._geographies[geography_type]
+
+
+class PostGisIntersectionEngine(IntersectionEngine):
+    """Finds spatial intersections with a PostGIS self-join
+    on the geography database table. Targets of the configured
+    types are first subdivided into pieces with a bounded number
+    of vertices, so that large multipolygons (e.g., whole states)
+    are never intersected in full against many small bonus geographies.
+    """
+
+    def __init__(
+        self,
+        subdivided_target_types: List[str] = settings.SUBDIVIDED_TARGET_TYPES,
+        max_vertices: int = settings.SUBDIVIDE_MAX_VERTICES,
+    ) -> None:
+        """Initializes a new instance of a `PostGisIntersectionEngine`.
+
+        Args:
+            subdivided_target_types (`list` of `str`): The target geography
+                types to subdivide before joining. Defaults to the value
+                defined in configuration settings.
+
+            max_vertices (`int`): The maximum number of vertices in each
+                subdivided piece. Defaults to the value defined in
+                configuration settings.
+
+        Returns:
+            `None`
+        """
+        super().__init__()
+        self._subdivided_target_types = set(subdivided_target_types)
+        self._max_vertices = max_vertices
+
+    def _load_geographies(self, geography_type: str) -> gpd.GeoDataFrame:
+        """Loads the ids and geometries of all geographies
+        of the given type from the database.
+
+        Args:
+            geography_type (`str`): The geography type.
+
+        Returns:
+            (`gpd.GeoDataFrame`): The geographies.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT
+                    id,
+                    geometry,
+                    ST_SRID(geometry) AS srid
+                FROM tax_credit_geography
+                WHERE geography_type = %s;
+                """,
+                [geography_type],
+            )
+            records = cursor.fetchall()
+
+        df = pd.DataFrame(records, columns=["id", "geometry", "srid"])
+        df["geometry"] = df["geometry"].apply(shapely.from_wkb)
+        crs = f"EPSG:{records[0][-1]}" if records else None
+        return gpd.GeoDataFrame(df, geometry="geometry", crs=crs)
+
+    def find_intersections(self, target_type: str, bonus_type: str) -> pd.DataFrame:
+        """Finds spatial intersections between geographies
+        of the target type and geographies of the bonus type.
+        Candidate pairs are first selected by bounding box, then
+        the intersection of each pair is computed exactly once and
+        its area compared against the precomputed geography areas.
+
+        Args:
+            target_type (`str`): The type of target geographies to search.
+
+            bonus_type (`str`): The type of bonus geographies to search.
+
+        Returns:
+            (`pd.DataFrame`): The intersecting pairs.
+        """
+        if target_type in self._subdivided_target_types:
+            return self._find_partitioned_intersections(target_type, bonus_type)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                WITH candidates AS (
+                    SELECT
+                        target.id AS target_id,
+                        target.population AS target_population,
+                        target.area AS target_area,
+                        target.geometry AS target_geometry,
+                        bonus.id AS bonus_id,
+                        bonus.population AS bonus_population,
+                        bonus.area AS bonus_area,
+                        bonus.geometry AS bonus_geometry
+                    FROM tax_credit_geography target
+                    JOIN tax_credit_geography bonus
+                        ON target.geometry && bonus.geometry
+                    WHERE (
+                        target.geography_type = %s AND
+                        bonus.geography_type = %s
+                    )
+                ),
+                intersections AS MATERIALIZED (
+                    SELECT
+                        target_id,
+                        target_population,
+                        target_area,
+                        bonus_id,
+                        bonus_population,
+                        bonus_area,
+                        ST_AREA(
+                            ST_INTERSECTION(target_geometry, bonus_geometry)
+                        ) AS intersection_area
+                    FROM candidates
+                    WHERE ST_INTERSECTS(target_geometry, bonus_geometry)
+                )
+                SELECT
+                    target_id,
+                    target_population,
+                    bonus_id,
+                    bonus_population
+                FROM intersections
+                WHERE (
+                    intersection_area / LEAST(target_area, bonus_area) > %s
+                );
+                """,
+                [target_type, bonus_type, settings.INTERSECTION_AREA_THRESHOLD_DEG],
+            )
+            matches = cursor.fetchall()
+
+        return pd.DataFrame(matches, columns=self.INTERSECTION_COLUMNS)
+
+    def _find_partitioned_intersections(
+        self, target_type: str, bonus_type: str
+    ) -> pd.DataFrame:
+        """Finds spatial intersections after subdividing the target
+        geometries into a temporary table of spatially-indexed pieces.
+        Intersection areas are computed per piece and then summed for
+        each target-bonus pair, which is exact because the pieces of
+        a subdivided geometry do not overlap.
+
+        Args:
+            target_type (`str`): The type of target geographies to search.
+
+            bonus_type (`str`): The type of bonus geographies to search.
+
+        Returns:
+            (`pd.DataFrame`): The intersecting pairs.
+        """
+        with connection.cursor() as cursor:
+
+            # Subdivide target geometries into indexed pieces
+            cursor.execute("DROP TABLE IF EXISTS tax_credit_target_piece;")
+            cursor.execute(
+                """
+                CREATE TEMPORARY TABLE tax_credit_target_piece AS
+                SELECT
+                    id AS target_id,
+                    ST_SUBDIVIDE(geometry, %s) AS geometry
+                FROM tax_credit_geography
+                WHERE geography_type = %s;
+                """,
+                [self._max_vertices, target_type],
+            )
+            cursor.execute(
+                """
+                CREATE INDEX tax_credit_target_piece_geometry_idx
+                ON tax_credit_target_piece
+                USING gist(geometry);
+                """
+            )
+            cursor.execute("ANALYZE tax_credit_target_piece;")
+
+            # Join pieces to bonuses and re-aggregate per target-bonus pair
+            cursor.execute(
+                """
+                WITH piece_intersections AS (
+                    SELECT
+                        piece.target_id,
+                        bonus.id AS bonus_id,
+                        ST_AREA(
+                            ST_INTERSECTION(piece.geometry, bonus.geometry)
+                        ) AS intersection_area
+                    FROM tax_credit_target_piece piece
+                    JOIN tax_credit_geography bonus
+                        ON ST_INTERSECTS(piece.geometry, bonus.geometry)
+                    WHERE bonus.geography_type = %s
+                ),
+                pair_intersections AS (
+                    SELECT
+                        target_id,
+                        bonus_id,
+                        SUM(intersection_area) AS intersection_area
+                    FROM piece_intersections
+                    GROUP BY target_id, bonus_id
+                )
+                SELECT
+                    target.id AS target_id,
+                    target.population AS target_population,
+                    bonus.id AS bonus_id,
+                    bonus.population AS bonus_population
+                FROM pair_intersections pair
+                JOIN tax_credit_geography target ON target.id = pair.target_id
+                JOIN tax_credit_geography bonus ON bonus.id = pair.bonus_id
+                WHERE (
+                    pair.intersection_area /
+                    LEAST(target.area, bonus.area) > %s
+                );
+                """,
+                [bonus_type, settings.INTERSECTION_AREA_THRESHOLD_DEG],
+            )
+            matches = cursor.fetchall()
+            cursor.execute("DROP TABLE tax_credit_target_piece;")
+
+        return pd.DataFrame(matches, columns=self.INTERSECTION_COLUMNS)
+
+
+class LocalIntersectionEngine(IntersectionEngine):
+    """Finds spatial intersections in-process by loading geographies
+    from the cleaned geoparquet files and querying a Shapely STRtree.
+    Database ids and populations are attached to the geographies by
+    matching on the unique name and FIPS code of each geography type.
+    """
+
+    def __init__(self, reader: DataLoader) -> None:
+        """Initializes a new instance of a `LocalIntersectionEngine`.
+
+        Args:
+            reader (`DataLoader`): A client for reading the cleaned
+                geoparquet files from a local or cloud data store.
+
+        Returns:
+            `None`
+        """
+        super().__init__()
+        self._reader = reader
+
+    def _load_geographies(self, geography_type: str) -> gpd.GeoDataFrame:
+        """Loads all geographies of the given type from the cleaned
+        geoparquet files and attaches their database ids and populations.
+
+        Args:
+            geography_type (`str`): The geography type.
+
+        Returns:
+            (`gpd.GeoDataFrame`): The geographies, with the columns
+                "id", "population", "area" and "geometry".
+        """
+        # Map dataset names to their geography types
+        dataset_types = {
+            config["name"]: config["geography_type"] for config in settings.RAW_DATASETS
+        }
+
+        # Read geographies of the given type from each cleaned dataset
+        gdfs = [
+            self._reader.read_parquet(
+                config["file"], columns=["name", "fips", "geometry"]
+            )
+            for config in settings.CLEAN_DATASETS
+            if dataset_types.get(config["name"]) == geography_type
+        ]
+        gdf = pd.concat(gdfs, ignore_index=True)
+        gdf["fips"] = gdf["fips"].fillna("")
+
+        # Keep first occurrence of each geography, as done by the database load
+        gdf = gdf.drop_duplicates(subset=["name", "fips"])
+
+        # Attach database ids and populations
+        ids_df = pd.DataFrame.from_records(
+            Geography.objects.filter(geography_type=geography_type).values(
+                "id", "name", "fips", "population"
+            )
+        )
+        gdf = gdf.merge(ids_df, how="inner", on=["name", "fips"])
+
+        # Precompute geometry areas
+        gdf["area"] = shapely.area(gdf.geometry.to_numpy())
+
+        return gdf[["id", "population", "area", "geometry"]]
+
+    def find_intersections(self, target_type: str, bonus_type: str) -> pd.DataFrame:
+        """Finds spatial intersections between geographies of the
+        target type and geographies of the bonus type using a bulk
+        STRtree query followed by vectorized intersection areas.
+
+        Args:
+            target_type (`str`): The type of target geographies to search.
+
+            bonus_type (`str`): The type of bonus geographies to search.
+
+        Returns:
+            (`pd.DataFrame`): The intersecting pairs.
+        """
+        # Load geographies
+        targets = self.get_geographies(target_type)
+        bonuses = self.get_geographies(bonus_type)
+
+        # Find candidate pairs of intersecting geographies
+        tree = shapely.STRtree(bonuses.geometry.to_numpy())
+        target_idx, bonus_idx = tree.query(
+            targets.geometry.to_numpy(), predicate="intersects"
+        )
+
+        # Compute ratio of intersection area to smaller geography area
+        intersection_areas = shapely.area(
+            shapely.intersection(
+                targets.geometry.to_numpy()[target_idx],
+                bonuses.geometry.to_numpy()[bonus_idx],
+            )
+        )
+        min_areas = np.minimum(
+            targets["area"].to_numpy()[target_idx],
+            bonuses["area"].to_numpy()[bonus_idx],
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            is_overlap = intersection_areas / min_areas > (
+                settings.INTERSECTION_AREA_THRESHOLD_DEG
+            )
+
+        # Subset to pairs exceeding area threshold
+        target_idx = target_idx[is_overlap]
+        bonus_idx = bonus_idx[is_overlap]
+        return pd.DataFrame(
+            {
+                "target_id": targets["id"].to_numpy()[target_idx],
+                "target_population": targets["population"].to_numpy()[target_idx],
+                "bonus_id": bonuses["id"].to_numpy()[bonus_idx],
+                "bonus_population": bonuses["population"].to_numpy()[bonus_idx],
+            }
+        )
+
+
+class IntersectionEngineFactory:
+    """A factory for returning concrete `IntersectionEngine` instances."""
+
+    @staticmethod
+    def get(name: str, reader: Optional[DataLoader] = None) -> IntersectionEngine:
+        """Fetches an `IntersectionEngine` by name.
+
+        Args:
+            name (`str`): The name of the engine. Must
+                be one of "postgis" or "local".
+
+            reader (`DataLoader`): A client for reading input
+                files, required by the "local" engine. Defaults
+                to `None`.
+
+        Raises:
+            - `ValueError` if the argument `name` is not one of the expected values.
+
+        Returns:
+            (`IntersectionEngine`): The engine.
+        """
+        if name == "postgis":
+            return PostGisIntersectionEngine()
+        elif name == "local":
+            return LocalIntersectionEngine(reader or DataLoader())
+        else:
+            raise ValueError(
+                "A valid value must be given to IntersectionEngineFactory. "
+                f'Value given: "{name}".'
+            )
 
 
 class AssociationsService:
@@ -51,16 +485,60 @@ class AssociationsService:
     ]
     """Target-bonus geography pairs that can only be joined by spatial intersection."""
 
-    def __init__(self, population_service: PopulationService) -> None:
+    def __init__(
+        self,
+        population_service: PopulationService,
+        intersection_engine: Optional[IntersectionEngine] = None,
+    ) -> None:
         """Initializes a new instance of an `AssociationsService`.
 
         Args:
-            `None`
+            population_service (`PopulationService`): A client for
+                computing population totals at different geography levels.
+
+            intersection_engine (`IntersectionEngine`): The engine used
+                to find spatial intersections between geographies.
+                Defaults to `None`, in which case intersections are
+                computed by PostGIS.
 
         Returns:
             `None`
         """
         self._population_service = population_service
+        self._overlap_engine = CentroidOverlapEngine(population_service)
+        self._intersection_engine = intersection_engine or PostGisIntersectionEngine()
+
+    def _add_membership(self, geography_type: str) -> None:
+        """Builds the centroid membership matrix for the given
+        geography type, unless it has already been built.
+
+        Args:
+            geography_type (`str`): The geography type.
+
+        Returns:
+            `None`
+        """
+        if not self._overlap_engine.has_membership(geography_type):
+            gdf = self._intersection_engine.get_geographies(geography_type)
+            self._overlap_engine.add_membership(geography_type, gdf, id_col="id")
+
+    def warm(self, geo_type_combos: List[Tuple[str, str]]) -> None:
+        """Builds the centroid spatial index and membership matrices needed
+        by the given combinations of target and bonus geography types ahead
+        of time. Useful before forking worker processes so that they share
+        these structures rather than each building its own copy.
+
+        Args:
+            geo_type_combos (`list` of (`str`, `str`)): The
+                target and bonus geography types to be matched.
+
+        Returns:
+            `None`
+        """
+        for target_type, bonus_type in geo_type_combos:
+            if (target_type, bonus_type) in self.SPATIAL_OVERLAP_MATCH_OPTIONS:
+                for geography_type in (target_type, bonus_type):
+                    self._add_membership(geography_type)
 
     def find_bonus_matches(self, target_type: str, bonus_type: str) -> List[Dict]:
         """Finds tax credit bonus geography records that "match"
@@ -104,8 +582,9 @@ class AssociationsService:
     def find_within_counties(self, bonus_type: str) -> List[Dict]:
         """Finds intersections between counties and records of
         the bonus type using an attribute join (i.e., shared
-        county FIPS code). The bonus geography is assumed to
-        fall completely within the county.
+        county FIPS code) on the indexed, generated FIPS columns.
+        The bonus geography is assumed to fall completely within
+        the county.
 
         Args:
             bonus_type (`str`): The type of bonus geographies to search.
@@ -121,17 +600,19 @@ class AssociationsService:
                     bonus.id AS bonus_id,
                     bonus.population,
                     %s AS population_strategy
-                FROM tax_credit_geography target, tax_credit_geography bonus
-                WHERE (
-                    target.geography_type =  %s AND
-                    bonus.geography_type = %s AND
-                    SUBSTRING(target.fips, 1, 5) = SUBSTRING(bonus.fips, 1, 5)
-                );
+                FROM tax_credit_geography target
+                JOIN tax_credit_geography bonus
+                    ON (
+                        bonus.geography_type = %s AND
+                        bonus.state_fips = target.state_fips AND
+                        bonus.county_fips = target.county_fips
+                    )
+                WHERE target.geography_type = %s;
                 """,
                 [
                     Geography.PopulationCalculation.FIPS,
-                    Geography.GeographyType.COUNTY,
                     bonus_type,
+                    Geography.GeographyType.COUNTY,
                 ],
             )
             return cursor.fetchall()
@@ -151,75 +632,43 @@ class AssociationsService:
             (`list` of `dict`): The bonus geography matches.
         """
         # Find all spatial intersections between target and bonus geographies
-        with connection.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT
-                    target.id AS target_id,
-                    target.population AS target_population,
-                    bonus.id AS bonus_id,
-                    bonus.population AS bonus_population,
-                    ST_COLLECTIONEXTRACT(
-                        ST_INTERSECTION(target.geometry, bonus.geometry), 3
-                    ) AS geometry,
-                    ST_SRID(target.geometry) AS srid
-                FROM tax_credit_geography target, tax_credit_geography bonus
-                WHERE (
-                    target.geography_type = %s AND
-                    bonus.geography_type = %s AND
-                    ST_INTERSECTS(target.geometry, bonus.geometry) AND
-                    (
-                        ST_AREA(ST_INTERSECTION(target.geometry, bonus.geometry)) / 
-                        LEAST(ST_AREA(target.geometry), ST_AREA(bonus.geometry)) > %s
-                    )
-                );
-                """,
-                [target_type, bonus_type, settings.INTERSECTION_AREA_THRESHOLD_DEG],
-            )
-            matches = cursor.fetchall()
+        df = self._intersection_engine.find_intersections(target_type, bonus_type)
 
         # Return if no intersections found
-        if not matches:
+        if df.empty:
             return []
 
-        # Otherwise, read records into GeoDataFrame
-        crs = f"EPSG:{matches[0][-1]}"
-        df = pd.DataFrame(
-            matches,
-            columns=[
-                "target_id",
-                "target_population",
-                "bonus_id",
-                "bonus_population",
-                "geometry",
-                "srid",
-            ],
-        )
-        df["geometry"] = df["geometry"].apply(shapely.from_wkb)
-        gdf = gpd.GeoDataFrame(df, geometry="geometry", crs=crs)
+        # Build centroid membership matrices for each geography type if necessary
+        for geography_type in (target_type, bonus_type):
+            self._add_membership(geography_type)
 
-        # Join records with population-weighted centroids to aggregate population counts
-        gdf["id"] = gdf["target_id"].astype(str) + ", " + gdf["bonus_id"].astype(str)
-        merged_gdf = self._population_service.centroids_sjoin(gdf, id_col="id")
+        # Sum populations of centroids falling within both target and bonus
+        overlap_pops = self._overlap_engine.overlap_populations(target_type, bonus_type)
+        merged_df = df.merge(overlap_pops, how="left", on=["target_id", "bonus_id"])
+        merged_df["population"] = merged_df["population"].fillna(0).astype(int)
+        merged_df["population_strategy"] = (
+            Geography.PopulationCalculation.CENTROID_SJOIN
+        )
 
         # Ensure population estimate isn't greater than those of overlapping geographies
-        merged_gdf["population"] = merged_gdf[
+        merged_df["population"] = merged_df[
             ["target_population", "bonus_population", "population"]
         ].min(axis=1)
 
         # Subset to final columns
-        merged_gdf = merged_gdf[
+        merged_df = merged_df[
             ["target_id", "bonus_id", "population", "population_strategy"]
         ]
 
         # Return as records
-        return list(merged_gdf.itertuples(index=False, name=None))
+        return list(merged_df.itertuples(index=False, name=None))
 
     def find_within_states(self, bonus_type: str) -> List[Dict]:
         """Finds intersections between states and records of
         the bonus type using an attribute join (i.e., shared
-        state FIPS code). The bonus geography is assumed to
-        fall completely within the state.
+        state FIPS code) on the indexed, generated FIPS columns.
+        The bonus geography is assumed to fall completely within
+        the state.
 
         Args:
             bonus_type (`str`): The type of bonus geographies to search.
@@ -235,17 +684,18 @@ class AssociationsService:
                     bonus.id AS bonus_id,
                     bonus.population,
                     %s AS population_strategy
-                FROM tax_credit_geography target, tax_credit_geography bonus
-                WHERE (
-                    target.geography_type =  %s AND
-                    bonus.geography_type = %s AND
-                    SUBSTRING(target.fips, 1, 2) = SUBSTRING(bonus.fips, 1, 2)
-                );
+                FROM tax_credit_geography target
+                JOIN tax_credit_geography bonus
+                    ON (
+                        bonus.geography_type = %s AND
+                        bonus.state_fips = target.state_fips
+                    )
+                WHERE target.geography_type = %s;
                 """,
                 [
                     Geography.PopulationCalculation.FIPS,
-                    Geography.GeographyType.STATE,
                     bonus_type,
+                    Geography.GeographyType.STATE,
                 ],
             )
             return cursor.fetchall()
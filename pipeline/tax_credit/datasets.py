@@ -3,7 +3,6 @@
 
 # Standard library imports
 import logging
-import warnings
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
@@ -12,11 +11,12 @@ from typing import Optional
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import shapely
 from django.conf import settings
-from shapely.geometry.multipolygon import MultiPolygon
-from shapely.geometry.polygon import Polygon
 
 # Application imports
+from common.geojson import round_coordinates, simplify_for_zoom
+from common.geometry import normalize_polygons
 from common.storage import DataLoader, DataWriter
 from tax_credit.constants import STATE_ABBREVIATIONS
 from tax_credit.models import Geography
@@ -129,9 +129,13 @@ class GeoDataset(ABC):
         raise NotImplementedError
 
     def _correct_geometry(self) -> gpd.GeoDataFrame:
-        """Updates the geometry column of the dataset by transforming
+        """Updates the geometry column of the dataset by setting the CRS
+        to EPSG:4326 and then, in a single vectorized pass, repairing
+        invalid geometries, buffering geometries by the configured
+        distance in degrees to remove slight overlaps, and transforming
         Polygons to MultiPolygons (at the time of writing, necessary
-        for database load) and setting the CRS to EPSG:4326.
+        for database load). The corrected geometries are shared by
+        the geoparquet and line-delimited GeoJSON outputs.
 
         Args:
             `None`
@@ -140,14 +144,15 @@ class GeoDataset(ABC):
             (`GeoDataFrame`): A snapshot of the current data.
         """
         try:
-            # Convert geometries into Shapely MultiPolygons
-            trans = lambda b: MultiPolygon([b]) if isinstance(b, Polygon) else b
-            self.data["geometry"] = self.data["geometry"].apply(trans)
-
             # Change CRS to EPSG:4326 (geographic)
             self.data = self.data.set_crs(epsg=int(self.epsg))
             self.data = self.data.to_crs(epsg=4326)
 
+            # Repair, buffer and convert geometries into Shapely MultiPolygons
+            self.data.geometry = normalize_polygons(
+                self.data.geometry.to_numpy(), settings.BUFFER_DEG
+            )
+
             return self.data.copy()
 
         except Exception as e:
@@ -250,14 +255,9 @@ class GeoDataset(ABC):
         return self.data.copy()
 
     def to_geoparquet(self, index: bool = False) -> None:
-        """Writes the dataset to a geoparquet file after
-        buffering the geometry to remove overlaps. NOTE:
-        Because the buffer has already been converted to
-        degrees, user warnings about applying buffers
-        to geographic projections are suppressed.
-
-        Documentation:
-        - ["geopandas.GeoSeries.buffer"](https://geopandas.org/en/stable/docs/reference/api/geopandas.GeoSeries.buffer.html)
+        """Writes the dataset to a geoparquet file. Geometries
+        have already been buffered to remove overlaps when
+        the dataset was processed.
 
         Args:
             index (`bool`): A boolean indicating whether the
@@ -271,25 +271,16 @@ class GeoDataset(ABC):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot write file.")
 
-        # Make copy of DataFrame to avoid changing internal data state
-        copy = self.data.copy()
-
-        # Buffer geometry to remove slight overlaps
-        with warnings.catch_warnings():
-            warnings.simplefilter(action="ignore", category=UserWarning)
-            copy.geometry = copy.geometry.buffer(settings.BUFFER_DEG)
-
-        # Convert geometries back into Shapely MultiPolygons
-        trans = lambda b: MultiPolygon([b]) if isinstance(b, Polygon) else b
-        copy.geometry = copy.geometry.apply(trans)
-
         # Write to file
         fname = "_".join(self.name.replace("-", "_").split(" ")) + ".geoparquet"
         fpath = f"{settings.GEOPARQUET_DIRECTORY}/{fname}"
-        self.writer.write_geoparquet(fpath, copy, index=index)
+        self.writer.write_geoparquet(fpath, self.data, index=index)
 
-    def to_geojson_lines(self, index: bool = False) -> None:
+    def to_geojson_lines(self, index: bool = False, simplify: bool = False) -> None:
         """Writes the dataset to a newline-delimited GeoJSON file.
+        If requested, geometries are first simplified and their
+        coordinates quantized to the resolution of the maximum zoom
+        level of the Mapbox tileset built from the file.
 
         References:
         - https://stevage.github.io/ndgeojson/
@@ -300,6 +291,10 @@ class GeoDataset(ABC):
                 index should be included in the output file.
                 Defaults to `False`.
 
+            simplify (`bool`): A boolean indicating whether
+                geometries should be simplified for the tileset.
+                Defaults to `False`.
+
         Returns:
             `None`
         """
@@ -307,10 +302,55 @@ class GeoDataset(ABC):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot write file.")
 
-        # Write to file
+        # Determine file path
         fname = "_".join(self.name.replace("-", "_").split(" ")) + ".geojsonl"
         fpath = f"{settings.GEOJSONL_DIRECTORY}/{fname}"
-        self.writer.write_geojsonl(fpath, self.data, index=index)
+
+        # Write geometries at full precision unless simplification requested
+        if not simplify:
+            self.writer.write_geojsonl(fpath, self.data, index=index)
+            return
+
+        # Otherwise, look up maximum zoom level of tileset using file
+        max_zoom = next(
+            (
+                tileset["max_zoom"]
+                for tileset in settings.MAPBOX_TILESETS
+                if fpath in tileset["files"]
+            ),
+            None,
+        )
+        if max_zoom is None:
+            self.logger.warning(
+                f'No Mapbox tileset configured for "{fpath}". '
+                "Writing geometries at full precision."
+            )
+            self.writer.write_geojsonl(fpath, self.data, index=index)
+            return
+
+        # Simplify geometries and quantize coordinates for maximum zoom level
+        copy = self.data.copy()
+        geoms = copy.geometry.to_numpy()
+        simplified, precision = simplify_for_zoom(geoms, max_zoom)
+        copy.geometry = simplified
+
+        # Report reduction in vertices and size of GeoJSON geometries
+        pre_vertices, post_vertices = (
+            int(shapely.get_num_coordinates(arr).sum()) for arr in (geoms, simplified)
+        )
+        pre_bytes, post_bytes = (
+            sum(len(g) for g in shapely.to_geojson(arr) if g)
+            for arr in (geoms, round_coordinates(simplified, precision))
+        )
+        self.logger.info(
+            f"Simplified geometries for maximum zoom level {max_zoom}. "
+            f"Vertices reduced from {pre_vertices:,} to {post_vertices:,}. "
+            f"GeoJSON geometries reduced from {pre_bytes:,} to {post_bytes:,} "
+            f"bytes, saving {pre_bytes - post_bytes:,} bytes."
+        )
+
+        # Write to file
+        self.writer.write_geojsonl(fpath, copy, index=index, precision=precision)
 
 
 class CoalDataset(GeoDataset):
@@ -996,38 +1036,30 @@ class LowIncomeDataset(GeoDataset):
 
         # Derive list of qualifying tract ids across all indicator datasets
         ids = nmtc_pov[nmtc_id_col].tolist() + nmtc_state_mig[nmtc_id_col].tolist()
-        lic_ids = sorted(list(set(ids)))
-
-        # Build GeoDataFrame of low-income census tracts
-        gdf = None
-
-        for pth in self.reader.list_directory_contents(tracts_2020_fpath):
-            # Load tracts for state/state-equivalent
-            tract_gdf = self.reader.read_shapefile(pth)
-
-            # Filter to include only relevant tracts
-            tract_gdf = tract_gdf.query("GEOID in @lic_ids")
-
-            # Add county name metadata
-            tract_gdf = tract_gdf.merge(
-                how="left",
-                right=county_fips[["STATEFP", "COUNTYFP", "COUNTYNAME"]],
-                on=["STATEFP", "COUNTYFP"],
-            )
-
-            # Add state name metadata
-            tract_gdf = tract_gdf.merge(
-                how="left",
-                right=state_fips[["STATE", "STATE_NAME"]],
-                left_on="STATEFP",
-                right_on="STATE",
-            )
+        lic_ids = set(ids)
+
+        # Load relevant tracts for all states/state-equivalents,
+        # decoding the geometries of qualifying tracts only
+        tract_gdf = self.reader.read_shapefiles(
+            tracts_2020_fpath,
+            columns=["STATEFP", "COUNTYFP", "TRACTCE", "GEOID", "NAME", "NAMELSAD"],
+            filter_values={"GEOID": lic_ids},
+        )
 
-            # Concatenate tracts to larger GeoDataFrame
-            gdf = tract_gdf if gdf is None else pd.concat([gdf, tract_gdf])
+        # Add county name metadata
+        tract_gdf = tract_gdf.merge(
+            how="left",
+            right=county_fips[["STATEFP", "COUNTYFP", "COUNTYNAME"]],
+            on=["STATEFP", "COUNTYFP"],
+        )
 
-        # Store reference
-        self.data = gdf
+        # Add state name metadata
+        self.data = tract_gdf.merge(
+            how="left",
+            right=state_fips[["STATE", "STATE_NAME"]],
+            left_on="STATEFP",
+            right_on="STATE",
+        )
 
         return self.data.copy()
 
@@ -1287,10 +1319,7 @@ class MunicipalityWithinStateDataset(GeoDataset):
         )
 
         # Load place files
-        places = None
-        for pth in self.reader.list_directory_contents(places_fpath):
-            loaded_gdf = self.reader.read_shapefile(pth)
-            places = loaded_gdf if places is None else pd.concat([places, loaded_gdf])
+        places = self.reader.read_shapefiles(places_fpath)
 
         # Merge units and places
         gov_places = gov_units.merge(
@@ -1298,14 +1327,7 @@ class MunicipalityWithinStateDataset(GeoDataset):
         )
 
         # Load county subdivision files
-        county_subs = None
-        for pth in self.reader.list_directory_contents(county_subs_fpath):
-            loaded_gdf = self.reader.read_shapefile(pth)
-            county_subs = (
-                loaded_gdf
-                if county_subs is None
-                else pd.concat([county_subs, loaded_gdf])
-            )
+        county_subs = self.reader.read_shapefiles(county_subs_fpath)
 
         # Merge units and county subdivisions
         gov_county_subs = gov_units.merge(
@@ -1386,56 +1408,42 @@ class MunicipalityWithinStateDataset(GeoDataset):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot construct name.")
 
-        # Define local function to standardize name
-        def standardize_name(row: pd.Series, is_multiple: bool):
-            """Standardizes the municipality name. When the same
-            name appears multiple times in the same state, as given
-            by the `is_multiple` flag, the county name is included
-            to prevent confusion. Otherwise, the county name is
-            omitted for improved readability.
-
-            Args:
-                row (`pd.Series`): The DataFrame row representing
-                    the municipality.
-
-                is_multiple (`bool`): A boolean indicating whether
-                    the municipality's name appears more than once
-                    within its U.S. state.
-
-            Returns:
-                (`str`): The corrected name.
-            """
-            entity = row["entity"]
-            unit_name = row["UNIT_NAME"]
-            legal_name = row["NAMELSAD"]
-            short_name = row["NAME"]
-            state_name = row["STATE_NAME"]
-            county_name = row["COUNTYNAME"]
-
-            if entity == "township" or entity.isdigit():
-                return f"{legal_name}, {county_name}, {state_name}".upper()
-            elif is_multiple:
-                return f"{unit_name}, {county_name}, {state_name}".upper()
-            else:
-                return f"{short_name}, {state_name}".upper()
-
         # Add legal entity type column to dataset
-        self.data["entity"] = self.data["NAMELSAD"].apply(lambda n: n.split()[-1])
-
-        # Group municipal short names by state
-        name_grps = self.data.groupby(by=["NAME", "FIPS_STATE"])
+        self.data["entity"] = self.data["NAMELSAD"].str.extract(
+            r"(\S+)\s*$", expand=False
+        )
 
-        # Apply standardization function to each unique
-        # combination of municipality name and state
-        stnd_gdf = None
-        for name in name_grps.groups.keys():
-            gdf = name_grps.get_group(name)
-            is_multiple = len(gdf) > 1
-            gdf["name"] = gdf.apply(lambda r: standardize_name(r, is_multiple), axis=1)
-            stnd_gdf = gdf if stnd_gdf is None else pd.concat([stnd_gdf, gdf])
+        # Flag municipal short names appearing more than once within a state,
+        # dropping records without a short name or state as they cannot be named
+        name_cols = ["NAME", "FIPS_STATE"]
+        self.data = self.data[self.data[name_cols].notna().all(axis=1)]
+        num_in_state = self.data.groupby(by=name_cols)["NAME"].transform("size")
+        is_multiple = num_in_state > 1
+
+        # Standardize names. When the same name appears multiple times
+        # in the same state, the county name is included to prevent
+        # confusion. Otherwise, the county name is omitted for improved
+        # readability. Townships and units with numeric entity types
+        # always use their legal name and county name. Missing values
+        # are rendered as "nan", as when formatted within a string.
+        text = self.data[
+            ["NAME", "NAMELSAD", "UNIT_NAME", "COUNTYNAME", "STATE_NAME"]
+        ].fillna("nan")
+        county_state = ", " + text["COUNTYNAME"] + ", " + text["STATE_NAME"]
+        entity = self.data["entity"]
+        is_township = entity.eq("township") | entity.str.isdigit().eq(True)
+        self.data["name"] = np.select(
+            condlist=[is_township, is_multiple],
+            choicelist=[
+                text["NAMELSAD"] + county_state,
+                text["UNIT_NAME"] + county_state,
+            ],
+            default=text["NAME"] + ", " + text["STATE_NAME"],
+        )
+        self.data["name"] = self.data["name"].str.upper()
 
-        # Update dataset with reference to DataFrame of standardized names
-        self.data = stnd_gdf
+        # Order records by name and state, as when standardized group by group
+        self.data = self.data.sort_values(by=name_cols, kind="stable")
 
         return self.data.copy()
 
@@ -1453,19 +1461,16 @@ class MunicipalityWithinStateDataset(GeoDataset):
         if self.is_null:
             raise RuntimeError("Dataset is empty. Cannot construct FIPS Codes.")
 
-        # Define local function to map FIPS code and pattern based on dataset type
-        def map(row: pd.Series):
-            if row["DATASET"] == "places":
-                return row["GEOID_PLACE"], Geography.FipsPattern.STATE_PLACE
-            else:
-                return (
-                    row["GEOID_SUBDIV"],
-                    Geography.FipsPattern.STATE_COUNTY_COUNTY_SUBDIVISION,
-                )
-
-        # Apply function
-        self.data[["fips", "fips_pattern"]] = self.data.apply(
-            map, axis=1, result_type="expand"
+        # Map FIPS code and pattern based on dataset type
+        is_place = self.data["DATASET"] == "places"
+        self.data["fips"] = self.data["GEOID_PLACE"].where(
+            is_place, self.data["GEOID_SUBDIV"]
+        )
+        self.data["fips_pattern"] = is_place.map(
+            {
+                True: Geography.FipsPattern.STATE_PLACE,
+                False: Geography.FipsPattern.STATE_COUNTY_COUNTY_SUBDIVISION,
+            }
         )
 
         return self.data.copy()
@@ -1497,18 +1502,18 @@ class MunicipalityWithinStateDataset(GeoDataset):
             "NAME",
             "NAMELSAD",
         ]
-        grpd_df = self.data.groupby(by=grp_cols)
+        has_keys = self.data[grp_cols].notna().all(axis=1)
+        grp_size = self.data.groupby(by=grp_cols)["NAME"].transform("size")
 
-        # Remove duplicate records
-        deduped_gdf = None
-        for name in grpd_df.groups.keys():
-            df = grpd_df.get_group(name)
-            if len(df) > 1:
-                df = df.query("DATASET == 'places'")
-            deduped_gdf = df if deduped_gdf is None else pd.concat([deduped_gdf, df])
+        # Remove duplicate records, keeping only the place where a unit
+        # appears more than once. Records lacking any key are dropped.
+        is_unique = grp_size == 1
+        is_place = self.data["DATASET"] == "places"
+        self.data = self.data[has_keys & (is_unique | is_place)]
 
-        # Update dataset with reference to de-duped DataFrame
-        self.data = deduped_gdf
+        # Order records by their keys, as when filtered group by group, so
+        # that the first of any remaining duplicates is loaded consistently
+        self.data = self.data.sort_values(by=grp_cols, kind="stable")
 
         return self.data.copy()
 
@@ -1575,20 +1580,10 @@ class MunicipalityWithinTerritoryDataset(GeoDataset):
             ) from None
 
         # Load county subdivision files
-        county_subs = None
-        for pth in self.reader.list_directory_contents(county_subs_fpath):
-            loaded_gdf = self.reader.read_shapefile(pth)
-            county_subs = (
-                loaded_gdf
-                if county_subs is None
-                else pd.concat([county_subs, loaded_gdf])
-            )
+        county_subs = self.reader.read_shapefiles(county_subs_fpath)
 
         # Load place files
-        places = None
-        for pth in self.reader.list_directory_contents(places_fpath):
-            loaded_gdf = self.reader.read_shapefile(pth)
-            places = loaded_gdf if places is None else pd.concat([places, loaded_gdf])
+        places = self.reader.read_shapefiles(places_fpath)
 
         # Load state metadata
         state_fips = self.reader.read_csv(
@@ -1,16 +1,158 @@
 """Cleans raw datasets.
 """
 
+# Standard library imports
+import logging
+import multiprocessing
+import resource
+from datetime import datetime, timedelta, UTC
+from typing import Dict, List, Optional, Tuple
+
 # Third-party imports
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandParser
 
 # Application imports
-from common.logger import LoggerFactory
+from common.logger import LoggerFactory, RecordCollector
 from common.storage import DataLoader, DataWriter
 from tax_credit.datasets import DatasetFactory, GeoDataset
 from tax_credit.population import PopulationService
 
+_worker_population_service: Optional[PopulationService] = None
+"""The population service shared by each worker process in the pool."""
+
+
+def clean_dataset(
+    dataset_config: Dict,
+    reader: DataLoader,
+    writer: DataWriter,
+    population_service: PopulationService,
+    logger: logging.Logger,
+    simplify: bool = False,
+) -> timedelta:
+    """Loads and cleans one raw dataset and then writes it
+    to geoparquet and line-delimited GeoJSON files.
+
+    Args:
+        dataset_config (`dict`): The dataset's configuration settings.
+
+        reader (`DataLoader`): A client for reading input files.
+
+        writer (`DataWriter`): A client for writing output files.
+
+        population_service (`PopulationService`): A client for
+            computing population totals at different geography levels.
+
+        logger (`logging.Logger`): A standard logger instance.
+
+        simplify (`bool`): Whether to simplify geometries to the maximum
+            zoom level of the dataset's Mapbox tileset before writing
+            line-delimited GeoJSON. Defaults to `False`.
+
+    Returns:
+        (`timedelta`): The time taken to clean and write the dataset.
+    """
+    # Initialize dataset
+    logger.info(
+        "Received request to process dataset "
+        f"\"{dataset_config['name']}\". Initializing."
+    )
+    start_time = datetime.now(UTC)
+    dataset_config = dict(dataset_config)
+    fpaths = dataset_config.pop("files")
+    dataset: GeoDataset = DatasetFactory.create(
+        **dataset_config,
+        logger=logger,
+        reader=reader,
+        writer=writer,
+        population_service=population_service,
+    )
+
+    # Load and clean dataset
+    logger.info("Beginning processing job.")
+    dataset.process(**fpaths)
+
+    # Write dataset to geoparquet file
+    logger.info("Writing processed data to geoparquet file.")
+    dataset.to_geoparquet()
+
+    # Write dataset to line-delimited GeoJSON
+    logger.info("Writing processed data to new line delimited GeoJSON.")
+    dataset.to_geojson_lines(simplify=simplify)
+
+    return datetime.now(UTC) - start_time
+
+
+def _get_peak_rss() -> int:
+    """Reports the peak resident set size (RSS) of the current process.
+
+    Args:
+        `None`
+
+    Returns:
+        (`int`): The peak RSS, in kilobytes.
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _init_worker(population_service: PopulationService) -> None:
+    """Stores the population service inherited from the parent
+    process for use by each dataset cleaned within the worker.
+
+    Args:
+        population_service (`PopulationService`): The service.
+
+    Returns:
+        `None`
+    """
+    global _worker_population_service
+    _worker_population_service = population_service
+
+
+def _clean_dataset_in_worker(
+    dataset_config: Dict, log_name: str, simplify: bool
+) -> Tuple[List[logging.LogRecord], Optional[timedelta], int, Optional[str]]:
+    """Cleans one dataset within a worker process. Log records are
+    buffered rather than emitted so that the parent process can
+    replay them in order. Each worker cleans a single dataset before
+    exiting, so its peak memory usage is that of the dataset alone.
+
+    Args:
+        dataset_config (`dict`): The dataset's configuration settings.
+
+        log_name (`str`): The name of the logger for the dataset.
+
+        simplify (`bool`): Whether to simplify geometries for
+            the dataset's Mapbox tileset.
+
+    Returns:
+        (`tuple` of `list` of `logging.LogRecord`, `timedelta`, `int`, `str`):
+            The buffered log records, the time taken to clean the dataset,
+            the peak resident set size of the worker in kilobytes and an
+            error message. The time is `None` if an error occurred, while
+            the error message is `None` otherwise.
+    """
+    # Configure logger to buffer records
+    collector = RecordCollector()
+    logger = logging.getLogger(f"{log_name} (WORKER)")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.handlers = [collector]
+
+    # Clean dataset using storage clients created within the worker
+    try:
+        elapsed = clean_dataset(
+            dataset_config,
+            DataLoader(),
+            DataWriter(),
+            _worker_population_service,
+            logger,
+            simplify,
+        )
+        return collector.records, elapsed, _get_peak_rss(), None
+    except Exception as e:
+        return collector.records, None, _get_peak_rss(), f"{type(e).__name__}: {e}"
+
 
 class Command(BaseCommand):
     """Loads raw datasets from the configured storage location; cleans
@@ -58,6 +200,16 @@ class Command(BaseCommand):
         - rural cooperatives
         - states
 
+        The "workers" option sets the number of processes used to
+        clean datasets concurrently. The population tables are loaded
+        once by the parent process and then shared with each worker.
+        Defaults to 1, in which case datasets are cleaned sequentially.
+
+        The "simplify" flag simplifies geometries and quantizes their
+        coordinates to the resolution of the maximum zoom level of each
+        dataset's Mapbox tileset before writing line-delimited GeoJSON.
+        The geoparquet files are unaffected.
+
         Args:
             parser (`CommandParser`)
 
@@ -65,11 +217,25 @@ class Command(BaseCommand):
             `None`
         """
         parser.add_argument("--geos", nargs="+", default=[])
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="The number of processes used to clean datasets concurrently.",
+        )
+        parser.add_argument(
+            "--simplify",
+            action="store_true",
+            help="Simplifies GeoJSON geometries to the maximum tileset zoom level.",
+        )
 
     def handle(self, *args, **options) -> None:
         """Executes the command. If the "geos" option
         has been provided, only the listed datasets
         are cleaned. Otherwise, all datasets are cleaned.
+        When cleaning sequentially, the peak memory usage
+        reported for each dataset is that of the process
+        as a whole up to that point.
 
         Args:
             `None`
@@ -79,55 +245,88 @@ class Command(BaseCommand):
         """
         # Initialize variables
         geos = options["geos"]
-        num_processed = 0
         reader = DataLoader()
         writer = DataWriter()
         population_service = PopulationService.initialize(
             reader, writer, *settings.POPULATION_SERVICE.values(), self._logger
         )
 
-        # Process each configured dataset
-        for dataset_config in settings.RAW_DATASETS:
-
-            # Skip processing if indicated by command line options
-            if geos and dataset_config["name"] not in geos:
-                continue
+        # Select datasets, skipping those excluded by command line options
+        dataset_configs = [
+            dataset_config
+            for dataset_config in settings.RAW_DATASETS
+            if not geos or dataset_config["name"] in geos
+        ]
+        log_names = [
+            f"CLEAN {dataset_config['name'].upper()}"
+            for dataset_config in dataset_configs
+        ]
+        process_start_time = datetime.now(UTC)
+        elapsed_times = []
+        peak_rss = []
 
-            # Otherwise, create custom logger for dataset type
-            log_name = f"CLEAN {dataset_config['name'].upper()}"
-            logger = LoggerFactory.get(log_name)
+        # Clean each dataset sequentially if only one worker requested
+        if options["workers"] <= 1:
+            for dataset_config, log_name in zip(dataset_configs, log_names):
+                logger = LoggerFactory.get(log_name)
+                elapsed = clean_dataset(
+                    dataset_config,
+                    reader,
+                    writer,
+                    population_service,
+                    logger,
+                    options["simplify"],
+                )
+                elapsed_times.append(elapsed)
+                peak_rss.append(_get_peak_rss())
 
-            # Initialize dataset
-            logger.info(
-                "Received request to process dataset "
-                f"\"{dataset_config['name']}\". Initializing."
-            )
-            fpaths = dataset_config.pop("files")
-            dataset: GeoDataset = DatasetFactory.create(
-                **dataset_config,
-                logger=logger,
-                reader=reader,
-                writer=writer,
-                population_service=population_service,
+        # Otherwise, fan datasets out to a pool of worker processes
+        else:
+            self._logger.info(
+                f"Cleaning {len(dataset_configs)} dataset(s) "
+                f"using {options['workers']} worker(s)."
             )
 
-            # Load and clean dataset
-            logger.info("Beginning processing job.")
-            dataset.process(**fpaths)
-
-            # Write dataset to geoparquet file
-            logger.info("Writing processed data to geoparquet file.")
-            dataset.to_geoparquet()
+            # Load population tables once so that forked workers share them
+            population_service.load_tables()
 
-            # Write dataset to line-delimited GeoJSON
-            logger.info("Writing processed data to new line delimited GeoJSON.")
-            dataset.to_geojson_lines()
+            # Start a fresh worker for each dataset to isolate memory usage
+            with multiprocessing.get_context("fork").Pool(
+                processes=options["workers"],
+                initializer=_init_worker,
+                initargs=(population_service,),
+                maxtasksperchild=1,
+            ) as pool:
+                results = [
+                    pool.apply_async(
+                        _clean_dataset_in_worker,
+                        (config, log_name, options["simplify"]),
+                    )
+                    for config, log_name in zip(dataset_configs, log_names)
+                ]
 
-            # Update number of datasets processed
-            num_processed += 1
+                # Replay buffered logs in the order datasets were submitted
+                for result, log_name in zip(results, log_names):
+                    records, elapsed, rss, error = result.get()
+                    logger = LoggerFactory.get(log_name)
+                    for record in records:
+                        record.name = log_name
+                        logger.handle(record)
+                    if error:
+                        logger.error(f"Failed to clean dataset. {error}")
+                        pool.terminate()
+                        exit(1)
+                    elapsed_times.append(elapsed)
+                    peak_rss.append(rss)
 
         # Log completion of job
-        if not num_processed:
+        if not dataset_configs:
             self._logger.info("No datasets found with given geography name(s).")
-        else:
-            self._logger.info("Data cleaning job complete.")
+            return
+
+        # Summarize wall time and memory high-water mark per dataset
+        self._logger.info("Wall time and peak memory usage per dataset:")
+        for log_name, elapsed, rss in zip(log_names, elapsed_times, peak_rss):
+            self._logger.info(f"{log_name}: {elapsed}, {rss / 1024:,.0f} MB.")
+        self._logger.info(f"Total wall time: {datetime.now(UTC) - process_start_time}.")
+        self._logger.info("Data cleaning job complete.")
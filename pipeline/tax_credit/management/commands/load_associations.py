@@ -3,21 +3,168 @@
 
 # Standard library imports
 import itertools
+import logging
+import multiprocessing
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, UTC
+from typing import List, Optional, Tuple
 
 # Third-party imports
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections
 from django.db.utils import IntegrityError, ProgrammingError
 
 # Application imports
 from common.db import dynamic_bulk_insert
-from common.logger import LoggerFactory
+from common.logger import LoggerFactory, RecordCollector
 from common.storage import DataLoader, DataWriter
-from tax_credit.associations import AssociationsService
+from tax_credit.associations import AssociationsService, IntersectionEngineFactory
 from tax_credit.models import TargetBonusGeographyOverlap
 from tax_credit.population import PopulationService
 
+_worker_assoc_service: Optional[AssociationsService] = None
+"""The associations service shared by each worker process in the pool."""
+
+
+def load_combination(
+    assoc_service: AssociationsService,
+    target_geo_type: str,
+    bonus_geo_type: str,
+    logger: logging.Logger,
+) -> timedelta:
+    """Finds the associations between one target and one bonus
+    geography type and bulk inserts them into the database.
+
+    Args:
+        assoc_service (`AssociationsService`): The service
+            used to find target-bonus geography matches.
+
+        target_geo_type (`str`): The target geography type.
+
+        bonus_geo_type (`str`): The bonus geography type.
+
+        logger (`logging.Logger`): A standard logger instance.
+
+    Raises:
+        (`RuntimeError`) if the associations fail to be inserted.
+
+    Returns:
+        (`timedelta`): The time taken to match and load the associations.
+    """
+    # Log and time start of processing
+    logger.info(
+        "Calculating intersections between geography types "
+        f'"{target_geo_type}" (target) and "{bonus_geo_type}" (bonus).'
+    )
+    start_time = datetime.now(UTC)
+
+    # Find bonus type geography matches
+    logger.info("Searching for bonus geography matches.")
+    matches = assoc_service.find_bonus_matches(target_geo_type, bonus_geo_type)
+    logger.info(f"{len(matches)} match(es) found.")
+    if not matches:
+        return datetime.now(UTC) - start_time
+
+    # Define generator to construct table records
+    target_bonus_geos = (TargetBonusGeographyOverlap(None, *match) for match in matches)
+
+    # Perform bulk insert of matches into database
+    try:
+        logger.info(
+            f"Inserting {len(matches)} target-bonus "
+            "association(s) into database in batches."
+        )
+        num_inserted = dynamic_bulk_insert(
+            target_bonus_geos,
+            TargetBonusGeographyOverlap.objects,
+            logger,
+        )
+        elapsed = datetime.now(UTC) - start_time
+        logger.info(
+            f"{num_inserted:,} record(s) successfully "
+            "inserted (or ignored if already present) "
+            f"in {elapsed}."
+        )
+    except (IntegrityError, ValueError, ProgrammingError) as e:
+        raise RuntimeError(f"Failed to insert associations. {e}") from e
+
+    # Log completion
+    logger.info(
+        f'Finished matching "{target_geo_type}" geographies '
+        f'with "{bonus_geo_type}" geographies and loading into '
+        f"database in {elapsed}."
+    )
+
+    # Log warning if matching and load time exceeded configured threshold
+    if elapsed > timedelta(minutes=settings.SLOW_LOAD_THRESHOLD_IN_MINUTES):
+        logger.warning(
+            "Matching and load time exceeded the threshold "
+            f"of {settings.SLOW_LOAD_THRESHOLD_IN_MINUTES}."
+        )
+
+    return elapsed
+
+
+def _init_worker(assoc_service: AssociationsService) -> None:
+    """Stores the associations service inherited from the parent
+    process for use by each combination loaded within the worker.
+
+    Args:
+        assoc_service (`AssociationsService`): The service.
+
+    Returns:
+        `None`
+    """
+    global _worker_assoc_service
+    _worker_assoc_service = assoc_service
+
+
+def _load_combination_in_worker(
+    target_geo_type: str, bonus_geo_type: str, log_name: str
+) -> Tuple[List[logging.LogRecord], Optional[timedelta], Optional[str]]:
+    """Loads the associations for one combination of target and bonus
+    geography types within a worker process. Log records are buffered
+    rather than emitted so that the parent process can replay them in order.
+    Errors are returned with the buffered records rather than raised, so
+    that the records are replayed even when the combination fails.
+
+    Args:
+        target_geo_type (`str`): The target geography type.
+
+        bonus_geo_type (`str`): The bonus geography type.
+
+        log_name (`str`): The name of the logger for the combination.
+
+    Returns:
+        (`tuple` of `list` of `logging.LogRecord`, `timedelta`, `str`): The
+            buffered log records, the time taken to match and load the
+            associations and an error message. The time is `None` if
+            an error occurred, while the error message is `None` otherwise.
+    """
+    # Configure logger to buffer records
+    collector = RecordCollector()
+    logger = logging.getLogger(f"{log_name} (WORKER)")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.handlers = [collector]
+
+    # Load combination
+    try:
+        elapsed = load_combination(
+            _worker_assoc_service, target_geo_type, bonus_geo_type, logger
+        )
+        return collector.records, elapsed, None
+    except RuntimeError as e:
+        return collector.records, None, str(e)
+    except Exception:
+        return (
+            collector.records,
+            None,
+            f"Unexpected error while loading associations.\n{traceback.format_exc()}",
+        )
+
 
 class Command(BaseCommand):
     """Calculates spatial intersections between "target" geographies
@@ -75,6 +222,17 @@ class Command(BaseCommand):
         When "target" or "bonus" is not provided, all available target
         and bonus geography types are used.
 
+        The "workers" option sets the number of processes used to load
+        combinations of target and bonus geography types concurrently.
+        Each worker opens its own database connection and shares the
+        population service loaded by the parent process. Defaults to 1,
+        in which case combinations are loaded sequentially.
+
+        A third option, "engine", selects how spatial intersections are
+        computed. "postgis" (the default) runs a self-join within the
+        database, while "local" loads the geographies from the cleaned
+        geoparquet files and intersects them in-process with Shapely.
+
         Args:
             parser (`CommandParser`)
 
@@ -117,6 +275,18 @@ class Command(BaseCommand):
             ],
             help="Restricts the bonuses that will be used for associations.",
         )
+        parser.add_argument(
+            "--engine",
+            default="postgis",
+            choices=["postgis", "local"],
+            help="The engine used to compute spatial intersections.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="The number of processes used to load combinations concurrently.",
+        )
 
     def handle(self, *args, **options):
         """Executes the command. If the "target" and/or
@@ -136,69 +306,75 @@ class Command(BaseCommand):
         population_service = PopulationService.initialize(
             reader, writer, *settings.POPULATION_SERVICE.values(), self._logger
         )
-        assoc_service = AssociationsService(population_service)
+        intersection_engine = IntersectionEngineFactory.get(options["engine"], reader)
+        assoc_service = AssociationsService(population_service, intersection_engine)
 
-        # Iterate through each combination of target and bonus geography type
-        for geo_type_combo in itertools.product(options["target"], options["bonus"]):
+        # Determine combinations of target and bonus geography types
+        geo_type_combos = list(itertools.product(options["target"], options["bonus"]))
+        log_names = [
+            f"LOAD {target_geo_type.upper()} <> {bonus_geo_type.upper()}"
+            for target_geo_type, bonus_geo_type in geo_type_combos
+        ]
+        process_start_time = datetime.now(UTC)
+        elapsed_times = []
 
-            # Create custom logger for dataset type
-            target_geo_type, bonus_geo_type = geo_type_combo
-            log_name = f"LOAD {target_geo_type.upper()} <> {bonus_geo_type.upper()}"
-            logger = LoggerFactory.get(log_name)
+        # Load each combination sequentially if only one worker requested
+        if options["workers"] <= 1:
+            for (target_geo_type, bonus_geo_type), log_name in zip(
+                geo_type_combos, log_names
+            ):
+                logger = LoggerFactory.get(log_name)
+                try:
+                    elapsed = load_combination(
+                        assoc_service, target_geo_type, bonus_geo_type, logger
+                    )
+                    elapsed_times.append(elapsed)
+                except RuntimeError as e:
+                    logger.error(str(e))
+                    exit(1)
 
-            # Log and time start of processing
-            logger.info(
-                "Calculating intersections between geography types "
-                f'"{target_geo_type}" (target) and "{bonus_geo_type}" (bonus).'
-            )
-            start_time = datetime.now(UTC)
-
-            # Find bonus type geography matches
-            logger.info("Searching for bonus geography matches.")
-            matches = assoc_service.find_bonus_matches(target_geo_type, bonus_geo_type)
-            logger.info(f"{len(matches)} match(es) found.")
-            if not matches:
-                continue
-
-            # Define generator to construct table records
-            target_bonus_geos = (
-                TargetBonusGeographyOverlap(None, *match) for match in matches
+        # Otherwise, fan combinations out to a pool of worker processes
+        else:
+            self._logger.info(
+                f"Loading {len(geo_type_combos)} combination(s) of target and "
+                f"bonus geography types using {options['workers']} worker(s)."
             )
 
-            # Perform bulk insert of matches into database
-            try:
-                logger.info(
-                    f"Inserting {len(matches)} target-bonus "
-                    "association(s) into database in batches."
-                )
-                num_inserted = dynamic_bulk_insert(
-                    target_bonus_geos,
-                    TargetBonusGeographyOverlap.objects,
-                    logger,
-                )
-                elapsed = datetime.now(UTC) - start_time
-                logger.info(
-                    f"{num_inserted:,} record(s) successfully "
-                    "inserted (or ignored if already present) "
-                    f"in {elapsed}."
-                )
-            except (IntegrityError, ValueError, ProgrammingError) as e:
-                logger.error(f"Failed to insert associations. {e}")
-                exit(1)
-
-            # Log completion
-            logger.info(
-                f'Finished matching "{target_geo_type}" geographies '
-                f'with "{bonus_geo_type}" geographies and loading into '
-                f"database in {elapsed}."
-            )
+            # Index population centroids once so that forked workers share them
+            assoc_service.warm(geo_type_combos)
+
+            # Close connections so that each forked worker opens its own
+            connections.close_all()
+
+            with ProcessPoolExecutor(
+                max_workers=options["workers"],
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+                initargs=(assoc_service,),
+            ) as executor:
+                futures = [
+                    executor.submit(_load_combination_in_worker, *combo, log_name)
+                    for combo, log_name in zip(geo_type_combos, log_names)
+                ]
+
+                # Replay buffered logs in the order combinations were submitted
+                for future, log_name in zip(futures, log_names):
+                    records, elapsed, error = future.result()
+                    logger = LoggerFactory.get(log_name)
+                    for record in records:
+                        record.name = log_name
+                        logger.handle(record)
+                    if error:
+                        logger.error(error)
+                        executor.shutdown(cancel_futures=True)
+                        exit(1)
+                    elapsed_times.append(elapsed)
 
-            # Log warning if matching and load time exceeded configured threshold
-            if elapsed > timedelta(minutes=settings.SLOW_LOAD_THRESHOLD_IN_MINUTES):
-                logger.warn(
-                    "Matching and load time exceeded the threshold "
-                    f"of {settings.SLOW_LOAD_THRESHOLD_IN_MINUTES}."
-                )
+        # Summarize wall time per combination
+        self._logger.info("Wall time per combination of target and bonus type:")
+        for log_name, elapsed in zip(log_names, elapsed_times):
+            self._logger.info(f"{log_name}: {elapsed}.")
+        self._logger.info(f"Total wall time: {datetime.now(UTC) - process_start_time}.")
 
         # Mark end of process
         self._logger.info(
@@ -10,7 +10,7 @@ from django.core.management.base import BaseCommand, CommandParser
 from django.db.utils import IntegrityError, ProgrammingError
 
 # Application imports
-from common.db import dynamic_bulk_insert
+from common.db import copy_insert
 from common.logger import LoggerFactory
 from common.storage import ParquetDataReader
 from tax_credit.models import Geography
@@ -18,11 +18,10 @@ from tax_credit.models import Geography
 
 class Command(BaseCommand):
     """Loads cleaned geo datasets from the configured storage location,
-    validates the data, applies transformation functions to the
-    records of each dataset in preparation for database table load,
-    and then upserts the records to the geography table in batches
-    using an exponential smoothing algorithm to dynamically determine
-    the batch size.
+    validates the data, encodes the record batches of each dataset
+    in preparation for database table load, and then streams the
+    records into the geography table in chunks using a binary `COPY`
+    into a staging table followed by an `INSERT ... ON CONFLICT DO NOTHING`.
 
     References:
     - https://docs.djangoproject.com/en/4.1/howto/custom-management-commands/
@@ -106,6 +105,7 @@ class Command(BaseCommand):
         # Initialize variables
         num_processed = 0
         reader = ParquetDataReader()
+        columns = [name for name, _, _ in Geography.COPY_COLUMNS]
         geos = options["geos"]
         try:
             dataset_max_size, random_seed = options["smoke_test"]
@@ -133,18 +133,37 @@ class Command(BaseCommand):
             log_name = f"LOAD {dataset_name.upper()}"
             self._logger = LoggerFactory.get(log_name)
 
-            # Attempt to load dataset and map each row to geography type
+            # Log start of dataset load
             self._logger.info(
                 "Received request to load cleaned dataset "
                 f"\"{dataset_config['name']}\" into the "
                 "geographies table. Reading data file and "
-                "mapping dataset rows to database table schema."
+                "mapping dataset batches to database table schema."
             )
-            try:
-                mapped_geos = (
-                    Geography.from_series(row)
-                    for row in reader.iterate(dataset_config["file"])
+
+            # If conducting smoke test, read only a random sample of records,
+            # fetching just the columns loaded into the table
+            if options["smoke_test"]:
+                self._logger.info(
+                    "Taking random sample of dataset records for smoke test."
                 )
+                random.seed(random_seed)
+                num_geos = reader.num_rows(dataset_config["file"])
+                sample_size = min(num_geos, dataset_max_size)
+                sample_indices = random.sample(range(num_geos), sample_size)
+                batches = reader.take_rows(
+                    dataset_config["file"], sample_indices, columns=columns
+                )
+            else:
+                batches = reader.iter_batches(
+                    dataset_config["file"],
+                    batch_size=settings.COPY_CHUNK_SIZE,
+                    columns=columns,
+                )
+
+            # Map each batch to geography table columns
+            try:
+                mapped_geos = (Geography.to_copy_batch(batch) for batch in batches)
             except FileExistsError:
                 self._logger.error(
                     f'Failed to load dataset "{dataset_name}". '
@@ -155,31 +174,17 @@ class Command(BaseCommand):
                 self._logger.error(f'Failed to load dataset "{dataset_name}". {e}')
                 exit(1)
 
-            # If conducting smoke test, take random sample of geographies
-            if options["smoke_test"]:
-                self._logger.info(
-                    "Taking random sample of mapped geographies for smoke test."
-                )
-                random.seed(random_seed)
-                num_geos = sum(1 for _ in reader.iterate(dataset_config["file"]))
-                geo_indices = list(range(num_geos))
-                sample_size = min(num_geos, dataset_max_size)
-                sample_indices = random.sample(geo_indices, sample_size)
-                mapped_geos = (
-                    geo for idx, geo in enumerate(mapped_geos) if idx in sample_indices
-                )
-
             # Bulk insert mapped geographies to table in batches
             try:
                 self._logger.info(
                     f'Inserting "{dataset_name}" into Geography database table.'
                 )
-                num_inserted = dynamic_bulk_insert(
-                    mapped_geos, Geography.objects, self._logger
+                num_inserted = copy_insert(
+                    mapped_geos, Geography.objects, Geography.COPY_COLUMNS, self._logger
                 )
                 self._logger.info(
-                    f"{num_inserted:,} record(s) successfully "
-                    "inserted (or ignored if already present)."
+                    f"{num_inserted:,} record(s) successfully inserted. "
+                    "Records already present were ignored."
                 )
             except (IntegrityError, ValueError, ProgrammingError) as e:
                 self._logger.error(
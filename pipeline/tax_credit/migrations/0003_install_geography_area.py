@@ -0,0 +1,25 @@
+# Manually created
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    initial = False
+
+    dependencies = [
+        ("tax_credit", "0002_install_indexed_search_fields"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+              ALTER TABLE tax_credit_geography
+              ADD COLUMN area double precision
+              GENERATED ALWAYS AS (ST_AREA(geometry)) STORED;
+            """,
+            reverse_sql="""
+              ALTER TABLE tax_credit_geography DROP COLUMN area;
+            """,
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Manually created
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    initial = False
+
+    dependencies = [
+        ("tax_credit", "0003_install_geography_area"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="""
+              ALTER TABLE tax_credit_geography
+              ADD COLUMN state_fips varchar(2)
+              GENERATED ALWAYS AS (SUBSTRING(fips, 1, 2)) STORED,
+              ADD COLUMN county_fips varchar(5)
+              GENERATED ALWAYS AS (SUBSTRING(fips, 1, 5)) STORED;
+            """,
+            reverse_sql="""
+              ALTER TABLE tax_credit_geography
+              DROP COLUMN state_fips,
+              DROP COLUMN county_fips;
+            """,
+        ),
+        migrations.RunSQL(
+            sql="""
+                CREATE INDEX geography_type_fips_idx
+                ON tax_credit_geography
+                USING btree(geography_type, state_fips, county_fips);
+            """,
+            reverse_sql="""
+                DROP INDEX geography_type_fips_idx
+            """,
+        ),
+    ]
@@ -1,15 +1,22 @@
 """Defines models used to create database tables.
 """
 
-# Third-party imports
+# Standard library imports
 import json
-import pandas as pd
+from typing import List
+
+# Third-party imports
+import pyarrow as pa
+import pyarrow.compute as pc
+import shapely
 from django.db.models import Case, Value, When
 from django.db.models.functions import Cast
 from django.contrib.gis.db.models import MultiPolygonField
-from django.contrib.gis.geos import GEOSGeometry, MultiPolygon
 from django.db import models
 
+# Application imports
+from common.db import to_fixed_width_binary
+
 
 class Geography(models.Model):
     """Represents a geography published by a data source."""
@@ -117,49 +124,74 @@ class Geography(models.Model):
         }
         return f"Geography({attrs})"
 
+    COPY_COLUMNS = [
+        ("name", "text", "name"),
+        ("fips", "text", "COALESCE(fips, '')"),
+        ("fips_pattern", "text", "COALESCE(fips_pattern, '')"),
+        ("geography_type", "text", "geography_type"),
+        ("population", "bigint", "population"),
+        ("population_strategy", "text", "population_strategy"),
+        ("as_of", "text", "as_of::date"),
+        ("published_on", "text", "published_on::date"),
+        ("source", "text", "source"),
+        ("geometry", "geometry", "ST_MULTI(geometry)"),
+    ]
+    """The destination column, staging column type and select expression
+    of each field loaded into the table through a binary `COPY`.
+    """
+
     @staticmethod
-    def from_series(data: pd.Series) -> "Geography":
-        """Maps a row from a cleaned geography dataset
-        into a `Geography` database model object.
+    def to_copy_batch(batch: pa.RecordBatch) -> List[pa.Array]:
+        """Maps a record batch from a cleaned geography dataset into
+        binary columns encoded for a `COPY` into a staging table with
+        the columns given by `COPY_COLUMNS`. The whole batch is converted
+        at once, without creating a Python object per row. Geometries are
+        encoded as EWKB with the SRID of the geometry field.
 
         Args:
-            data (`pd.Series`): The row. Expected to
-                have the columns "geometry", "name",
-                "fips", "fips_pattern", "geography_type",
-                "as_of", "published_on" and "source".
+            batch (`pa.RecordBatch`): The batch. Expected to
+                have the columns "geometry", "name", "fips",
+                "fips_pattern", "geography_type", "population",
+                "population_strategy", "as_of", "published_on"
+                and "source".
 
         Returns:
-            (`Geography`): The object.
+            (`list` of `pa.Array`): The encoded columns.
         """
         try:
-            # Correct row geometry to ensure MultiPolygon type
-            geos_geom: GEOSGeometry = GEOSGeometry(memoryview(data["geometry"]))
-            safe_geometry = (
-                geos_geom
-                if geos_geom.geom_type == "MultiPolygon"
-                else MultiPolygon(geos_geom)
-            )
+            columns = []
+            for name, type, _ in Geography.COPY_COLUMNS:
+                column = batch.column(name)
+
+                # Encode geometries as EWKB
+                if name == "geometry":
+                    srid = Geography._meta.get_field("geometry").srid
+                    geoms = shapely.from_wkb(column.to_numpy(zero_copy_only=False))
+                    geoms = shapely.set_srid(geoms, srid)
+                    ewkbs = shapely.to_wkb(geoms, include_srid=True)
+                    columns.append(pa.array(ewkbs, type=pa.binary()))
+
+                # Encode integers as big-endian 64-bit values
+                elif type == "bigint":
+                    if pa.types.is_floating(column.type):
+                        column = pc.if_else(pc.is_nan(column), None, column)
+                    values = pc.fill_null(column, 0).cast(pa.int64()).to_numpy()
+                    encoded = to_fixed_width_binary(values.astype(">i8"))
+                    columns.append(pc.if_else(pc.is_null(column), None, encoded))
+
+                # Encode remaining values as UTF-8 text
+                else:
+                    columns.append(column.cast(pa.string()).cast(pa.binary()))
 
-            # Build geography
-            return Geography(
-                name=data["name"],
-                fips="" if not data["fips"] else data["fips"],
-                fips_pattern=("" if not data["fips_pattern"] else data["fips_pattern"]),
-                geography_type=data["geography_type"],
-                population=data["population"],
-                population_strategy=data["population_strategy"],
-                as_of=data["as_of"],
-                published_on=data["published_on"],
-                source=data["source"],
-                geometry=safe_geometry,
-            )
         except KeyError as e:
             raise RuntimeError(
-                f"Failed to create Geography database record. "
-                f'Data missing expected key "{e}". The actual '
-                f"keys are: {', '.join(data.keys())}."
+                f"Failed to map batch to Geography database records. "
+                f'Data missing expected column "{e}". The actual '
+                f"columns are: {', '.join(batch.schema.names)}."
             ) from e
 
+        return columns
+
 
 class TargetBonusGeographyOverlap(models.Model):
     """Represents an association between a target geography
@@ -2,13 +2,21 @@
 """
 
 # Standard library imports
+import functools
+import hashlib
+import json
 import logging
-import math
-from typing import Optional
+import time
+from pathlib import PurePosixPath
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Third-party imports
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
+from django.conf import settings
+from scipy import sparse
 
 # Application imports
 from common.storage import DataLoader, DataWriter
@@ -18,36 +26,224 @@ from tax_credit.models import Geography
 class PopulationService:
     """A data access layer for U.S. population counts."""
 
+    POP_CENTROIDS = "population centroids"
+    """The name of the population-weighted centroids table."""
+
+    ZCTA_POPULATIONS = "ZCTA populations"
+    """The name of the zip code tabulation area population table."""
+
+    PLACE_POPULATIONS = "place populations"
+    """The name of the census place population table."""
+
+    COUSUB_POPULATIONS = "county subdivision populations"
+    """The name of the census county subdivision population table."""
+
     def __init__(
         self,
-        pop_centroids: gpd.GeoDataFrame,
-        zcta_pop_df: pd.DataFrame,
-        place_pop_df: pd.DataFrame,
-        cousub_pop_df: pd.DataFrame,
+        pop_centroids: Union[gpd.GeoDataFrame, Callable[[], gpd.GeoDataFrame]],
+        zcta_pop_df: Union[pd.DataFrame, Callable[[], pd.DataFrame]],
+        place_pop_df: Union[pd.DataFrame, Callable[[], pd.DataFrame]],
+        cousub_pop_df: Union[pd.DataFrame, Callable[[], pd.DataFrame]],
+        logger: Optional[logging.Logger] = None,
+        load_rollup: Optional[
+            Callable[[Tuple[str, ...], Callable[[], pd.DataFrame]], pd.DataFrame]
+        ] = None,
     ) -> None:
-        """Initializes a new instance of a `PopulationService`.
+        """Initializes a new instance of a `PopulationService`. Each
+        dataset may be given directly or as a function that loads it,
+        in which case the dataset is loaded upon first access.
 
         Args:
-            pop_centroids (`gpd.GeoDataFrame`): The centers of population
-                used to compute population totals for different geographies.
+            pop_centroids (`gpd.GeoDataFrame` | `Callable`): The centers of
+                population used to compute population totals for different
+                geographies.
+
+            zcta_pop_df (`pd.DataFrame` | `Callable`): Population totals for
+                zip code tabulation areas.
+
+            place_pop_df (`pd.DataFrame` | `Callable`): Population totals
+                for census places.
 
-            zcta_pop_df (`pd.DataFrame`): Population totals for zip code
-                tabulation areas.
+            cousub_pop_df (`pd.DataFrame` | `Callable`): Population totals
+                for census county subdivisions.
+
+            logger (`logging.Logger`): A standard logger instance. Defaults
+                to `None`, in which case the module logger is used.
+
+            load_rollup (`Callable`): A function that loads a persisted
+                FIPS rollup of the given centers of population, given the
+                names of its FIPS code columns and a function computing the
+                rollup on a cache miss. Defaults to `None`, in which case
+                rollups are computed and held in memory only. Not used once
+                the centers of population are replaced.
+
+        Returns:
+            `None`
+        """
+        self._logger = logger or logging.getLogger(__name__)
+        self._sources: Dict[str, Any] = {}
+        self._tables: Dict[str, pd.DataFrame] = {}
+        self._load_times: Dict[str, float] = {}
+        self.pop_centroids = pop_centroids
+        self._load_rollup = load_rollup
+        self._sources[self.ZCTA_POPULATIONS] = zcta_pop_df
+        self._sources[self.PLACE_POPULATIONS] = place_pop_df
+        self._sources[self.COUSUB_POPULATIONS] = cousub_pop_df
+
+    def _get_table(self, name: str) -> pd.DataFrame:
+        """Fetches a table by name, loading it on first access
+        if it was given as a loader function. Records the time
+        taken by each load.
 
-            place_pop_df (`pd.DataFrame`): Population totals for census places.
+        Args:
+            name (`str`): The table name.
 
-            cousub_pop_df (`pd.DataFrame`): Population totals for
-                census county subdivisions.
+        Returns:
+            (`pd.DataFrame`): The table.
+        """
+        if name not in self._tables:
+            source = self._sources[name]
+            if callable(source):
+                self._logger.info(f'Loading "{name}" table upon first use.')
+                start = time.perf_counter()
+                self._tables[name] = source()
+                self._load_times[name] = time.perf_counter() - start
+                self._logger.info(
+                    f'Loaded {len(self._tables[name]):,} "{name}" record(s) '
+                    f"in {self._load_times[name]:.2f} second(s)."
+                )
+            else:
+                self._tables[name] = source
+        return self._tables[name]
+
+    def load_tables(self) -> None:
+        """Loads every table not yet loaded. Useful before forking
+        worker processes so that they share the loaded tables
+        rather than each loading its own copy.
 
-            logger (`logging.Logger`):  A standard logger instance.
+        Args:
+            `None`
 
         Returns:
             `None`
         """
-        self._pop_centroids = pop_centroids
-        self._zcta_pop_df = zcta_pop_df
-        self._place_pop_df = place_pop_df
-        self._cousub_pop_df = cousub_pop_df
+        for name in self._sources:
+            self._get_table(name)
+
+    @property
+    def load_times(self) -> Dict[str, float]:
+        """The tables loaded upon first use so far, mapped
+        to the number of seconds each took to load.
+        """
+        return dict(self._load_times)
+
+    @property
+    def pop_centroids(self) -> gpd.GeoDataFrame:
+        """The centers of population used to compute
+        population totals for different geographies.
+        """
+        return self._get_table(self.POP_CENTROIDS)
+
+    @pop_centroids.setter
+    def pop_centroids(
+        self, value: Union[gpd.GeoDataFrame, Callable[[], gpd.GeoDataFrame]]
+    ) -> None:
+        """Sets the centers of population and discards any spatial
+        indices and rollups built from the previous centers.
+        """
+        self._load_rollup = None
+        self._sources[self.POP_CENTROIDS] = value
+        self._tables.pop(self.POP_CENTROIDS, None)
+        self._centroid_indices: Dict[str, Tuple[np.ndarray, shapely.STRtree]] = {}
+        self._fips_rollups: Dict[Tuple[str, ...], pd.DataFrame] = {}
+
+    @property
+    def zcta_pop_df(self) -> pd.DataFrame:
+        """Population totals for zip code tabulation areas."""
+        return self._get_table(self.ZCTA_POPULATIONS)
+
+    @property
+    def place_pop_df(self) -> pd.DataFrame:
+        """Population totals for census places."""
+        return self._get_table(self.PLACE_POPULATIONS)
+
+    @property
+    def cousub_pop_df(self) -> pd.DataFrame:
+        """Population totals for census county subdivisions."""
+        return self._get_table(self.COUSUB_POPULATIONS)
+
+    def _get_fips_rollup(self, pop_cols: Tuple[str, ...]) -> pd.DataFrame:
+        """Fetches the total population of the centroids grouped by
+        the given FIPS code columns, aggregating them only upon the
+        first request for that combination of columns, or loading them
+        from the persisted rollups if configured. The rollup is reused
+        by all later joins until the centroids are replaced.
+
+        Args:
+            pop_cols (`tuple` of `str`): The names of the centroid
+                columns holding the FIPS codes (e.g., "STATEFP").
+
+        Returns:
+            (`pd.DataFrame`): The rollup, with one row per distinct FIPS
+                code combination and a "POPULATION" column.
+        """
+        if pop_cols not in self._fips_rollups:
+
+            def compute_rollup() -> pd.DataFrame:
+                return (
+                    self.pop_centroids.loc[:, [*pop_cols, "POPULATION"]]
+                    .groupby(list(pop_cols), sort=False)
+                    .sum()
+                    .reset_index()
+                )
+
+            self._fips_rollups[pop_cols] = (
+                self._load_rollup(pop_cols, compute_rollup)
+                if self._load_rollup
+                else compute_rollup()
+            )
+        return self._fips_rollups[pop_cols]
+
+    def _get_centroid_index(self, crs: str) -> Tuple[np.ndarray, shapely.STRtree]:
+        """Fetches the population counts of the centroids and a spatial
+        index over the centroid points, both projected to the given CRS.
+        The centroids are reprojected and indexed only once per CRS
+        and then reused by subsequent calls.
+
+        Args:
+            crs (`str`): The Coordinate Reference System (CRS)
+                of the geographies to be queried against the index.
+
+        Returns:
+            ((`np.ndarray`, `shapely.STRtree`)): The centroid population
+                counts and the index of centroid points, in the same order.
+        """
+        key = str(crs)
+        if key not in self._centroid_indices:
+            centroids = self.pop_centroids.to_crs(crs=crs)
+            populations = centroids["POPULATION"].to_numpy(dtype=np.int64)
+            tree = shapely.STRtree(centroids.geometry.to_numpy())
+            self._centroid_indices[key] = (populations, tree)
+        return self._centroid_indices[key]
+
+    def query_centroids(
+        self, geometries: gpd.GeoSeries
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Finds the centroids that fall within each geometry's
+        borders (i.e., using the "contains" predicate) with a
+        single bulk query against the prebuilt spatial index.
+
+        Args:
+            geometries (`gpd.GeoSeries`): The geometries.
+
+        Returns:
+            ((`np.ndarray`, `np.ndarray`, `np.ndarray`)): The positional
+                indices of the geometries and centroids in each containing
+                pair, followed by the population counts of all centroids.
+        """
+        populations, tree = self._get_centroid_index(geometries.crs)
+        geom_idx, centroid_idx = tree.query(geometries.to_numpy(), predicate="contains")
+        return geom_idx, centroid_idx, populations
 
     @staticmethod
     def _build_census_block_group_centers(
@@ -88,10 +284,9 @@ class PopulationService:
         """
         # Load census blocks from shapefiles
         logger.info("Loading census blocks from shapefiles.")
-        blk_gdf = None
-        for pth in reader.list_directory_contents(shapefile_fpath):
-            gdf = reader.read_shapefile(pth, dtype=str, crs=shapefile_crs)
-            blk_gdf = gdf if blk_gdf is None else pd.concat([blk_gdf, gdf])
+        blk_gdf = reader.read_shapefiles(
+            shapefile_fpath, columns=["GEOID20", "INTPTLAT20", "INTPTLON20"]
+        )
 
         # Create new GeoDataFrame using census blocks' internal points as geometries
         logger.info("Parsing census block internal points as geometries.")
@@ -136,67 +331,27 @@ class PopulationService:
             right=house_units_df, how="left", left_on="GEOID20", right_on="GEOID_BLK"
         )
 
-        # Group resulting records by block group
-        logger.info("Grouping merged points by census block group id.")
-        grouped = merged_blk_pts_gdf.groupby(by="GEOID_BLKGRP")
-
         # Aggregate housing unit counts at the block group level by
         # computing the mean center of the housing units within each block group
         logger.info(
-            "Iterating through block groups to compute each group's mean center "
-            "latitude and longitude of housing from constituent blocks."
-        )
-        centers = []
-        for grp_key in grouped.groups:
-
-            # Fetch blocks within block group
-            logger.info(f'Processing blocks in block group "{grp_key}".')
-            grp_gdf = grouped.get_group(grp_key)
-
-            # Remove blocks without housing units from calculation
-            populated_gdf = grp_gdf.query("HOUSING_UNITS > 0")
-            if not len(populated_gdf):
-                logger.info("No blocks in group have housing units. Skipping.")
-                continue
-
-            # Initialize variables to simplify computation of mean center
-            blk_unit_counts = populated_gdf["HOUSING_UNITS"]
-            total_units = populated_gdf["HOUSING_UNITS"].sum()
-            longitudes = populated_gdf["geometry"].x
-            latitudes = populated_gdf["geometry"].y
-            proj_latitudes = latitudes.apply(math.cos)
-
-            # Calculate mean center latitude and longitude
-            # of block group housing from blocks
-            center_lat = sum(blk_unit_counts * latitudes) / total_units
-            center_lon = sum(blk_unit_counts * longitudes * proj_latitudes) / sum(
-                blk_unit_counts * proj_latitudes
-            )
-
-            # Append new center to list
-            centers.append(
-                {
-                    "GEOID_BLKGRP": grp_key,
-                    "STATEFP": populated_gdf["STATEFP"].iloc[0],
-                    "COUNTYFP": populated_gdf["COUNTYFP"].iloc[0],
-                    "TRACTCE": populated_gdf["TRACTCE"].iloc[0],
-                    "BLKGRPCE": populated_gdf["BLKGRPCE"].iloc[0],
-                    "LATITUDE": center_lat,
-                    "LONGITUDE": center_lon,
-                }
-            )
+            "Computing each block group's mean center latitude and "
+            "longitude of housing from constituent blocks."
+        )
+        centers_df = PopulationService._compute_weighted_mean_centers(
+            merged_blk_pts_gdf, weight_col="HOUSING_UNITS"
+        )
 
         # Convert centers to GeoDataFrame
         logger.info(
-            f"{len(centers)} center points generated after "
-            f"processing {len(grouped)} block groups. "
+            f"{len(centers_df)} center points generated after processing "
+            f"{merged_blk_pts_gdf['GEOID_BLKGRP'].nunique()} block groups. "
             "Converting points to final GeoDataFrame."
         )
         centers_gdf = gpd.GeoDataFrame(
-            data=centers,
+            data=centers_df,
             geometry=gpd.points_from_xy(
-                x=[pt["LONGITUDE"] for pt in centers],
-                y=[pt["LATITUDE"] for pt in centers],
+                x=centers_df["LONGITUDE"],
+                y=centers_df["LATITUDE"],
             ),
             dtype=str,
             crs=shapefile_crs,
@@ -204,6 +359,73 @@ class PopulationService:
 
         return centers_gdf
 
+    @staticmethod
+    def _compute_weighted_mean_centers(
+        blk_pts_gdf: gpd.GeoDataFrame, weight_col: str
+    ) -> pd.DataFrame:
+        """Computes the weighted mean center of each census block group
+        from the internal points of its constituent blocks in a single
+        vectorized pass. Blocks with a weight of zero (or a null weight)
+        are excluded, and block groups without any remaining blocks are
+        omitted from the output. Longitudes are weighted by the cosine of
+        the block latitude per the formula referenced in
+        `_build_census_block_group_centers`.
+
+        Args:
+            blk_pts_gdf (`gpd.GeoDataFrame`): The census block points.
+                Expected to have the columns "GEOID_BLKGRP", "STATEFP",
+                "COUNTYFP", "TRACTCE", "BLKGRPCE", "geometry" and
+                the weight column.
+
+            weight_col (`str`): The name of the column holding the
+                block weights (e.g., housing unit counts).
+
+        Returns:
+            (`pd.DataFrame`): The block group centers, sorted by block
+                group id, with the columns "GEOID_BLKGRP", "STATEFP",
+                "COUNTYFP", "TRACTCE", "BLKGRPCE", "LATITUDE" and
+                "LONGITUDE".
+        """
+        # Remove blocks without weights from calculation
+        populated_gdf = blk_pts_gdf[
+            (blk_pts_gdf[weight_col] > 0) & blk_pts_gdf["GEOID_BLKGRP"].notna()
+        ]
+
+        # Compute weighted coordinate terms for all blocks at once
+        weights = populated_gdf[weight_col].to_numpy(dtype=float)
+        longitudes = populated_gdf.geometry.x.to_numpy()
+        latitudes = populated_gdf.geometry.y.to_numpy()
+        proj_weights = weights * np.cos(latitudes)
+        terms_df = pd.DataFrame(
+            {
+                "GEOID_BLKGRP": populated_gdf["GEOID_BLKGRP"].to_numpy(),
+                "WEIGHT": weights,
+                "WEIGHTED_LAT": weights * latitudes,
+                "WEIGHTED_LON": proj_weights * longitudes,
+                "PROJ_WEIGHT": proj_weights,
+            }
+        )
+
+        # Sum terms by block group
+        sums_df = terms_df.groupby(by="GEOID_BLKGRP", sort=True).sum()
+
+        # Take geography identifiers from first populated block in each group
+        id_cols = ["GEOID_BLKGRP", "STATEFP", "COUNTYFP", "TRACTCE", "BLKGRPCE"]
+        ids_df = (
+            populated_gdf[id_cols]
+            .drop_duplicates(subset="GEOID_BLKGRP")
+            .set_index("GEOID_BLKGRP")
+            .loc[sums_df.index]
+        )
+
+        # Calculate mean center latitude and longitude of each block group
+        centers_df = ids_df.assign(
+            LATITUDE=sums_df["WEIGHTED_LAT"] / sums_df["WEIGHT"],
+            LONGITUDE=sums_df["WEIGHTED_LON"] / sums_df["PROJ_WEIGHT"],
+        )
+
+        return centers_df.reset_index()
+
     @staticmethod
     def _build_census_block_group_populations(
         reader: DataLoader,
@@ -235,10 +457,7 @@ class PopulationService:
         """
         # Loading census block group shapefiles
         logger.info("Loading census block group shapefiles.")
-        blkgrp_gdf = None
-        for pth in reader.list_directory_contents(shapefile_fpath):
-            gdf = reader.read_shapefile(pth, dtype=str, crs=shapefile_crs)
-            blkgrp_gdf = gdf if blkgrp_gdf is None else pd.concat([blkgrp_gdf, gdf])
+        blkgrp_gdf = reader.read_shapefiles(shapefile_fpath)
 
         # Load census block group populations
         logger.info("Loading census block group population counts.")
@@ -263,7 +482,175 @@ class PopulationService:
         return blkgrp_gdf
 
     @staticmethod
-    def initialize(
+    def _checksum_inputs(reader: DataLoader, patterns: List[str], *options) -> str:
+        """Computes a single checksum over the contents of every input
+        file matching the given glob patterns and the options used to
+        process them, for use as a cache key. The key changes whenever
+        an input file is added, removed or modified.
+
+        Args:
+            reader (`DataLoader`): A client for reading input files
+                from a local or cloud data store.
+
+            patterns (`list` of `str`): The relative paths to the input
+                files within the configured data store. May contain
+                shell-like wildcards.
+
+            *options: Additional JSON-serializable values to
+                include in the key (e.g., column types).
+
+        Returns:
+            (`str`): The hexadecimal MD5 digest.
+        """
+        checksums = [
+            [(fpath, reader.checksum(fpath)) for fpath in sorted(matches)]
+            for matches in map(reader.list_directory_contents, patterns)
+        ]
+        key = json.dumps([checksums, options], sort_keys=True, default=str)
+        return hashlib.md5(key.encode()).hexdigest()
+
+    @staticmethod
+    def _load_cached_table(
+        reader: DataLoader,
+        writer: DataWriter,
+        fpath: str,
+        columns: Dict[str, str],
+        logger: logging.Logger,
+        cache_dir: str = settings.POPULATION_CACHE_DIRECTORY,
+    ) -> pd.DataFrame:
+        """Loads select columns of a pipe-delimited population file
+        from an Apache Arrow IPC (Feather) cache keyed by the checksum
+        of the source file. On a cache miss, the source file is parsed
+        into the given column types and the cache is written, uncompressed,
+        for use by subsequent runs, which memory-map it. Because the
+        checksum changes with the file contents, stale caches are never read.
+
+        Args:
+            reader (`DataLoader`): A client for reading input files
+                from a local or cloud data store.
+
+            writer (`DataWriter`): A client for writing data to a local
+                or cloud store.
+
+            fpath (`str`): The relative path within the configured
+                data store to the source file.
+
+            columns (`dict` of `str`, `str`): The columns to keep,
+                mapped to their data types (e.g., "Int64").
+
+            logger (`logging.Logger`): A standard logger instance.
+
+            cache_dir (`str`): The relative path within the configured
+                data store to the cache directory. Defaults to the value
+                defined in configuration settings.
+
+        Returns:
+            (`pd.DataFrame`): The population counts.
+        """
+        # Resolve cache path from source file checksum and column types
+        checksum = PopulationService._checksum_inputs(reader, [fpath], columns)
+        cache_fpath = f"{cache_dir}/{PurePosixPath(fpath).stem}_{checksum}.feather"
+
+        # Load cached table if it exists
+        try:
+            return reader.read_feather(cache_fpath)
+        except FileNotFoundError:
+            logger.info(f'No cache found at "{cache_fpath}". Parsing source file.')
+
+        # Otherwise, parse source file and cache result
+        df = reader.read_csv(
+            file_name=fpath, dtype=columns, delimiter="|", usecols=list(columns)
+        )
+        writer.write_feather(cache_fpath, df)
+        return df
+
+    @staticmethod
+    def _resolve_centroids_fpath(
+        reader: DataLoader,
+        output_centroids_fpath: str,
+        input_fpaths: List[str],
+        crs_names: List[str],
+    ) -> str:
+        """Appends the checksum of the input files and Coordinate
+        Reference Systems (CRSs) used to build the population centroids
+        to the configured centroids file name, so that changed inputs
+        are never served a stale dataset.
+
+        Args:
+            reader (`DataLoader`): A client for reading input files
+                from a local or cloud data store.
+
+            output_centroids_fpath (`str`): The configured relative
+                path within the data store to the centroids file.
+
+            input_fpaths (`list` of `str`): The relative paths to the
+                input files. May contain shell-like wildcards.
+
+            crs_names (`list` of `str`): The CRSs of the input files
+                and of the centroids.
+
+        Returns:
+            (`str`): The relative path to the keyed centroids file.
+        """
+        checksum = PopulationService._checksum_inputs(reader, input_fpaths, crs_names)
+        fpath = PurePosixPath(output_centroids_fpath)
+        return str(fpath.with_stem(f"{fpath.stem}_{checksum}"))
+
+    @staticmethod
+    def _load_cached_rollup(
+        reader: DataLoader,
+        writer: DataWriter,
+        resolve_centroids_fpath: Callable[[], str],
+        logger: logging.Logger,
+        pop_cols: Tuple[str, ...],
+        compute_rollup: Callable[[], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """Loads a FIPS rollup of the population centroids from an Apache
+        Arrow IPC (Feather) file persisted next to the keyed centroids file,
+        so that the rollup is computed only once for each set of inputs,
+        rather than once by every process. On a cache miss, the rollup is
+        computed and the cache is written for use by subsequent runs.
+
+        Args:
+            reader (`DataLoader`): A client for reading input files
+                from a local or cloud data store.
+
+            writer (`DataWriter`): A client for writing data to a local
+                or cloud store.
+
+            resolve_centroids_fpath (`Callable`): A function returning the
+                relative path to the keyed population centroids file.
+
+            logger (`logging.Logger`): A standard logger instance.
+
+            pop_cols (`tuple` of `str`): The names of the centroid
+                columns holding the FIPS codes (e.g., "STATEFP").
+
+            compute_rollup (`Callable`): A function computing the rollup.
+
+        Returns:
+            (`pd.DataFrame`): The rollup.
+        """
+        # Resolve cache path from the keyed centroids file and FIPS columns
+        centroids_fpath = PurePosixPath(resolve_centroids_fpath())
+        suffix = "_".join(pop_cols).lower()
+        cache_fpath = str(
+            centroids_fpath.with_name(f"{centroids_fpath.stem}_{suffix}.feather")
+        )
+
+        # Load cached rollup if it exists
+        try:
+            return reader.read_feather(cache_fpath)
+        except FileNotFoundError:
+            logger.info(f'No rollup found at "{cache_fpath}". Computing rollup.')
+
+        # Otherwise, compute rollup and cache result
+        rollup_df = compute_rollup()
+        writer.write_feather(cache_fpath, rollup_df)
+        return rollup_df
+
+    @staticmethod
+    def _load_population_centroids(
         reader: DataLoader,
         writer: DataWriter,
         island_blk_housing_fpath: str,
@@ -276,28 +663,11 @@ class PopulationService:
         us_blk_grp_centroids_crs: str,
         output_centroids_fpath: str,
         output_centroids_crs: str,
-        zcta_pop_fpath: str,
-        place_pop_fpath: str,
-        county_subdivision_pop_fpath: str,
         logger: logging.Logger,
-    ) -> "PopulationService":
-        """Creates and initializes a new `PopulationService` instance by loading
-        a dataset of census block group centers of population for the U.S. and its
-        territories into memory, or by creating the dataset if it does not exist.
-
-        NOTE: To estimate populations for a wide range of geographies and
-        their intersections, we use centers of population defined within census
-        block groups. These centers can be joined to other geographies by attribute
-        (i.e., "FIPS code") or through a spatial intersection. The Census Bureau
-        reports centers of population for the 50 U.S. states, the District of
-        Columbia, and Puerto Rico every decennial census. However, centers of
-        population must be computed manually for the remaining Island Areas—i.e.,
-        American Samoa, the Commonwealth of the Northern Mariana Islands, Guam,
-        and the U.S. Virgin Islands. To establish mean centers of population at the
-        block group level, one can calculate the average latitude and longitude of
-        its census block's centroids (internal points), weighted by population count.
-        Population count do not exist at the block level for the island areas, so
-        housing unit density was used as a proxy instead.
+    ) -> gpd.GeoDataFrame:
+        """Loads the dataset of census block group centers of population
+        for the U.S. and its territories, or creates the dataset if it does
+        not exist. See `PopulationService.initialize` for more details.
 
         Args:
             reader (`DataLoader`): A client for reading input files
@@ -339,64 +709,25 @@ class PopulationService:
             output_centroids_fpath (`str`): The relative path within the
                 configured data store to the file holding the final, combined
                 set of center points for all of the U.S. States, District
-                of Columbia, and the Island Areas.
+                of Columbia, and the Island Areas, keyed by the checksums
+                of the input files (see `_resolve_centroids_fpath`).
 
             output_centroids_crs (`str`): The Coordinate Reference
                 System (CRS) of the final dataset of center points.
 
-            zcta_pop_fpath (`str`): The relative path within the configured
-                data store to the file containing census zip code tabulation
-                area population counts.
-
-            place_pop_fpath (`str`): The relative path within the configured
-                data store to the file containing census place population counts.
-
-            county_subdivision_pop_fpath (`str`): The relative path within the
-                configured data store to the file containing census county
-                subdivision population counts.
-
             logger (`logging.Logger`): A standard logger instance.
 
         Returns:
-            (`PopulationService`): The store instance.
+            (`gpd.GeoDataFrame`): The population-weighted centroids.
         """
-        # Log start of process
-        logger.info("Creating and initializing new population service.")
-
-        # Load census zip code tabulation area population counts
-        logger.info("Loading population dataset for census ZCTAs.")
-        zcta_pop_df = reader.read_csv(
-            file_name=zcta_pop_fpath, dtype=str, delimiter="|"
-        )
-        logger.info(f"{len(zcta_pop_df):,} record(s) loaded.")
-
-        # Load census place population counts
-        logger.info("Loading population dataset for census places.")
-        place_pop_df = reader.read_csv(
-            file_name=place_pop_fpath, dtype=str, delimiter="|"
-        )
-        logger.info(f"{len(place_pop_df):,} record(s) loaded.")
-
-        # Load census county subdivision population counts
-        logger.info("Loading population dataset for census county subdivisions.")
-        cousub_pop_df = reader.read_csv(
-            file_name=county_subdivision_pop_fpath, dtype=str, delimiter="|"
-        )
-        logger.info(f"{len(cousub_pop_df):,} record(s) loaded.")
-
-        # If population centroids dataset exists, load and then instantiate store
+        # If population centroids dataset exists, load and return
         try:
             logger.info(
                 "Attempting to load pre-existing population-weighted centroids."
             )
             all_centroids_gdf = reader.read_parquet(output_centroids_fpath)
-            logger.info(
-                f"{len(all_centroids_gdf):,} record(s) loaded. "
-                "Instantiating new population service."
-            )
-            return PopulationService(
-                all_centroids_gdf, zcta_pop_df, place_pop_df, cousub_pop_df
-            )
+            logger.info(f"{len(all_centroids_gdf):,} record(s) loaded.")
+            return all_centroids_gdf
         except FileNotFoundError:
             logger.info("No file found. Building dataset anew.")
 
@@ -504,10 +835,191 @@ class PopulationService:
         logger.info("Caching to configured storage location as GeoParquet file.")
         writer.write_geoparquet(output_centroids_fpath, all_centroids_gdf)
 
-        # Create and return new instance of store
-        logger.info("Instantiating new population service.")
+        return all_centroids_gdf
+
+    @staticmethod
+    def initialize(
+        reader: DataLoader,
+        writer: DataWriter,
+        island_blk_housing_fpath: str,
+        island_blk_shapefile_fpath: str,
+        island_blk_shapefile_crs: str,
+        island_blk_grp_pop_fpath: str,
+        island_blk_grp_shapefile_fpath: str,
+        island_blk_grp_shapefile_crs: str,
+        us_blk_grp_centroids_fpath: str,
+        us_blk_grp_centroids_crs: str,
+        output_centroids_fpath: str,
+        output_centroids_crs: str,
+        zcta_pop_fpath: str,
+        place_pop_fpath: str,
+        county_subdivision_pop_fpath: str,
+        logger: logging.Logger,
+    ) -> "PopulationService":
+        """Creates and initializes a new `PopulationService` instance that loads
+        a dataset of census block group centers of population for the U.S. and its
+        territories into memory, or creates the dataset if it does not exist. The
+        centers and the population tables are each loaded lazily, upon first use.
+
+        NOTE: To estimate populations for a wide range of geographies and
+        their intersections, we use centers of population defined within census
+        block groups. These centers can be joined to other geographies by attribute
+        (i.e., "FIPS code") or through a spatial intersection. The Census Bureau
+        reports centers of population for the 50 U.S. states, the District of
+        Columbia, and Puerto Rico every decennial census. However, centers of
+        population must be computed manually for the remaining Island Areas—i.e.,
+        American Samoa, the Commonwealth of the Northern Mariana Islands, Guam,
+        and the U.S. Virgin Islands. To establish mean centers of population at the
+        block group level, one can calculate the average latitude and longitude of
+        its census block's centroids (internal points), weighted by population count.
+        Population count do not exist at the block level for the island areas, so
+        housing unit density was used as a proxy instead.
+
+        Args:
+            reader (`DataLoader`): A client for reading input files
+                from a local or cloud data store.
+
+            writer (`DataWriter`): A client for writing data to a local
+                or cloud store.
+
+            island_blk_housing_fpath (`str`): The relative path within the
+                configured data store to the file containing island area
+                census block housing unit counts.
+
+            island_blk_shapefile_fpath (`str`): The relative path within
+                the configured data store to island area census block
+                shapefiles. Uses a regex pattern to match multiple files.
+
+            island_blk_shapefile_crs (`str`): The Coordinate Reference System
+                (CRS) of the island area census block shapefile(s).
+
+            island_blk_grp_pop_fpath (`str`): The relative path within the
+                configured data store to the island area census block group
+                population data file.
+
+            island_blk_grp_shapefile_fpath (`str`): The relative path within
+                the configured data store to island area census block
+                group shapefiles. Uses a regex pattern to match multiple files.
+
+            island_blk_grp_shapefile_crs (`str`): The Coordinate Reference
+                System (CRS) of the island area census block group shapefile(s).
+
+            us_blk_grp_centroids_fpath (`str`): The relative path within the
+                configured data store to the centers of population file for
+                the 50 U.S. States, District of Columbia, and Puerto Rico.
+
+            us_blk_grp_centroids_crs (`str`): The Coordinate Reference
+                System (CRS) of the census block group shapefile(s) for
+                the 50 U.S. State, District of Columbia, and Puerto Rico.
+
+            output_centroids_fpath (`str`): The relative path within the
+                configured data store to the file holding the final, combined
+                set of center points for all of the U.S. States, District
+                of Columbia, and the Island Areas.
+
+            output_centroids_crs (`str`): The Coordinate Reference
+                System (CRS) of the final dataset of center points.
+
+            zcta_pop_fpath (`str`): The relative path within the configured
+                data store to the file containing census zip code tabulation
+                area population counts.
+
+            place_pop_fpath (`str`): The relative path within the configured
+                data store to the file containing census place population counts.
+
+            county_subdivision_pop_fpath (`str`): The relative path within the
+                configured data store to the file containing census county
+                subdivision population counts.
+
+            logger (`logging.Logger`): A standard logger instance.
+
+        Returns:
+            (`PopulationService`): The store instance.
+        """
+        # Log start of process
+        logger.info("Creating and initializing new population service.")
+
+        # Key the centroids and their rollups by the checksums of the inputs,
+        # computed only once and only when the centroids are first needed
+        resolve_centroids_fpath = functools.cache(
+            functools.partial(
+                PopulationService._resolve_centroids_fpath,
+                reader,
+                output_centroids_fpath,
+                [
+                    island_blk_housing_fpath,
+                    island_blk_shapefile_fpath,
+                    island_blk_grp_pop_fpath,
+                    island_blk_grp_shapefile_fpath,
+                    us_blk_grp_centroids_fpath,
+                ],
+                [
+                    island_blk_shapefile_crs,
+                    island_blk_grp_shapefile_crs,
+                    us_blk_grp_centroids_crs,
+                    output_centroids_crs,
+                ],
+            )
+        )
+
+        # Define loaders for each table, deferred until the table is first used
+        def load_centroids() -> gpd.GeoDataFrame:
+            return PopulationService._load_population_centroids(
+                reader,
+                writer,
+                island_blk_housing_fpath,
+                island_blk_shapefile_fpath,
+                island_blk_shapefile_crs,
+                island_blk_grp_pop_fpath,
+                island_blk_grp_shapefile_fpath,
+                island_blk_grp_shapefile_crs,
+                us_blk_grp_centroids_fpath,
+                us_blk_grp_centroids_crs,
+                resolve_centroids_fpath(),
+                output_centroids_crs,
+                logger,
+            )
+
+        load_rollup = functools.partial(
+            PopulationService._load_cached_rollup,
+            reader,
+            writer,
+            resolve_centroids_fpath,
+            logger,
+        )
+        load_zcta_pops = functools.partial(
+            PopulationService._load_cached_table,
+            reader,
+            writer,
+            zcta_pop_fpath,
+            {"ZCTA5CE20": "str", "TOTAL_POPULATION": "Int64"},
+            logger,
+        )
+        load_place_pops = functools.partial(
+            PopulationService._load_cached_table,
+            reader,
+            writer,
+            place_pop_fpath,
+            {"GEOID_PLACE": "str", "TOTAL_POPULATION": "Int64"},
+            logger,
+        )
+        load_cousub_pops = functools.partial(
+            PopulationService._load_cached_table,
+            reader,
+            writer,
+            county_subdivision_pop_fpath,
+            {"GEOID_SUBDIV": "str", "TOTAL_POPULATION": "Int64"},
+            logger,
+        )
+
+        # Instantiate service
         return PopulationService(
-            all_centroids_gdf, zcta_pop_df, place_pop_df, cousub_pop_df
+            load_centroids,
+            load_zcta_pops,
+            load_place_pops,
+            load_cousub_pops,
+            logger,
+            load_rollup,
         )
 
     def centroids_fips_join(
@@ -564,17 +1076,11 @@ class PopulationService:
             gdf_cols = [state_col]
             pop_cols = ["STATEFP"]
 
-        # Aggregate population data
-        agg_pops = (
-            self._pop_centroids.copy()
-            .loc[:, [*pop_cols, "POPULATION"]]
-            .groupby(pop_cols)
-            .sum()
-            .reset_index()
-        )
+        # Fetch population data aggregated at the requested level
+        agg_pops = self._get_fips_rollup(tuple(pop_cols))
 
         # Merge population counts with geographies on FIPS codes
-        merged_df = df.copy().merge(
+        merged_df = df.merge(
             right=agg_pops, how="left", left_on=gdf_cols, right_on=pop_cols
         )
 
@@ -601,21 +1107,19 @@ class PopulationService:
                 the new merged population column, "population", and a column
                 indicating the aggregation method, "population_strategy".
         """
-        # Reproject population to geography's CRS
-        centroids = self._pop_centroids.copy().to_crs(crs=gdf.crs)
-
-        # Compute populations for geographies from centroids falling within borders
-        geo_pops = (
-            gdf.copy()
-            .sjoin(centroids, how="left", predicate="contains")
-            .loc[:, [id_col, "POPULATION"]]
-            .groupby(by=id_col)
-            .sum()
-            .reset_index()
+        # Sum populations of the centroids falling within each geography's borders
+        geom_idx, centroid_idx, populations = self.query_centroids(gdf.geometry)
+        row_pops = np.bincount(
+            geom_idx, weights=populations[centroid_idx], minlength=len(gdf)
         )
 
-        # Join population counts with geography dataset
-        merged_gdf = gdf.copy().merge(geo_pops, how="left", on=id_col)
+        # Aggregate population counts by geography id
+        merged_gdf = gdf.copy().reset_index(drop=True)
+        merged_gdf["POPULATION"] = (
+            pd.Series(row_pops)
+            .groupby(merged_gdf[id_col], dropna=False)
+            .transform("sum")
+        )
 
         # Finalize population columns
         merged_gdf = merged_gdf.rename(columns={"POPULATION": "population"})
@@ -662,7 +1166,7 @@ class PopulationService:
 
         # Merge population counts with place geographies on FIPS codes
         merged_places_df = places_df.copy().merge(
-            right=self._place_pop_df[["GEOID_PLACE", "TOTAL_POPULATION"]],
+            right=self.place_pop_df[["GEOID_PLACE", "TOTAL_POPULATION"]],
             how="left",
             left_on=place_col,
             right_on="GEOID_PLACE",
@@ -670,7 +1174,7 @@ class PopulationService:
 
         # Merge population counts with county subdivision geographies on FIPS codes
         merged_cousub_df = cousub_df.copy().merge(
-            right=self._cousub_pop_df[["GEOID_SUBDIV", "TOTAL_POPULATION"]],
+            right=self.cousub_pop_df[["GEOID_SUBDIV", "TOTAL_POPULATION"]],
             how="left",
             left_on=cousub_col,
             right_on="GEOID_SUBDIV",
@@ -704,7 +1208,7 @@ class PopulationService:
         """
         # Join population counts with ZCTA dataset
         merged_df = df.copy().merge(
-            right=self._zcta_pop_df[["ZCTA5CE20", "TOTAL_POPULATION"]],
+            right=self.zcta_pop_df[["ZCTA5CE20", "TOTAL_POPULATION"]],
             how="left",
             left_on=zcta_col,
             right_on="ZCTA5CE20",
@@ -715,3 +1219,95 @@ class PopulationService:
         merged_df["population_strategy"] = Geography.PopulationCalculation.FIPS
 
         return merged_df
+
+
+class CentroidOverlapEngine:
+    """Estimates the populations of intersections between geographies
+    of two different types using sparse (geography x centroid) membership
+    matrices. Because a population-weighted centroid falls within the
+    intersection of two geographies exactly when it falls within both,
+    the population of every overlap is given by the matrix product
+    `T * diag(POPULATION) * B'`, where `T` and `B` are the membership
+    matrices of the two geography types. Each membership matrix is
+    computed once per geography type and then reused for every pairing.
+    """
+
+    def __init__(self, population_service: PopulationService) -> None:
+        """Initializes a new instance of a `CentroidOverlapEngine`.
+
+        Args:
+            population_service (`PopulationService`): The client
+                holding the population-weighted centroids.
+
+        Returns:
+            `None`
+        """
+        self._population_service = population_service
+        self._memberships: Dict[str, Tuple[pd.Index, sparse.csr_matrix]] = {}
+        self._populations: Optional[np.ndarray] = None
+
+    def has_membership(self, key: str) -> bool:
+        """A boolean indicating whether a membership
+        matrix has been registered under the given key.
+        """
+        return key in self._memberships
+
+    def add_membership(self, key: str, gdf: gpd.GeoDataFrame, id_col: str) -> None:
+        """Computes and caches the sparse matrix indicating
+        which centroids fall within each geography's borders
+        (i.e., using the "contains" predicate).
+
+        Args:
+            key (`str`): The name under which to store the
+                matrix (e.g., the geography type).
+
+            gdf (`gpd.GeoDataFrame`): The geographies.
+
+            id_col (`str`): The name of the column that
+                provides a unique identifier for each row.
+
+        Returns:
+            `None`
+        """
+        service = self._population_service
+        geom_idx, centroid_idx, populations = service.query_centroids(gdf.geometry)
+        membership = sparse.csr_matrix(
+            (np.ones(len(geom_idx), dtype=np.int64), (geom_idx, centroid_idx)),
+            shape=(len(gdf), len(populations)),
+        )
+        self._memberships[key] = (pd.Index(gdf[id_col]), membership)
+        self._populations = populations
+
+    def overlap_populations(self, target_key: str, bonus_key: str) -> pd.DataFrame:
+        """Computes the population of every overlap between
+        geographies registered under the target and bonus keys
+        as a single sparse matrix product.
+
+        Args:
+            target_key (`str`): The key of the target membership matrix.
+
+            bonus_key (`str`): The key of the bonus membership matrix.
+
+        Returns:
+            (`pd.DataFrame`): The overlaps containing at least one
+                centroid, with the columns "target_id", "bonus_id"
+                and "population".
+        """
+        # Fetch membership matrices
+        target_ids, target_membership = self._memberships[target_key]
+        bonus_ids, bonus_membership = self._memberships[bonus_key]
+
+        # Weight target memberships by centroid population and multiply
+        weights = self._populations[np.newaxis, :]
+        weighted = target_membership.multiply(weights).tocsr()
+        overlaps = weighted @ bonus_membership.T
+        overlaps.eliminate_zeros()
+        overlaps = overlaps.tocoo()
+
+        return pd.DataFrame(
+            {
+                "target_id": target_ids[overlaps.row],
+                "bonus_id": bonus_ids[overlaps.col],
+                "population": overlaps.data,
+            }
+        )
@@ -0,0 +1,538 @@
+"""Benchmarks for building the cleaned geography datasets.
+"""
+
+# Standard library imports
+import logging
+import os
+import tempfile
+import time
+import unittest
+from typing import Callable, List
+from unittest import mock
+
+# Third-party imports
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from shapely.geometry import MultiPolygon, Polygon
+from django.conf import settings
+
+# Application imports
+from common.logger import LoggerFactory
+from common.storage import DataLoader, DataWriter
+from tax_credit.datasets import (
+    CoalDataset,
+    CountyDataset,
+    Justice40Dataset,
+    LowIncomeDataset,
+    MunicipalityWithinStateDataset,
+    StateDataset,
+)
+from tax_credit.models import Geography
+from tax_credit.population import PopulationService
+
+
+def build_fips_centroids(num_centroids: int, seed: int = 12345) -> gpd.GeoDataFrame:
+    """Generates random population-weighted block group centroids
+    labeled with state, county and census tract FIPS codes.
+
+    Args:
+        num_centroids (`int`): The number of centroids to generate.
+
+        seed (`int`): The random seed. Defaults to 12345.
+
+    Returns:
+        (`gpd.GeoDataFrame`): The centroids.
+    """
+    rng = np.random.default_rng(seed)
+    return gpd.GeoDataFrame(
+        data={
+            "STATEFP": pd.Series(rng.integers(1, 57, num_centroids)).map(
+                "{:02d}".format
+            ),
+            "COUNTYFP": pd.Series(rng.integers(1, 60, num_centroids)).map(
+                "{:03d}".format
+            ),
+            "TRACTCE": pd.Series(rng.integers(1, 30, num_centroids)).map(
+                "{:06d}".format
+            ),
+            "POPULATION": rng.integers(0, 3_000, num_centroids),
+        },
+        geometry=gpd.points_from_xy(
+            x=rng.uniform(-125, -67, num_centroids),
+            y=rng.uniform(25, 49, num_centroids),
+        ),
+        crs="EPSG:4269",
+    )
+
+
+def build_tracts(centroids: gpd.GeoDataFrame, seed: int = 54321) -> gpd.GeoDataFrame:
+    """Generates random square census tracts for each distinct
+    combination of FIPS codes found among the centroids.
+
+    Args:
+        centroids (`gpd.GeoDataFrame`): The centroids.
+
+        seed (`int`): The random seed. Defaults to 54321.
+
+    Returns:
+        (`gpd.GeoDataFrame`): The tracts.
+    """
+    tracts = centroids[["STATEFP", "COUNTYFP", "TRACTCE"]].drop_duplicates()
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(-125, -69, len(tracts))
+    y = rng.uniform(25, 47, len(tracts))
+    return gpd.GeoDataFrame(
+        data=tracts.reset_index(drop=True),
+        geometry=shapely.box(x, y, x + 0.2, y + 0.2),
+        crs="EPSG:4269",
+    )
+
+
+def build_municipalities(num_munis: int, seed: int = 12345) -> gpd.GeoDataFrame:
+    """Generates random municipalities with the columns of a loaded
+    `MunicipalityWithinStateDataset`. Roughly one in five government
+    units appears as both a place and a county subdivision, and
+    roughly one in ten municipality names is repeated within a state.
+
+    Args:
+        num_munis (`int`): The number of municipalities to generate.
+
+        seed (`int`): The random seed. Defaults to 12345.
+
+    Returns:
+        (`gpd.GeoDataFrame`): The municipalities.
+    """
+    rng = np.random.default_rng(seed)
+    ids = np.arange(num_munis)
+    names = np.where(rng.random(num_munis) < 0.1, ids // 2, ids).astype(str)
+    gdf = gpd.GeoDataFrame(
+        data={
+            "CENSUS_ID_GIDID": ids.astype(str),
+            "GEOID_PLACE": ids.astype(str),
+            "GEOID_SUBDIV": ids.astype(str),
+            "UNIT_TYPE": "2 - MUNICIPAL",
+            "UNIT_NAME": np.char.add("CITY OF ", names),
+            "NAME": names,
+            "NAMELSAD": np.char.add(
+                np.char.add(names, " "),
+                rng.choice(["city", "town", "township", "village", "12"], num_munis),
+            ),
+            "FIPS_STATE": "01",
+            "STATE_NAME": "Alabama",
+            "COUNTYNAME": "Autauga County",
+            "DATASET": "places",
+        },
+        geometry=gpd.points_from_xy(x=rng.uniform(-88, -85, num_munis), y=ids * 0),
+        crs="EPSG:4269",
+    )
+    gdf.loc[rng.random(num_munis) < 0.05, "COUNTYNAME"] = None
+    dupes = gdf[rng.random(num_munis) < 0.2].assign(DATASET="county subdivisions")
+    return pd.concat([gdf, dupes])
+
+
+def build_name_by_group(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """Standardizes municipality names one group of short name and
+    state at a time. Retained as the reference for the vectorized
+    `MunicipalityWithinStateDataset._build_name`.
+
+    Args:
+        gdf (`gpd.GeoDataFrame`): The municipalities.
+
+    Returns:
+        (`gpd.GeoDataFrame`): The municipalities with a "name" column.
+    """
+
+    def standardize_name(row: pd.Series, is_multiple: bool):
+        entity = row["entity"]
+        county_state = f"{row['COUNTYNAME']}, {row['STATE_NAME']}"
+        if entity == "township" or entity.isdigit():
+            return f"{row['NAMELSAD']}, {county_state}".upper()
+        elif is_multiple:
+            return f"{row['UNIT_NAME']}, {county_state}".upper()
+        else:
+            return f"{row['NAME']}, {row['STATE_NAME']}".upper()
+
+    gdf = gdf.assign(entity=gdf["NAMELSAD"].apply(lambda n: n.split()[-1]))
+    name_grps = gdf.groupby(by=["NAME", "FIPS_STATE"])
+    stnd_gdfs = []
+    for name in name_grps.groups.keys():
+        grp = name_grps.get_group(name)
+        is_multiple = len(grp) > 1
+        grp["name"] = grp.apply(lambda r: standardize_name(r, is_multiple), axis=1)
+        stnd_gdfs.append(grp)
+    return pd.concat(stnd_gdfs)
+
+
+def filter_records_by_group(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """De-duplicates government units one group at a time. Retained
+    as the reference for the vectorized
+    `MunicipalityWithinStateDataset._filter_records`.
+
+    Args:
+        gdf (`gpd.GeoDataFrame`): The municipalities.
+
+    Returns:
+        (`gpd.GeoDataFrame`): The de-duplicated municipalities.
+    """
+    grp_cols = [
+        "CENSUS_ID_GIDID",
+        "GEOID_PLACE",
+        "GEOID_SUBDIV",
+        "UNIT_TYPE",
+        "UNIT_NAME",
+        "NAME",
+        "NAMELSAD",
+    ]
+    grpd_df = gdf.groupby(by=grp_cols)
+    deduped_gdfs = []
+    for name in grpd_df.groups.keys():
+        df = grpd_df.get_group(name)
+        if len(df) > 1:
+            df = df.query("DATASET == 'places'")
+        deduped_gdfs.append(df)
+    return pd.concat(deduped_gdfs)
+
+
+def create_municipalities_dataset(
+    gdf: gpd.GeoDataFrame, logger: logging.Logger
+) -> MunicipalityWithinStateDataset:
+    """Creates a municipalities dataset holding the given data.
+
+    Args:
+        gdf (`gpd.GeoDataFrame`): The municipalities.
+
+        logger (`logging.Logger`): A standard logger instance.
+
+    Returns:
+        (`MunicipalityWithinStateDataset`): The dataset.
+    """
+    return MunicipalityWithinStateDataset(
+        name="municipalities - states",
+        as_of="2024-01-01",
+        geography_type="municipality",
+        epsg=4269,
+        published_on="2024-01-01",
+        source="Test",
+        logger=logger,
+        reader=DataLoader(),
+        writer=DataWriter(),
+        population_service=None,
+        data=gdf.copy(),
+    )
+
+
+def time_by_size(func: Callable[[int], None], sizes: List[int]) -> List[float]:
+    """Times a function for each input size, taking the
+    fastest of three runs to reduce the effect of noise.
+
+    Args:
+        func (`Callable`): The function, which accepts an input size.
+
+        sizes (`list` of `int`): The input sizes.
+
+    Returns:
+        (`list` of `float`): The time taken for each size, in seconds.
+    """
+    times = []
+    for size in sizes:
+        runs = []
+        for _ in range(3):
+            start = time.perf_counter()
+            func(size)
+            runs.append(time.perf_counter() - start)
+        times.append(min(runs))
+    return times
+
+
+class TestMunicipalityWithinStateDataset(unittest.TestCase):
+    """Tests the cleaning steps of the municipalities dataset."""
+
+    def setUp(self) -> None:
+        """Sets up the dataset before each test runs, enabling
+        Copy-on-Write as `GeoDataset.process` does for the test alone.
+        """
+        self.enterContext(pd.option_context("mode.copy_on_write", True))
+        self._gdf = build_municipalities(2_000)
+        self._logger = logging.getLogger("TEST MUNICIPALITIES")
+
+    def test_filter_records_matches_group_loop(self) -> None:
+        """Asserts that de-duplicating units with boolean masks
+        retains the same records, in the same order, as filtering
+        each group in turn.
+        """
+        # Arrange
+        dataset = create_municipalities_dataset(self._gdf, self._logger)
+
+        # Act
+        expected = filter_records_by_group(self._gdf)
+        actual = dataset._filter_records()
+
+        # Assert
+        assert len(actual) < len(self._gdf)
+        assert actual.equals(expected)
+
+    def test_build_name_matches_group_loop(self) -> None:
+        """Asserts that names standardized with column operations
+        match, in the same order, those standardized one group of
+        records at a time.
+        """
+        # Arrange
+        dataset = create_municipalities_dataset(self._gdf, self._logger)
+
+        # Act
+        expected = build_name_by_group(self._gdf)
+        actual = dataset._build_name()
+
+        # Assert
+        assert actual.equals(expected)
+
+    def test_build_fips_matches_dataset_type(self) -> None:
+        """Asserts that places take place FIPS codes while county
+        subdivisions take county subdivision FIPS codes.
+        """
+        # Arrange
+        dataset = create_municipalities_dataset(self._gdf, self._logger)
+        gdf = self._gdf.assign(GEOID_SUBDIV=self._gdf["GEOID_SUBDIV"] + "0")
+
+        # Act
+        dataset.data = gdf
+        actual = dataset._build_fips()
+
+        # Assert
+        for _, row in actual.iterrows():
+            if row["DATASET"] == "places":
+                assert row["fips"] == row["GEOID_PLACE"]
+                assert row["fips_pattern"] == Geography.FipsPattern.STATE_PLACE
+            else:
+                assert row["fips"] == row["GEOID_SUBDIV"]
+                assert (
+                    row["fips_pattern"]
+                    == Geography.FipsPattern.STATE_COUNTY_COUNTY_SUBDIVISION
+                )
+
+
+class TestBuildPopulationBenchmark(unittest.TestCase):
+    """Benchmarks the population step of each dataset."""
+
+    @unittest.skipUnless(os.getenv("RUN_BENCHMARKS"), "Benchmarks not requested.")
+    def test_benchmark_build_population(self) -> None:
+        """Logs the time taken by `_build_population` for each dataset
+        that joins populations on FIPS codes (and, for comparison, the
+        Justice40 dataset, which uses a spatial join) against a nationwide
+        set of block group centroids, first with an empty population
+        service and then again once its rollups and indices are built.
+        """
+        logger = LoggerFactory.get("BENCHMARK BUILD POPULATION")
+        centroids = build_fips_centroids(240_000)
+        tracts = build_tracts(centroids)
+        counties = tracts.dissolve(by=["STATEFP", "COUNTYFP"]).reset_index()
+        states = tracts.dissolve(by="STATEFP").reset_index()
+        service = PopulationService(
+            centroids, pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+        )
+        datasets = {
+            CountyDataset: counties,
+            StateDataset: states,
+            CoalDataset: tracts.rename(
+                columns={
+                    "STATEFP": "fipstate_2",
+                    "COUNTYFP": "fipcounty_",
+                    "TRACTCE": "fiptract_2",
+                }
+            ),
+            LowIncomeDataset: tracts,
+            Justice40Dataset: tracts.assign(
+                GEOID10=tracts["STATEFP"] + tracts["COUNTYFP"] + tracts["TRACTCE"]
+            ),
+        }
+
+        for run in ("cold", "warm"):
+            for dataset_cls, data in datasets.items():
+                dataset = dataset_cls(
+                    name=dataset_cls.__name__,
+                    as_of="2024-01-01",
+                    geography_type="",
+                    epsg=4269,
+                    published_on="2024-01-01",
+                    source="Test",
+                    logger=logger,
+                    reader=DataLoader(),
+                    writer=DataWriter(),
+                    population_service=service,
+                    data=data.copy(),
+                )
+                start = time.perf_counter()
+                dataset._build_population()
+                elapsed = time.perf_counter() - start
+                logger.info(
+                    f"{dataset_cls.__name__} ({run}): {len(data):,} "
+                    f"geographies in {elapsed:.3f} second(s)."
+                )
+
+
+class TestCorrectGeometryBenchmark(unittest.TestCase):
+    """Benchmarks the geometry correction of a tract-scale dataset."""
+
+    @unittest.skipUnless(os.getenv("RUN_BENCHMARKS"), "Benchmarks not requested.")
+    def test_benchmark_correct_geometry(self) -> None:
+        """Logs the time taken to correct geometries and prepare them for
+        the geoparquet output by promoting each Polygon with a Python
+        function and buffering the copy written to file, as done before
+        geometries were normalized once in bulk, and then by
+        `_correct_geometry` alone.
+        """
+        logger = LoggerFactory.get("BENCHMARK CORRECT GEOMETRY")
+        tracts = build_tracts(build_fips_centroids(240_000))
+        dataset = LowIncomeDataset(
+            name="low-income communities",
+            as_of="2024-01-01",
+            geography_type="",
+            epsg=4269,
+            published_on="2024-01-01",
+            source="Test",
+            logger=logger,
+            reader=DataLoader(),
+            writer=DataWriter(),
+            population_service=PopulationService(
+                pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+            ),
+        )
+
+        # Time promotion of each Polygon before and after buffering a copy
+        start = time.perf_counter()
+        trans = lambda b: MultiPolygon([b]) if isinstance(b, Polygon) else b
+        data = tracts.copy()
+        data["geometry"] = data["geometry"].apply(trans)
+        data = data.set_crs(epsg=4269).to_crs(epsg=4326)
+        copy = data.copy()
+        copy.geometry = shapely.buffer(copy.geometry.to_numpy(), settings.BUFFER_DEG)
+        copy.geometry = copy.geometry.apply(trans)
+        elapsed = time.perf_counter() - start
+        logger.info(f"Per-geometry: {len(tracts):,} tracts in {elapsed:.3f} s.")
+
+        # Time bulk normalization
+        dataset.data = tracts.copy()
+        start = time.perf_counter()
+        dataset._correct_geometry()
+        elapsed = time.perf_counter() - start
+        logger.info(f"Vectorized: {len(tracts):,} tracts in {elapsed:.3f} s.")
+
+
+class TestLoaderScaling(unittest.TestCase):
+    """Guards against loaders whose runtime grows super-linearly
+    with the number of input files or record groups they combine.
+    """
+
+    _SCALE = 4
+    """The factor by which the input size grows."""
+
+    _MAX_GROWTH = 8
+    """The greatest growth in runtime tolerated as the input grows by
+    `_SCALE`. Linear growth yields a ratio near 4, while quadratic
+    growth, such as from concatenating each part onto the accumulated
+    result, yields a ratio near 16.
+    """
+
+    def assert_linear(self, name: str, func: Callable[[int], None], size: int):
+        """Asserts that the runtime of a function grows
+        no faster than linearly with its input size.
+
+        Args:
+            name (`str`): A name for the function, used in logs.
+
+            func (`Callable`): The function, which accepts an input size.
+
+            size (`int`): The smaller input size.
+
+        Returns:
+            `None`
+        """
+        logger = LoggerFactory.get("BENCHMARK LOADER SCALING")
+        small, large = time_by_size(func, [size, size * self._SCALE])
+        logger.info(
+            f"{name}: {small:.3f} second(s) for {size:,} part(s), "
+            f"{large:.3f} second(s) for {size * self._SCALE:,} part(s)."
+        )
+        assert large / small < self._MAX_GROWTH
+
+    @unittest.skipUnless(os.getenv("RUN_BENCHMARKS"), "Benchmarks not requested.")
+    def test_read_shapefiles_scales_linearly(self) -> None:
+        """Asserts that reading and combining Shapefiles scales
+        linearly with the number of files matched.
+        """
+        with tempfile.TemporaryDirectory() as root_dir:
+            reader = DataLoader(root_dir)
+            tracts = build_tracts(build_fips_centroids(10_000)).iloc[:500]
+            for num_files in (50, 50 * self._SCALE):
+                os.makedirs(f"{root_dir}/{num_files}")
+                for i in range(num_files):
+                    tracts.to_file(f"{root_dir}/{num_files}/tracts_{i}.shp.zip")
+
+            self.assert_linear(
+                "DataLoader.read_shapefiles",
+                lambda num_files: reader.read_shapefiles(f"{num_files}/*.shp.zip"),
+                50,
+            )
+
+    def test_read_shapefiles_concatenates_once(self) -> None:
+        """Asserts that the Shapefiles matched are combined with a single
+        concatenation rather than one concatenation per file.
+        """
+        # Arrange
+        num_files = 5
+        with tempfile.TemporaryDirectory() as root_dir:
+            reader = DataLoader(root_dir, cache_dir=None)
+            tracts = build_tracts(build_fips_centroids(1_000)).iloc[:20]
+            for i in range(num_files):
+                tracts.to_file(f"{root_dir}/tracts_{i}.shp.zip")
+
+            # Act
+            with mock.patch("pandas.concat", wraps=pd.concat) as concat:
+                gdf = reader.read_shapefiles("*.shp.zip")
+
+        # Assert
+        concat.assert_called_once()
+        assert len(concat.call_args.args[0]) == num_files
+        assert len(gdf) == num_files * len(tracts)
+
+    def test_municipality_steps_concatenate_independently_of_size(self) -> None:
+        """Asserts that the number of concatenations performed by the
+        municipality name standardization and de-duplication steps does
+        not grow with the number of groups of records.
+        """
+        self.enterContext(pd.option_context("mode.copy_on_write", True))
+        logger = logging.getLogger("TEST LOADER SCALING")
+        for step in ("_filter_records", "_build_name"):
+            num_calls = []
+            for size in (50, 50 * self._SCALE):
+                dataset = create_municipalities_dataset(
+                    build_municipalities(size), logger
+                )
+                with mock.patch("pandas.concat", wraps=pd.concat) as concat:
+                    getattr(dataset, step)()
+                num_calls.append(concat.call_count)
+            assert num_calls[0] == num_calls[1], step
+
+    @unittest.skipUnless(os.getenv("RUN_BENCHMARKS"), "Benchmarks not requested.")
+    def test_municipality_steps_scale_linearly(self) -> None:
+        """Asserts that the municipality name standardization and
+        de-duplication steps scale linearly with the number of groups
+        of records.
+        """
+        self.enterContext(pd.option_context("mode.copy_on_write", True))
+        logger = LoggerFactory.get("BENCHMARK LOADER SCALING")
+        datasets = {
+            size: build_municipalities(size) for size in (500, 500 * self._SCALE)
+        }
+
+        def run(step: str) -> Callable[[int], None]:
+            def run_step(size: int) -> None:
+                dataset = create_municipalities_dataset(datasets[size], logger)
+                getattr(dataset, step)()
+
+            return run_step
+
+        for step in ("_filter_records", "_build_name"):
+            self.assert_linear(f"MunicipalityWithinStateDataset.{step}", run(step), 500)
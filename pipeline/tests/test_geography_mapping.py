@@ -0,0 +1,217 @@
+"""Unit tests and benchmarks for mapping cleaned geography
+datasets to the geography database table schema.
+"""
+
+# Standard library imports
+import multiprocessing
+import os
+import resource
+import struct
+import tempfile
+import unittest
+from typing import Any, Callable, Dict
+
+# Third-party imports
+import geopandas as gpd
+import numpy as np
+import shapely
+from django.conf import settings
+from django.contrib.gis.geos import GEOSGeometry, MultiPolygon
+
+# Application imports
+from common.db import encode_binary_copy
+from common.logger import LoggerFactory
+from common.storage import FileSystemHelperFactory, ParquetDataReader
+from tax_credit.models import Geography
+
+
+def build_clean_geographies(num_geos: int, seed: int = 12345) -> gpd.GeoDataFrame:
+    """Generates random square geographies with the
+    columns of a cleaned geography dataset.
+
+    Args:
+        num_geos (`int`): The number of geographies to generate.
+
+        seed (`int`): The random seed. Defaults to 12345.
+
+    Returns:
+        (`gpd.GeoDataFrame`): The geographies.
+    """
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(-125, -69, num_geos)
+    y = rng.uniform(25, 47, num_geos)
+    population = rng.integers(0, 10_000, num_geos).astype(float)
+    population[rng.random(num_geos) < 0.05] = np.nan
+    return gpd.GeoDataFrame(
+        data={
+            "name": [f"Census Tract {i}" for i in range(num_geos)],
+            "fips": [f"{i:011d}" for i in range(num_geos)],
+            "fips_pattern": Geography.FipsPattern.STATE_COUNTY_TRACT.value,
+            "geography_type": Geography.GeographyType.LOW_INCOME.value,
+            "population": population,
+            "population_strategy": Geography.PopulationCalculation.FIPS.value,
+            "as_of": "2024-01-01",
+            "published_on": None,
+            "source": "Test",
+        },
+        geometry=shapely.box(x, y, x + 0.1, y + 0.1),
+        crs="EPSG:4326",
+    )
+
+
+def map_row(data: Dict[str, Any]) -> Geography:
+    """Maps a row from a cleaned geography dataset
+    into a `Geography` database model object, as
+    geographies were loaded before `COPY` batches.
+
+    Args:
+        data (`dict`): The row.
+
+    Returns:
+        (`Geography`): The object.
+    """
+    geos_geom = GEOSGeometry(memoryview(data["geometry"]))
+    return Geography(
+        name=data["name"],
+        fips=data["fips"] or "",
+        fips_pattern=data["fips_pattern"] or "",
+        geography_type=data["geography_type"],
+        population=data["population"],
+        population_strategy=data["population_strategy"],
+        as_of=data["as_of"],
+        published_on=data["published_on"],
+        source=data["source"],
+        geometry=(
+            geos_geom
+            if geos_geom.geom_type == "MultiPolygon"
+            else MultiPolygon(geos_geom)
+        ),
+    )
+
+
+def map_rows(reader: ParquetDataReader, file_name: str) -> int:
+    """Maps each dataset row to a `Geography` model instance.
+    Retained as the reference for the batch-oriented mapping.
+
+    Args:
+        reader (`ParquetDataReader`): The data reader.
+
+        file_name (`str`): The relative path to the dataset.
+
+    Returns:
+        (`int`): The number of geographies mapped.
+    """
+    return sum(1 for row in reader.iterate(file_name) if map_row(row))
+
+
+def map_batches(reader: ParquetDataReader, file_name: str) -> int:
+    """Maps each dataset record batch to an encoded binary `COPY` stream.
+
+    Args:
+        reader (`ParquetDataReader`): The data reader.
+
+        file_name (`str`): The relative path to the dataset.
+
+    Returns:
+        (`int`): The number of bytes encoded.
+    """
+    return sum(
+        len(encode_binary_copy(Geography.to_copy_batch(batch)))
+        for batch in reader.iter_batches(file_name, settings.COPY_CHUNK_SIZE)
+    )
+
+
+def measure_peak_rss(func: Callable, *args) -> int:
+    """Runs a function within a forked child process and
+    reports the peak resident set size (RSS) of the child.
+
+    Args:
+        func (`Callable`): The function.
+
+        *args: The positional arguments to pass to the function.
+
+    Returns:
+        (`int`): The peak RSS, in kilobytes.
+    """
+    with multiprocessing.get_context("fork").Pool(1) as pool:
+        return pool.apply(_run_and_report_peak_rss, (func, *args))
+
+
+def _run_and_report_peak_rss(func: Callable, *args) -> int:
+    """Runs a function and then reports the peak
+    resident set size (RSS) of the current process.
+
+    Args:
+        func (`Callable`): The function.
+
+        *args: The positional arguments to pass to the function.
+
+    Returns:
+        (`int`): The peak RSS, in kilobytes.
+    """
+    func(*args)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class TestGeographyCopyMapping(unittest.TestCase):
+    """Tests the batch-oriented mapping of geographies for binary `COPY`."""
+
+    _TEST_FILE_NAME = "test_geographies.geoparquet"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Sets up the class before tests run."""
+        cls._ROOT_DIR = cls.enterClassContext(tempfile.TemporaryDirectory())
+        cls._READER = ParquetDataReader(cls._ROOT_DIR)
+        cls._GDF = build_clean_geographies(1_000)
+        with FileSystemHelperFactory.get().open_file(
+            cls._TEST_FILE_NAME, cls._ROOT_DIR, mode="wb"
+        ) as f:
+            cls._GDF.to_parquet(f, index=False)
+
+    def test_copy_batch_matches_row_encoding(self) -> None:
+        """Asserts that the columns encoded for a whole batch at once
+        match the binary representation of each row's values.
+        """
+        # Arrange
+        batch = next(self._READER.iter_batches(self._TEST_FILE_NAME, 100))
+        rows = batch.to_pylist()
+
+        # Act
+        columns = Geography.to_copy_batch(batch)
+
+        # Assert
+        encoded = dict(zip([c[0] for c in Geography.COPY_COLUMNS], columns))
+        for idx, row in enumerate(rows):
+            population = encoded["population"][idx].as_py()
+            if row["population"] is None or np.isnan(row["population"]):
+                assert population is None
+            else:
+                assert population == struct.pack("!q", int(row["population"]))
+            assert encoded["name"][idx].as_py() == row["name"].encode()
+            assert encoded["published_on"][idx].as_py() is None
+            geom = shapely.from_wkb(encoded["geometry"][idx].as_py())
+            assert shapely.get_srid(geom) == 4326
+            assert geom.equals(shapely.from_wkb(row["geometry"]))
+
+    @unittest.skipUnless(os.getenv("RUN_BENCHMARKS"), "Benchmarks not requested.")
+    def test_benchmark_peak_memory(self) -> None:
+        """Logs the peak resident set size (RSS) of mapping a tract-sized
+        dataset row by row into model instances and batch by batch into
+        binary `COPY` streams.
+        """
+        logger = LoggerFactory.get("BENCHMARK GEOGRAPHY MAPPING")
+        file_name = "test_tracts.geoparquet"
+        with FileSystemHelperFactory.get().open_file(
+            file_name, self._ROOT_DIR, mode="wb"
+        ) as f:
+            build_clean_geographies(85_000).to_parquet(f, index=False)
+
+        baseline_kb = measure_peak_rss(len, [])
+        rows_kb = measure_peak_rss(map_rows, self._READER, file_name)
+        batches_kb = measure_peak_rss(map_batches, self._READER, file_name)
+
+        logger.info(
+            f"Peak RSS for 85,000 geographies: baseline {baseline_kb:,} KB, "
+            f"row mapping {rows_kb:,} KB, batch mapping {batches_kb:,} KB."
+        )
@@ -0,0 +1,164 @@
+"""Unit tests for line-delimited GeoJSON serialization.
+"""
+
+# Standard library imports
+import json
+import os
+import unittest
+from datetime import datetime, UTC
+
+# Third-party imports
+import geopandas as gpd
+import numpy as np
+import shapely
+
+# Application imports
+from common.geojson import iter_geojson_lines, simplify_for_zoom, tile_resolution
+from common.logger import LoggerFactory
+
+
+def build_features(num_rows: int) -> gpd.GeoDataFrame:
+    """Builds a GeoDataFrame of square polygons with text, integer
+    and float properties, some of which are missing, and one
+    empty geometry.
+
+    Args:
+        num_rows (`int`): The number of rows.
+
+    Returns:
+        (`gpd.GeoDataFrame`): The features.
+    """
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-120, -70, num_rows)
+    y = rng.uniform(25, 48, num_rows)
+    geoms = shapely.box(x, y, x + 0.01, y + 0.01)
+    geoms[0] = shapely.Polygon()
+    population = rng.integers(0, 10_000, num_rows).astype(float)
+    population[1::7] = np.nan
+    return gpd.GeoDataFrame(
+        {
+            "name": [f"GEOGRAPHY Ñ{i}" for i in range(num_rows)],
+            "fips": [None if i % 5 == 0 else f"{i:05d}" for i in range(num_rows)],
+            "population": population,
+            "rank": np.arange(num_rows),
+        },
+        geometry=geoms,
+        crs="EPSG:4326",
+    )
+
+
+def write_by_feature(data: gpd.GeoDataFrame) -> str:
+    """Serializes features one at a time, as `DataWriter.write_geojsonl`
+    did before features were serialized in bulk.
+
+    Args:
+        data (`gpd.GeoDataFrame`): The data.
+
+    Returns:
+        (`str`): The line-delimited GeoJSON.
+    """
+    return "\n".join(json.dumps(row) for row in data.iterfeatures(drop_id=True))
+
+
+class TestIterGeojsonLines(unittest.TestCase):
+    """Tests serializing GeoDataFrames as line-delimited GeoJSON."""
+
+    def test_exact_matches_feature_by_feature_output(self) -> None:
+        """Asserts that exact serialization is byte-for-byte identical
+        to serializing each feature with `json.dumps`, across chunks.
+        """
+        # Arrange
+        data = build_features(25)
+
+        # Act
+        actual = "\n".join(iter_geojson_lines(data, exact=True, chunk_size=10))
+
+        # Assert
+        assert actual == write_by_feature(data)
+
+    def test_compact_decodes_to_same_features(self) -> None:
+        """Asserts that compact serialization decodes to
+        the same features as exact serialization.
+        """
+        # Arrange
+        data = build_features(25)
+
+        # Act
+        compact = "\n".join(iter_geojson_lines(data, chunk_size=10)).split("\n")
+        exact = write_by_feature(data).split("\n")
+
+        # Assert
+        assert len(compact) == len(exact)
+        assert [json.loads(c) for c in compact] == [json.loads(e) for e in exact]
+
+    def test_precision_and_index(self) -> None:
+        """Asserts that coordinates are rounded to the requested number
+        of decimal places and that the index is written as feature ids.
+        """
+        # Arrange
+        data = gpd.GeoDataFrame(
+            {"name": ["a"]},
+            geometry=[shapely.Point(-87.123456789, 41.987654321)],
+            index=[7],
+        )
+
+        # Act
+        (line,) = iter_geojson_lines(data, index=True, precision=4)
+        feature = json.loads(line)
+
+        # Assert
+        assert feature["id"] == "7"
+        assert feature["geometry"]["coordinates"] == [-87.1235, 41.9877]
+
+
+class TestSimplifyForZoom(unittest.TestCase):
+    """Tests simplifying geometries for vector tiles."""
+
+    def test_tile_resolution(self) -> None:
+        """Asserts that the decimal places kept resolve
+        coordinates to within one tile unit.
+        """
+        for max_zoom in (5, 10, 16):
+            resolution, decimals = tile_resolution(max_zoom)
+            assert 10.0**-decimals <= resolution < 10.0 ** -(decimals - 1)
+
+    def test_shared_boundaries_remain_shared(self) -> None:
+        """Asserts that simplifying two polygons sharing a detailed
+        boundary removes vertices without opening gaps or overlaps
+        between them, and that missing geometries are kept.
+        """
+        # Arrange
+        x = np.linspace(0, 1, 1001)
+        edge = list(zip(x, 0.5 + 0.01 * np.sin(x * 50)))
+        below = shapely.Polygon([(0, 0), (1, 0), *edge[::-1]])
+        above = shapely.Polygon([*edge, (1, 1), (0, 1)])
+        geoms = np.array([below, None, above], dtype=object)
+
+        # Act
+        simplified, decimals = simplify_for_zoom(geoms, 5)
+
+        # Assert
+        assert decimals == 3
+        assert simplified[1] is None
+        assert shapely.get_num_coordinates(simplified).sum() < len(edge)
+        assert shapely.coverage_is_valid(simplified[[0, 2]])
+        assert shapely.intersection(simplified[0], simplified[2]).area == 0
+
+
+class TestGeojsonLinesBenchmark(unittest.TestCase):
+    """Benchmarks line-delimited GeoJSON serialization."""
+
+    @unittest.skipUnless(os.getenv("RUN_BENCHMARKS"), "Benchmarks not requested.")
+    def test_benchmark_iter_geojson_lines(self) -> None:
+        """Logs the time taken to serialize a tract-sized dataset
+        feature by feature and then in bulk.
+        """
+        logger = LoggerFactory.get("BENCHMARK GEOJSONL")
+        data = build_features(85_000)
+        for label, serialize in (
+            ("Feature by feature", write_by_feature),
+            ("Bulk", lambda df: "\n".join(iter_geojson_lines(df))),
+        ):
+            start = datetime.now(UTC)
+            serialize(data)
+            logger.info(f"{label}: {datetime.now(UTC) - start}.")
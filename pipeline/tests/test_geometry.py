@@ -0,0 +1,71 @@
+"""Unit tests for geometry normalization.
+"""
+
+# Standard library imports
+import unittest
+
+# Third-party imports
+import numpy as np
+import shapely
+from shapely.geometry import MultiPolygon, Polygon
+
+# Application imports
+from common.geometry import normalize_polygons
+
+
+class TestNormalizePolygons(unittest.TestCase):
+    """Tests normalizing arrays of polygonal geometries."""
+
+    def test_promotes_polygons_like_apply(self) -> None:
+        """Asserts that valid geometries are promoted to MultiPolygons
+        exactly as by applying a transformation to each geometry.
+        """
+        # Arrange
+        geoms = np.array(
+            [
+                shapely.box(0, 0, 1, 1),
+                shapely.multipolygons([shapely.box(2, 2, 3, 3)]),
+                None,
+            ],
+            dtype=object,
+        )
+        trans = lambda b: MultiPolygon([b]) if isinstance(b, Polygon) else b
+        expected = [trans(g) for g in geoms]
+
+        # Act
+        actual = normalize_polygons(geoms)
+
+        # Assert
+        assert actual[2] is None
+        assert all(a.equals_exact(e, 0) for a, e in zip(actual[:2], expected[:2]))
+        assert geoms[0].geom_type == "Polygon"
+
+    def test_repairs_invalid_geometries(self) -> None:
+        """Asserts that self-intersecting polygons are repaired
+        without losing any of their area.
+        """
+        # Arrange
+        bowtie = shapely.from_wkt("POLYGON ((0 0, 1 1, 1 0, 0 1, 0 0))")
+
+        # Act
+        (actual,) = normalize_polygons(np.array([bowtie], dtype=object), -10e-20)
+
+        # Assert
+        assert actual.is_valid
+        assert actual.geom_type == "MultiPolygon"
+        assert np.isclose(actual.area, 0.5)
+
+    def test_buffer_does_not_remove_area(self) -> None:
+        """Asserts that buffering by a negligible distance
+        never removes a geometry or part of its area.
+        """
+        # Arrange
+        geoms = np.array(
+            [shapely.box(x, 41, x + 0.1, 41.1) for x in (-87, 0, 2)], dtype=object
+        )
+
+        # Act
+        actual = normalize_polygons(geoms, -10e-20)
+
+        # Assert
+        assert np.allclose(shapely.area(actual), shapely.area(geoms))
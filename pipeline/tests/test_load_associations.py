@@ -1,13 +1,21 @@
 """Integration tests for loading the target-bonus geography association table.
 """
 
+# Standard library imports
+import json
+import time
+from unittest import mock
+
 # Third-party imports
 import pytest
 from django.core.management import call_command
+from django.db import connection
 
 # Application imports
 from common.logger import LoggerFactory
-from tax_credit.models import TargetBonusGeographyOverlap
+from tax_credit.associations import AssociationsService
+from tax_credit.management.commands import load_associations
+from tax_credit.models import Geography, TargetBonusGeographyOverlap
 
 
 @pytest.fixture(scope="function")
@@ -95,3 +103,123 @@ def test_load_associations_with_spatial_intersection():
     # Assert
     assert spatial_only_assoc_ct > 0
     assert state_county_assoc_ct > 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_associations_with_local_engine_matches_postgis():
+    """Asserts that spatial intersections computed in-process from the
+    cleaned geoparquet files yield the same associations as those
+    computed by PostGIS, and logs the run time of each engine.
+    """
+    # Arrange
+    logger = LoggerFactory.get("TEST LOAD ASSOCIATIONS - INTERSECTION ENGINES")
+    target, bonus = ["municipality", "rural cooperative"], ["distressed", "justice40"]
+    fields = ("target_id", "bonus_id", "population", "population_strategy")
+
+    # Act
+    start = time.perf_counter()
+    call_command("load_associations", target=target, bonus=bonus, engine="postgis")
+    postgis_secs = time.perf_counter() - start
+    postgis_assocs = set(TargetBonusGeographyOverlap.objects.values_list(*fields))
+    TargetBonusGeographyOverlap.objects.all().delete()
+
+    start = time.perf_counter()
+    call_command("load_associations", target=target, bonus=bonus, engine="local")
+    local_secs = time.perf_counter() - start
+    local_assocs = set(TargetBonusGeographyOverlap.objects.values_list(*fields))
+
+    logger.info(
+        f"{len(postgis_assocs):,} association(s) loaded using PostGIS "
+        f"in {postgis_secs:.2f}s and {len(local_assocs):,} association(s) "
+        f"loaded using the local engine in {local_secs:.2f}s."
+    )
+
+    # Assert
+    assert len(postgis_assocs) > 0
+    assert local_assocs == postgis_assocs
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_associations_with_workers_matches_sequential():
+    """Asserts that loading combinations of target and bonus geography
+    types across worker processes yields the same associations as
+    loading them sequentially.
+    """
+    # Arrange
+    logger = LoggerFactory.get("TEST LOAD ASSOCIATIONS - WORKERS")
+    target, bonus = ["state", "county", "municipality"], ["distressed", "energy"]
+    fields = ("target_id", "bonus_id", "population", "population_strategy")
+
+    # Act
+    call_command("load_associations", target=target, bonus=bonus, workers=1)
+    sequential_assocs = set(TargetBonusGeographyOverlap.objects.values_list(*fields))
+    TargetBonusGeographyOverlap.objects.all().delete()
+
+    call_command("load_associations", target=target, bonus=bonus, workers=3)
+    parallel_assocs = set(TargetBonusGeographyOverlap.objects.values_list(*fields))
+    logger.info(f"{len(parallel_assocs):,} association(s) loaded using three workers.")
+
+    # Assert
+    assert len(sequential_assocs) > 0
+    assert parallel_assocs == sequential_assocs
+
+
+@pytest.mark.django_db(transaction=True)
+def test_fips_match_queries_use_fips_index():
+    """Runs `EXPLAIN ANALYZE` on the state and county FIPS match
+    queries, logs their plans and execution times, and asserts that
+    the composite index over the generated FIPS columns is used.
+    Sequential scans are disabled so that the assertion holds even
+    for the small tables produced by a smoke test load.
+    """
+    # Arrange
+    logger = LoggerFactory.get("TEST LOAD ASSOCIATIONS - FIPS INDEX")
+    assoc_service = AssociationsService(population_service=None)
+    queries = []
+
+    def capture_query(execute, sql, params, many, context):
+        queries.append((sql, params))
+        return execute(sql, params, many, context)
+
+    # Act
+    with connection.execute_wrapper(capture_query):
+        assoc_service.find_within_states(Geography.GeographyType.LOW_INCOME)
+        assoc_service.find_within_counties(Geography.GeographyType.LOW_INCOME)
+
+    plans = []
+    with connection.cursor() as cursor:
+        cursor.execute("SET enable_seqscan = off;")
+        for sql, params in queries:
+            cursor.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+            plans.append(plan if isinstance(plan, str) else json.dumps(plan))
+        cursor.execute("RESET enable_seqscan;")
+
+    for name, plan in zip(("State", "County"), plans):
+        exec_ms = json.loads(plan)[0]["Execution Time"]
+        logger.info(f"{name} FIPS match executed in {exec_ms:.3f} ms. Plan: {plan}")
+
+    # Assert
+    assert len(plans) == 2
+    assert all("geography_type_fips_idx" in plan for plan in plans)
+
+
+def test_worker_returns_unexpected_errors_with_log_records():
+    """Asserts that an unexpected exception raised while loading a
+    combination in a worker process is returned as an error message
+    together with the log records buffered before the failure.
+    """
+    # Arrange
+    assoc_service = mock.Mock(spec=AssociationsService)
+    assoc_service.find_bonus_matches.side_effect = ValueError("Bad geometry.")
+
+    # Act
+    with mock.patch.object(load_associations, "_worker_assoc_service", assoc_service):
+        records, elapsed, error = load_associations._load_combination_in_worker(
+            "state", "distressed", "TEST LOAD ASSOCIATIONS - WORKER ERROR"
+        )
+
+    # Assert
+    assert elapsed is None
+    assert "ValueError: Bad geometry." in error
+    assert any("Searching for bonus" in record.getMessage() for record in records)
@@ -0,0 +1,468 @@
+"""Unit tests and benchmarks for the population service.
+"""
+
+# Standard library imports
+import functools
+import logging
+import math
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+# Third-party imports
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+
+# Application imports
+from common.logger import LoggerFactory
+from common.storage import DataLoader, DataWriter
+from tax_credit.population import CentroidOverlapEngine, PopulationService
+
+
+def build_census_block_points(num_blocks: int, seed: int = 12345) -> gpd.GeoDataFrame:
+    """Generates random census block internal points with housing
+    unit counts, grouped into block groups of roughly 25 blocks each.
+    Around one in ten blocks has no housing units, and some block
+    groups are left entirely without housing.
+
+    Args:
+        num_blocks (`int`): The number of blocks to generate.
+
+        seed (`int`): The random seed. Defaults to 12345.
+
+    Returns:
+        (`gpd.GeoDataFrame`): The blocks.
+    """
+    rng = np.random.default_rng(seed)
+    grp_nums = np.sort(rng.integers(0, max(num_blocks // 25, 1), num_blocks))
+    grp_ids = pd.Series(grp_nums).map(lambda n: f"{n:012d}")
+    housing_units = rng.integers(0, 50, num_blocks)
+    housing_units[rng.random(num_blocks) < 0.1] = 0
+    housing_units[grp_nums % 97 == 0] = 0
+    return gpd.GeoDataFrame(
+        data={
+            "GEOID_BLKGRP": grp_ids,
+            "STATEFP": grp_ids.str[:2],
+            "COUNTYFP": grp_ids.str[2:5],
+            "TRACTCE": grp_ids.str[5:11],
+            "BLKGRPCE": grp_ids.str[11:],
+            "HOUSING_UNITS": housing_units,
+        },
+        geometry=gpd.points_from_xy(
+            x=rng.uniform(-170, 145, num_blocks),
+            y=rng.uniform(-15, 20, num_blocks),
+        ),
+        crs="EPSG:4269",
+    )
+
+
+def compute_centers_by_group_loop(blk_pts_gdf: gpd.GeoDataFrame) -> pd.DataFrame:
+    """Computes block group mean centers one group at a time. Retained
+    as the reference implementation for the vectorized computation.
+
+    Args:
+        blk_pts_gdf (`gpd.GeoDataFrame`): The census block points.
+
+    Returns:
+        (`pd.DataFrame`): The block group centers.
+    """
+    grouped = blk_pts_gdf.groupby(by="GEOID_BLKGRP")
+    centers = []
+    for grp_key in grouped.groups:
+        populated_gdf = grouped.get_group(grp_key).query("HOUSING_UNITS > 0")
+        if not len(populated_gdf):
+            continue
+        blk_unit_counts = populated_gdf["HOUSING_UNITS"]
+        total_units = populated_gdf["HOUSING_UNITS"].sum()
+        longitudes = populated_gdf["geometry"].x
+        latitudes = populated_gdf["geometry"].y
+        proj_latitudes = latitudes.apply(math.cos)
+        centers.append(
+            {
+                "GEOID_BLKGRP": grp_key,
+                "STATEFP": populated_gdf["STATEFP"].iloc[0],
+                "COUNTYFP": populated_gdf["COUNTYFP"].iloc[0],
+                "TRACTCE": populated_gdf["TRACTCE"].iloc[0],
+                "BLKGRPCE": populated_gdf["BLKGRPCE"].iloc[0],
+                "LATITUDE": sum(blk_unit_counts * latitudes) / total_units,
+                "LONGITUDE": sum(blk_unit_counts * longitudes * proj_latitudes)
+                / sum(blk_unit_counts * proj_latitudes),
+            }
+        )
+    return pd.DataFrame(centers)
+
+
+class TestBlockGroupCenters(unittest.TestCase):
+    """Tests the computation of block group mean centers of housing."""
+
+    def test_vectorized_centers_match_group_loop(self) -> None:
+        """Asserts that the vectorized computation produces the
+        same center points as the group-by-group reference.
+        """
+        # Arrange
+        blk_pts_gdf = build_census_block_points(10_000)
+
+        # Act
+        expected = compute_centers_by_group_loop(blk_pts_gdf)
+        actual = PopulationService._compute_weighted_mean_centers(
+            blk_pts_gdf, weight_col="HOUSING_UNITS"
+        )
+
+        # Assert
+        id_cols = ["GEOID_BLKGRP", "STATEFP", "COUNTYFP", "TRACTCE", "BLKGRPCE"]
+        assert actual[id_cols].equals(expected[id_cols])
+        for col in ("LATITUDE", "LONGITUDE"):
+            np.testing.assert_allclose(actual[col], expected[col], rtol=1e-9)
+
+    @unittest.skipUnless(os.getenv("RUN_BENCHMARKS"), "Benchmarks not requested.")
+    def test_benchmark_centers(self) -> None:
+        """Logs the time taken by the group-by-group and vectorized
+        computations at increasing numbers of census blocks.
+        """
+        logger = LoggerFactory.get("BENCHMARK BLOCK GROUP CENTERS")
+        for num_blocks in (10_000, 100_000, 1_000_000):
+            blk_pts_gdf = build_census_block_points(num_blocks)
+
+            start = time.perf_counter()
+            compute_centers_by_group_loop(blk_pts_gdf)
+            loop_secs = time.perf_counter() - start
+
+            start = time.perf_counter()
+            PopulationService._compute_weighted_mean_centers(
+                blk_pts_gdf, weight_col="HOUSING_UNITS"
+            )
+            vectorized_secs = time.perf_counter() - start
+
+            logger.info(
+                f"{num_blocks:,} blocks: group loop {loop_secs:.3f}s, "
+                f"vectorized {vectorized_secs:.3f}s "
+                f"({loop_secs / vectorized_secs:,.1f}x speedup)."
+            )
+
+
+def build_population_centroids(
+    num_centroids: int, seed: int = 12345
+) -> gpd.GeoDataFrame:
+    """Generates random population-weighted centroids within the
+    contiguous United States.
+
+    Args:
+        num_centroids (`int`): The number of centroids to generate.
+
+        seed (`int`): The random seed. Defaults to 12345.
+
+    Returns:
+        (`gpd.GeoDataFrame`): The centroids.
+    """
+    rng = np.random.default_rng(seed)
+    return gpd.GeoDataFrame(
+        data={"POPULATION": rng.integers(0, 3_000, num_centroids)},
+        geometry=gpd.points_from_xy(
+            x=rng.uniform(-125, -67, num_centroids),
+            y=rng.uniform(25, 49, num_centroids),
+        ),
+        crs="EPSG:4269",
+    )
+
+
+def build_geographies(num_geos: int, seed: int = 54321) -> gpd.GeoDataFrame:
+    """Generates random, possibly overlapping, square geographies
+    within the contiguous United States.
+
+    Args:
+        num_geos (`int`): The number of geographies to generate.
+
+        seed (`int`): The random seed. Defaults to 54321.
+
+    Returns:
+        (`gpd.GeoDataFrame`): The geographies.
+    """
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(-125, -69, num_geos)
+    y = rng.uniform(25, 47, num_geos)
+    size = rng.uniform(0.1, 2, num_geos)
+    return gpd.GeoDataFrame(
+        data={"id": [f"geo-{i}" for i in range(num_geos)]},
+        geometry=shapely.box(x, y, x + size, y + size),
+        crs="EPSG:4326",
+    )
+
+
+class TestCentroidsSpatialJoin(unittest.TestCase):
+    """Tests population estimates from centroid spatial joins."""
+
+    def setUp(self) -> None:
+        """Sets up the population service before each test runs."""
+        self._centroids = build_population_centroids(50_000)
+        self._service = PopulationService(
+            self._centroids, pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+        )
+
+    def test_sjoin_matches_geopandas_sjoin(self) -> None:
+        """Asserts that populations computed against the prebuilt
+        spatial index match those from a GeoPandas spatial join.
+        """
+        # Arrange
+        gdf = build_geographies(500)
+
+        # Act
+        expected = (
+            gdf.sjoin(self._centroids.to_crs(gdf.crs), how="left", predicate="contains")
+            .groupby(by="id")["POPULATION"]
+            .sum()
+            .astype(int)
+        )
+        actual = self._service.centroids_sjoin(gdf, id_col="id")
+
+        # Assert
+        assert actual.set_index("id")["population"].equals(expected.loc[gdf["id"]])
+
+    def test_index_reused_until_centroids_change(self) -> None:
+        """Asserts that the centroid index is built once per CRS
+        and rebuilt after the centroids are replaced.
+        """
+        # Arrange
+        gdf = build_geographies(10)
+
+        # Act
+        self._service.centroids_sjoin(gdf, id_col="id")
+        first_index = self._service._get_centroid_index(gdf.crs)
+        self._service.centroids_sjoin(gdf, id_col="id")
+        second_index = self._service._get_centroid_index(gdf.crs)
+        self._service.pop_centroids = self._centroids.copy()
+        third_index = self._service._get_centroid_index(gdf.crs)
+
+        # Assert
+        assert first_index is second_index
+        assert third_index is not first_index
+
+
+class TestCentroidsFipsJoin(unittest.TestCase):
+    """Tests population estimates from FIPS code joins."""
+
+    def setUp(self) -> None:
+        """Sets up the population service before each test runs."""
+        rng = np.random.default_rng(12345)
+        self._centroids = build_population_centroids(20_000)
+        self._centroids["STATEFP"] = rng.integers(1, 57, 20_000).astype(str)
+        self._centroids["COUNTYFP"] = rng.integers(1, 20, 20_000).astype(str)
+        self._centroids["TRACTCE"] = rng.integers(1, 10, 20_000).astype(str)
+        self._service = PopulationService(
+            self._centroids, pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+        )
+
+    def test_fips_join_matches_groupby(self) -> None:
+        """Asserts that populations looked up from the precomputed
+        rollups match those aggregated directly from the centroids,
+        and that each rollup is computed only once.
+        """
+        # Arrange
+        df = self._centroids[["STATEFP", "COUNTYFP"]].drop_duplicates().head(100)
+        df.columns = ["state", "county"]
+
+        # Act
+        first = self._service.centroids_fips_join(df, "state", "county")
+        rollup = self._service._get_fips_rollup(("STATEFP", "COUNTYFP"))
+        second = self._service.centroids_fips_join(df, "state", "county")
+        expected = self._centroids.groupby(["STATEFP", "COUNTYFP"])["POPULATION"].sum()
+
+        # Assert
+        assert rollup is self._service._get_fips_rollup(("STATEFP", "COUNTYFP"))
+        assert first.equals(second)
+        assert first["population"].tolist() == [
+            expected.loc[(state, county)]
+            for state, county in zip(df["state"], df["county"])
+        ]
+
+    def test_rollups_persisted_next_to_centroids(self) -> None:
+        """Asserts that a rollup is persisted once next to the keyed
+        centroids file and then loaded by other service instances
+        with the same result as computing it in memory.
+        """
+        # Arrange
+        logger = logging.getLogger("TEST POPULATION ROLLUP CACHE")
+        pop_cols = ("STATEFP", "COUNTYFP")
+        expected = self._service._get_fips_rollup(pop_cols)
+        with tempfile.TemporaryDirectory() as root_dir:
+            reader, writer = DataLoader(root_dir), DataWriter(root_dir)
+            load_rollup = functools.partial(
+                PopulationService._load_cached_rollup,
+                reader,
+                writer,
+                lambda: "centroids/centers_abc.geoparquet",
+                logger,
+            )
+            services = [
+                PopulationService(
+                    self._centroids,
+                    pd.DataFrame(),
+                    pd.DataFrame(),
+                    pd.DataFrame(),
+                    logger,
+                    load_rollup,
+                )
+                for _ in range(2)
+            ]
+
+            # Act
+            first = services[0]._get_fips_rollup(pop_cols)
+            cached_files = reader.list_directory_contents("centroids/*")
+            with mock.patch.object(pd.DataFrame, "groupby") as groupby:
+                second = services[1]._get_fips_rollup(pop_cols)
+
+        # Assert
+        assert cached_files == ["centroids/centers_abc_statefp_countyfp.feather"]
+        groupby.assert_not_called()
+        assert first.equals(expected)
+        assert second.equals(expected)
+
+
+class TestCentroidOverlapEngine(unittest.TestCase):
+    """Tests overlap population estimates from centroid membership matrices."""
+
+    def test_overlaps_match_intersection_sjoin(self) -> None:
+        """Asserts that overlap populations derived from membership
+        matrices match spatial joins against the intersection polygons.
+        """
+        # Arrange
+        service = PopulationService(
+            build_population_centroids(50_000),
+            pd.DataFrame(),
+            pd.DataFrame(),
+            pd.DataFrame(),
+        )
+        targets = build_geographies(200, seed=1)
+        bonuses = build_geographies(300, seed=2)
+        engine = CentroidOverlapEngine(service)
+
+        # Act
+        engine.add_membership("target", targets, id_col="id")
+        engine.add_membership("bonus", bonuses, id_col="id")
+        actual = engine.overlap_populations("target", "bonus")
+        pairs = targets.sjoin(bonuses, predicate="intersects")
+        overlaps = gpd.GeoDataFrame(
+            data={
+                "target_id": pairs["id_left"].to_numpy(),
+                "bonus_id": pairs["id_right"].to_numpy(),
+            },
+            geometry=shapely.intersection(
+                pairs.geometry.to_numpy(),
+                bonuses.geometry.to_numpy()[pairs["index_right"].to_numpy()],
+            ),
+            crs=targets.crs,
+        )
+        overlaps["id"] = overlaps["target_id"] + ", " + overlaps["bonus_id"]
+        expected = service.centroids_sjoin(overlaps, id_col="id")
+
+        # Assert
+        expected = expected.query("population > 0")
+        merged = expected.merge(actual, how="outer", on=["target_id", "bonus_id"])
+        assert len(merged) == len(expected) == len(actual)
+        assert (merged["population_x"] == merged["population_y"]).all()
+
+
+class TestLazyTableLoading(unittest.TestCase):
+    """Tests that population tables are loaded only upon first access."""
+
+    def test_tables_loaded_once_on_first_access(self) -> None:
+        """Asserts that each table loader is invoked only when its
+        table is first accessed, and that its load time is recorded.
+        """
+        # Arrange
+        calls = []
+        centroids = build_population_centroids(1_000)
+
+        def load_centroids() -> gpd.GeoDataFrame:
+            calls.append(PopulationService.POP_CENTROIDS)
+            return centroids
+
+        def load_zcta_pops() -> pd.DataFrame:
+            calls.append(PopulationService.ZCTA_POPULATIONS)
+            return pd.DataFrame()
+
+        service = PopulationService(
+            load_centroids, load_zcta_pops, pd.DataFrame(), pd.DataFrame()
+        )
+
+        # Act
+        calls_before_access = list(calls)
+        service.centroids_sjoin(build_geographies(10), id_col="id")
+        service.centroids_sjoin(build_geographies(10), id_col="id")
+
+        # Assert
+        assert calls_before_access == []
+        assert calls == [PopulationService.POP_CENTROIDS]
+        assert list(service.load_times) == [PopulationService.POP_CENTROIDS]
+        assert service.pop_centroids is centroids
+
+
+class TestPopulationTableCache(unittest.TestCase):
+    """Tests the checksum-keyed cache of population reference tables."""
+
+    def test_cache_reused_until_source_changes(self) -> None:
+        """Asserts that a population table is parsed from its source file
+        into the requested column types only when no cache exists for the
+        file's current contents.
+        """
+        # Arrange
+        logger = logging.getLogger("TEST POPULATION TABLE CACHE")
+        columns = {"ZCTA5CE20": "str", "TOTAL_POPULATION": "Int64"}
+        with tempfile.TemporaryDirectory() as root_dir:
+            reader, writer = DataLoader(root_dir), DataWriter(root_dir)
+            fpath = "zcta_population.csv"
+            with open(f"{root_dir}/{fpath}", "w") as f:
+                f.write("ZCTA5CE20|NAME|TOTAL_POPULATION\n00601|A|17126\n")
+
+            # Act
+            first_df = PopulationService._load_cached_table(
+                reader, writer, fpath, columns, logger
+            )
+            num_caches_after_first = len(reader.list_directory_contents("cache/**/*"))
+            second_df = PopulationService._load_cached_table(
+                reader, writer, fpath, columns, logger
+            )
+            with open(f"{root_dir}/{fpath}", "a") as f:
+                f.write("00602|B|37895\n")
+            third_df = PopulationService._load_cached_table(
+                reader, writer, fpath, columns, logger
+            )
+            num_caches_after_third = len(reader.list_directory_contents("cache/**/*"))
+
+        # Assert
+        assert list(first_df.columns) == list(columns)
+        assert first_df["ZCTA5CE20"].tolist() == ["00601"]
+        assert first_df["TOTAL_POPULATION"].dtype == "Int64"
+        assert first_df.equals(second_df)
+        assert num_caches_after_first == 1
+        assert len(third_df) == 2
+        assert num_caches_after_third == 2
+
+    def test_input_checksum_changes_with_matched_files(self) -> None:
+        """Asserts that the checksum of the files matching a glob
+        pattern changes when a matching file is added or modified.
+        """
+        # Arrange
+        pattern = "blocks/tl_2020_*.zip"
+        with tempfile.TemporaryDirectory() as root_dir:
+            reader = DataLoader(root_dir)
+            os.makedirs(f"{root_dir}/blocks")
+            with open(f"{root_dir}/blocks/tl_2020_60.zip", "w") as f:
+                f.write("a")
+
+            # Act
+            first = PopulationService._checksum_inputs(reader, [pattern])
+            second = PopulationService._checksum_inputs(reader, [pattern])
+            with open(f"{root_dir}/blocks/tl_2020_66.zip", "w") as f:
+                f.write("b")
+            third = PopulationService._checksum_inputs(reader, [pattern])
+            with open(f"{root_dir}/blocks/tl_2020_60.zip", "w") as f:
+                f.write("c")
+            fourth = PopulationService._checksum_inputs(reader, [pattern])
+
+        # Assert
+        assert first == second
+        assert len({first, third, fourth}) == 3
@@ -2,6 +2,8 @@
 """
 
 # Standard library imports
+import io
+import os
 import shutil
 import tempfile
 import unittest
@@ -63,6 +65,32 @@ class FileSystemHelperTestMixins:
         with self._CLIENT.open_file(file_name, root_dir, mode="r") as f:
             assert isinstance(f.read(), str)
 
+    def test_read_file_range(self) -> None:
+        """Asserts that seeking within a file opened for binary reads
+        returns the same bytes as reading the entire file.
+        """
+        # Arrange
+        root_dir = self._ROOT_DIR
+        file_name = f"{self._POPULATED_DIR}/{self._TEST_JSON_FILE_NAME}"
+        with self._CLIENT.open_file(file_name, root_dir, mode="rb") as f:
+            expected = f.read()[-8:]
+
+        # Act
+        with self._CLIENT.open_file(file_name, root_dir, mode="rb") as f:
+            f.seek(-8, io.SEEK_END)
+            actual = f.read()
+
+        # Assert
+        assert actual == expected
+
+    def test_read_missing_file(self) -> None:
+        """Asserts that reading a file that does not exist
+        raises a `FileNotFoundError`.
+        """
+        with self.assertRaises(FileNotFoundError):
+            with self._CLIENT.open_file("missing.txt", self._ROOT_DIR, mode="r"):
+                pass
+
     def test_read_zipped_file(self) -> None:
         """Asserts that no exceptions are raised when directly reading zipped files."""
         root_dir = self._ROOT_DIR
@@ -113,6 +141,23 @@ class FileSystemHelperTestMixins:
         )
         assert len(contents) == 1
 
+    def test_checksum(self) -> None:
+        """Asserts that a file's checksum is an MD5 hex digest that
+        differs from the checksum of a file with other contents.
+        """
+        # Arrange
+        root_dir = self._ROOT_DIR
+        txt_file = f"{self._POPULATED_DIR}/{self._TEST_TXT_FILE_NAME}"
+        json_file = f"{self._POPULATED_DIR}/{self._TEST_JSON_FILE_NAME}"
+
+        # Act
+        txt_checksum = self._CLIENT.checksum(txt_file, root_dir)
+        json_checksum = self._CLIENT.checksum(json_file, root_dir)
+
+        # Assert
+        assert len(txt_checksum) == 32
+        assert txt_checksum != json_checksum
+
 
 class TestLocalFileSystemHelper(unittest.TestCase, FileSystemHelperTestMixins):
     """Tests I/O operations using a `LocalFileSystemHelper` instance."""
@@ -160,6 +205,27 @@ class TestLocalFileSystemHelper(unittest.TestCase, FileSystemHelperTestMixins):
         """Destroys resources after all tests run."""
         shutil.rmtree(TestLocalFileSystemHelper._ROOT_DIR)
 
+    def test_failed_write_keeps_existing_file(self) -> None:
+        """Asserts that a write interrupted by an exception neither
+        replaces the existing file nor leaves a partial file behind.
+        """
+        # Arrange
+        root_dir = self._ROOT_DIR
+        file_name = "atomic/test_atomic.txt"
+        with self._CLIENT.open_file(file_name, root_dir, mode="w") as f:
+            f.write("original")
+
+        # Act
+        with self.assertRaises(RuntimeError):
+            with self._CLIENT.open_file(file_name, root_dir, mode="w") as f:
+                f.write("partial")
+                raise RuntimeError
+
+        # Assert
+        with self._CLIENT.open_file(file_name, root_dir, mode="r") as f:
+            assert f.read() == "original"
+        assert os.listdir(Path(root_dir) / "atomic") == ["test_atomic.txt"]
+
 
 class TestGoogleCloudStorageHelper(unittest.TestCase, FileSystemHelperTestMixins):
     """Tests I/O operations using a `GoogleCloudStorageHelper` instance.
@@ -172,7 +238,9 @@ class TestGoogleCloudStorageHelper(unittest.TestCase, FileSystemHelperTestMixins
     emulator and Docker images and packages available from third-parties
     don't implement the latest version of the Cloud Storage API
     (particularly the functionality for filtering lists of blobs according
-    to a glob pattern).
+    to a glob pattern). The tests of file reads and writes alone can
+    be run against such a local fake server by setting the environment
+    variable `STORAGE_EMULATOR_HOST`.
     """
 
     _CLIENT = GoogleCloudStorageHelper()
@@ -265,6 +333,42 @@ class TestParquetDataReader(unittest.TestCase, IterativeDataReaderTestMixins):
         # Initialize data reader client
         cls._CLIENT = ParquetDataReader(root_dir)
 
+    def test_iter_batches(self):
+        """Asserts that the loaded file can be iterated in record
+        batches restricted to a subset of columns.
+        """
+        batches = list(
+            self._CLIENT.iter_batches(self._TEST_FILE_NAME, batch_size=1, columns=["0"])
+        )
+        assert len(batches) == self._TEST_FILE_NUM_ROWS
+        assert all(batch.schema.names == ["0"] for batch in batches)
+
+    def test_iter_batches_with_filters(self):
+        """Asserts that filtering record batches yields only
+        the matching rows of the columns requested.
+        """
+        batches = list(
+            self._CLIENT.iter_batches(
+                self._TEST_FILE_NAME, columns=["1"], filters=[("0", "<", 0)]
+            )
+        )
+        rows = list(
+            self._CLIENT.iterate(
+                self._TEST_FILE_NAME, columns=["1"], filters=[("0", "=", 0)]
+            )
+        )
+        assert sum(len(batch) for batch in batches) == 0
+        assert rows == [{"1": 1}] * self._TEST_FILE_NUM_ROWS
+
+    def test_num_rows(self):
+        """Asserts that the number of rows is read from the file metadata."""
+        assert self._CLIENT.num_rows(self._TEST_FILE_NAME) == self._TEST_FILE_NUM_ROWS
+
+    def test_take_rows(self):
+        """Asserts that only the rows at the given positions are read."""
+        batches = list(self._CLIENT.take_rows(self._TEST_FILE_NAME, [1]))
+        assert sum(len(batch) for batch in batches) == 1
+
 
 class TestDataLoader(unittest.TestCase):
     """Tests loading entire data files with a `DataLoader` instance."""
@@ -331,6 +435,7 @@ class TestDataLoader(unittest.TestCase):
         # Set class variables
         cls._CLIENT = DataLoader(root_dir)
         cls._FILES = files
+        cls._ROOT_DIR = root_dir
 
     def test_read_csv(self) -> None:
         """Asserts that reading a CSV file into a Pandas
@@ -387,6 +492,83 @@ class TestDataLoader(unittest.TestCase):
         gdf = self._CLIENT.read_shapefile(self._FILES["shp-zipped"])
         assert len(gdf) == 1
 
+    def test_read_shapefiles(self) -> None:
+        """Asserts that reading Shapefiles matching a glob pattern
+        concatenates their records in file order after applying
+        the attribute filter and column selection to each.
+        """
+        # Arrange
+        helper = FileSystemHelperFactory.get()
+        root_dir = Path(settings.DATA_DIR) / "test"
+        for part in ("01", "02"):
+            gdf = gpd.GeoDataFrame(
+                data={"name": [f"a{part}", f"b{part}"], "state": part},
+                geometry=gpd.points_from_xy(x=[30, 31], y=[60, 61]),
+            )
+            with tempfile.TemporaryDirectory() as temp_dir:
+                tmp_fpath = f"{temp_dir}/part.shp.zip"
+                gdf.to_file(tmp_fpath, driver="ESRI Shapefile")
+                with open(tmp_fpath, "rb") as tmp:
+                    with helper.open_file(
+                        f"parts/part_{part}.shp.zip", root_dir, mode="wb"
+                    ) as f:
+                        f.write(tmp.read())
+
+        # Act
+        gdf = self._CLIENT.read_shapefiles(
+            "parts/part_*.shp.zip", where="name LIKE 'b%'", columns=["name"]
+        )
+
+        # Assert
+        assert gdf["name"].tolist() == ["b01", "b02"]
+        assert list(gdf.columns) == ["name", "geometry"]
+
+    def test_read_shapefile_with_filter_values(self) -> None:
+        """Asserts that reading a Shapefile with permitted column
+        values decodes only the features holding those values.
+        """
+        # Arrange
+        file_name = self._FILES["shp-zipped"]
+
+        # Act
+        matched = self._CLIENT.read_shapefile(
+            file_name, filter_values={"name": ["city", "town"]}
+        )
+        unmatched = self._CLIENT.read_shapefile(
+            file_name, filter_values={"name": ["town"]}
+        )
+
+        # Assert
+        assert matched["name"].tolist() == ["city"]
+        assert len(unmatched) == 0
+
+    def test_read_shapefile_through_cache(self) -> None:
+        """Asserts that a Shapefile read for a second time, with or
+        without a column selection, is served from the raw input cache
+        with the same result as reading directly from the source file.
+        """
+        # Arrange
+        file_name = self._FILES["shp-zipped"]
+        cache_dir = "cache/raw"
+        root_dir = self.enterContext(tempfile.TemporaryDirectory())
+        shutil.copy(Path(self._ROOT_DIR) / file_name, root_dir)
+        uncached_client = DataLoader(root_dir, cache_dir=None)
+        cached_client = DataLoader(root_dir, cache_dir=cache_dir)
+        helper = FileSystemHelperFactory.get()
+
+        # Act
+        expected = uncached_client.read_shapefile(file_name)
+        expected_cols = uncached_client.read_shapefile(file_name, columns=["name"])
+        for _ in range(2):
+            actual = cached_client.read_shapefile(file_name)
+            actual_cols = cached_client.read_shapefile(file_name, columns=["name"])
+        cached_files = helper.list_contents(root_dir, f"{cache_dir}/*.parquet")
+
+        # Assert
+        assert actual.equals(expected)
+        assert actual_cols.equals(expected_cols)
+        assert len(cached_files) == 2
+
 
 class TestDataWriter(unittest.TestCase):
     """Tests writing files to data stores using a `DataWriter` instance."""